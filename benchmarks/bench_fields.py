@@ -0,0 +1,66 @@
+"""Measure how many fields are parsed per second, as on import and load.
+
+Usage: python -m benchmarks.bench_fields [values]
+
+Each field is compared with the strptime and regex parsing it used before.
+"""
+import random
+import re
+import sys
+import time
+from datetime import datetime
+
+from src.constants import DATE_FORMAT
+from src.models.birthday import Birthday
+from src.models.email import Email
+from src.models.phone import Phone
+
+
+def strptime_birthday(value: str) -> str:
+    """Parse and render a birthday the way it was done before."""
+    return datetime.strptime(value, DATE_FORMAT).strftime(DATE_FORMAT)
+
+
+def regex_phone(value: str) -> str:
+    """Validate and normalize a phone with the former substitution and filter passes."""
+    value = value.strip()
+    cleaned = re.sub(r"[()\s.-]", "", value)
+    if cleaned.startswith("+"):
+        cleaned = cleaned[1:]
+    if not cleaned.isdigit() or not 10 <= len(cleaned) <= 15:
+        raise ValueError("Invalid phone number format")
+    return "".join(ch for ch in value if ch.isdigit())
+
+
+def rate(parse, values) -> float:
+    """Values parsed per second."""
+    start = time.perf_counter()
+    for value in values:
+        parse(value)
+    return len(values) / (time.perf_counter() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(42)
+    birthdays = [f"{rng.randint(1, 28):02d}.{rng.randint(1, 12):02d}.{rng.randint(1950, 2010)}" for _ in range(count)]
+    digits = [f"0{rng.randrange(10**9):09d}" for _ in range(count)]
+    formatted = [f"+38 ({d[:3]}) {d[3:6]}-{d[6:8]}-{d[8:]}" for d in digits]
+    emails = [f"contact{i}@example.com" for i in range(count)]
+
+    rows = [
+        ("birthday", strptime_birthday, lambda value: str(Birthday(value)), birthdays),
+        ("phone, digits", regex_phone, Phone, digits),
+        ("phone, formatted", regex_phone, Phone, formatted),
+        ("email", None, Email, emails),
+    ]
+
+    print(f"{count} values, thousands parsed per second")
+    print(f"{'field':<18} {'before':>10} {'now':>10}")
+    for name, before, now, values in rows:
+        before_rate = f"{rate(before, values) / 1000:>10.0f}" if before else f"{'-':>10}"
+        print(f"{name:<18} {before_rate} {rate(now, values) / 1000:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
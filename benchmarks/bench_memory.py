@@ -0,0 +1,40 @@
+"""Measure how much memory contacts take in an address book.
+
+Usage: python -m benchmarks.bench_memory [contacts]
+
+Memory is the growth of the resident set size, read from /proc on Linux.
+"""
+import gc
+import os
+import sys
+import time
+
+from benchmarks.bench_serialization import build_book
+
+
+def resident_bytes() -> int:
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    gc.collect()
+    before = resident_bytes()
+    start = time.perf_counter()
+    book = build_book(count)
+    build_time = time.perf_counter() - start
+    gc.collect()
+    size = resident_bytes() - before
+
+    record = next(iter(book.data.values()))
+    print(f"{count} contacts built in {build_time:.1f}s")
+    print(f"{'resident, MB':<22} {size / 1024 / 1024:>10.1f}")
+    print(f"{'bytes per contact':<22} {size / count:>10.0f}")
+    print(f"{'tracked objects':<22} {len(gc.get_objects()):>10}")
+    print(f"{'Record has __dict__':<22} {str(hasattr(record, '__dict__')):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Measure contact search against a plain scan of the book.
+
+Usage: python -m benchmarks.bench_search [contacts]
+"""
+import random
+import re
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from src.constants import DATE_FORMAT
+from src.models import AddressBook, Record
+from src.models.name_index import edit_distance
+
+SYLLABLES = ["ka", "li", "mo", "ra", "ten", "vu", "si", "na", "dor", "el", "mi", "ko", "zan", "pe", "lu", "ta"]
+
+
+def random_name(rng: random.Random) -> str:
+    def word():
+        return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize()
+
+    return f"{word()} {word()}"
+
+
+def build_book(count: int) -> AddressBook:
+    """Build a book of `count` contacts with random names, phones, birthdays and a note."""
+    rng = random.Random(42)
+    words = sorted({random_name(rng).split()[0].lower() for _ in range(3000)})
+    book = AddressBook()
+    while len(book) < count:
+        record = Record(random_name(rng))
+        record.add_phone(f"0{rng.randrange(10**9):09d}")
+        record.add_birthday(f"{rng.randint(1, 28):02d}.{rng.randint(1, 12):02d}.{rng.randint(1950, 2010)}")
+        record.add_note(" ".join(rng.choice(words) for _ in range(8)))
+        book.add_record(record)
+    return book
+
+
+def scan_names(book: AddressBook, keyword: str) -> list:
+    return [book.data[name] for name in book.data if re.search(keyword.lower(), name.lower())]
+
+
+def scan_fuzzy(book: AddressBook, keyword: str, max_distance: int = 2) -> list:
+    return [
+        name
+        for name in book.data
+        if any(edit_distance(keyword, word, max_distance) <= max_distance for word in name.lower().split())
+    ]
+
+
+def scan_phones(book: AddressBook, keyword: str) -> list:
+    return [record for record in book.data.values() for phone in record.phones if re.search(keyword, phone.value)]
+
+
+def scan_birthdays(book: AddressBook, days: int) -> list:
+    """The per-record strptime scan used before the birthday index."""
+    today = date.today()
+    matches = []
+    for record in book.data.values():
+        birthday = datetime.strptime(repr(record.birthday), DATE_FORMAT).date()
+        this_year = date(today.year, birthday.month, birthday.day)
+        if timedelta(0) <= this_year - today <= timedelta(days=days):
+            matches.append(record)
+    return matches
+
+
+def scan_notes(book: AddressBook, keyword: str) -> list:
+    return [
+        (record.name.value, note_id)
+        for record in book.data.values()
+        for note_id, note in record.notes.items()
+        if keyword.lower() in note.value.lower()
+    ]
+
+
+def timed(func, *args) -> tuple[float, int]:
+    start = time.perf_counter()
+    result = func(*args)
+    return (time.perf_counter() - start) * 1000, len(result)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    book = build_book(count)
+    keywords = ["zandor", "Kalimo Tenvu", "elmi", "kozanpe"]
+
+    start = time.perf_counter()
+    book.name_index
+    print(f"{count} contacts, name index built in {time.perf_counter() - start:.2f}s")
+
+    print(f"{'keyword':<14} {'matches':>8} {'scan, ms':>10} {'index, ms':>10}")
+    for keyword in keywords:
+        scan_ms, matches = timed(scan_names, book, keyword)
+        index_ms, _ = timed(book.search, keyword)
+        print(f"{keyword:<14} {matches:>8} {scan_ms:>10.1f} {index_ms:>10.2f}")
+
+    print(f"{'fuzzy':<14} {'matches':>8} {'scan, ms':>10} {'index, ms':>10}")
+    for keyword in ("zandorr", "kalmio"):
+        scan_ms, _ = timed(scan_fuzzy, book, keyword)
+        index_ms, matches = timed(book.search, keyword, True)
+        print(f"{keyword:<14} {matches:>8} {scan_ms:>10.1f} {index_ms:>10.2f}")
+
+    start = time.perf_counter()
+    phone_index = book.phone_index
+    print(f"\nphone index built in {time.perf_counter() - start:.2f}s")
+
+    phone = next(iter(book.data.values())).phones[0].value
+    lookups = [
+        ("exact", phone_index.exact, phone),
+        ("prefix", phone_index.prefix, phone[:6]),
+        ("suffix", phone_index.suffix, phone[-4:]),
+        ("substring", phone_index.substring, phone[3:8]),
+    ]
+    print(f"{'lookup':<14} {'matches':>8} {'scan, ms':>10} {'index, ms':>10}")
+    for label, lookup, keyword in lookups:
+        scan_ms, _ = timed(scan_phones, book, keyword)
+        index_ms, matches = timed(lookup, keyword)
+        print(f"{label:<14} {matches:>8} {scan_ms:>10.1f} {index_ms:>10.2f}")
+
+    start = time.perf_counter()
+    book.birthday_index
+    print(f"\nbirthday index built in {time.perf_counter() - start:.2f}s")
+
+    print(f"{'window, days':<14} {'matches':>8} {'scan, ms':>10} {'index, ms':>10}")
+    for days in (0, 7, 30):
+        scan_ms, _ = timed(scan_birthdays, book, days)
+        index_ms, matches = timed(book.get_upcoming_birthdays, days)
+        print(f"{days:<14} {matches:>8} {scan_ms:>10.1f} {index_ms:>10.2f}")
+
+    start = time.perf_counter()
+    book.note_index
+    print(f"\nnote index built in {time.perf_counter() - start:.2f}s")
+
+    note = next(iter(book.data.values())).notes[1].value.split()
+    queries = [note[0], f"{note[0]} {note[1]}", f"{note[0]} OR {note[1]}"]
+    print(f"{'query':<30} {'matches':>8} {'scan, ms':>10} {'index, ms':>10}")
+    for query in queries:
+        scan_ms, _ = timed(scan_notes, book, query.split()[0])
+        index_ms, matches = timed(book.search_notes, query)
+        print(f"{query:<30} {matches:>8} {scan_ms:>10.1f} {index_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
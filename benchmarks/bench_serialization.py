@@ -0,0 +1,59 @@
+"""Compare pickle with the binary address book format.
+
+Usage: python -m benchmarks.bench_serialization [contacts]
+"""
+import pickle
+import random
+import sys
+import time
+
+from src.models import AddressBook, Record
+
+TAGS = ["work", "home", "urgent", "family", "friends", "later"]
+
+
+def build_book(count: int) -> AddressBook:
+    """Build a book of `count` contacts with phones, emails, birthdays and notes."""
+    rng = random.Random(42)
+    book = AddressBook()
+    for i in range(count):
+        record = Record(f"Contact {i}")
+        for _ in range(rng.randint(1, 3)):
+            record.add_phone(f"0{rng.randrange(10**9):09d}")
+        record.add_email(f"contact{i}@example.com")
+        record.add_birthday(f"{rng.randint(1, 28):02d}.{rng.randint(1, 12):02d}.{rng.randint(1950, 2010)}")
+        for n in range(rng.randint(0, 3)):
+            record.add_note(f"Note {n} about contact {i}")
+            record.add_tags_to_note(n + 1, rng.sample(TAGS, 2))
+        book.add_record(record)
+    return book
+
+
+def measure(dump, load, book) -> tuple[int, float, float]:
+    start = time.perf_counter()
+    data = dump(book)
+    save_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    load(data)
+    load_time = time.perf_counter() - start
+    return len(data), save_time, load_time
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    book = build_book(count)
+
+    results = {
+        "pickle": measure(pickle.dumps, pickle.loads, book),
+        "binary": measure(AddressBook.to_bytes, AddressBook.from_bytes, book),
+    }
+
+    print(f"{count} contacts")
+    print(f"{'format':<8} {'size, MB':>10} {'save, s':>10} {'load, s':>10}")
+    for name, (size, save_time, load_time) in results.items():
+        print(f"{name:<8} {size / 1024 / 1024:>10.2f} {save_time:>10.3f} {load_time:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,50 @@
 from colorama import Fore, Style, init
 
-import pickle
+import atexit
+import os
 from cmd import Cmd
 
+from src.constants import DUPLICATE_PHONE_ENV, DEFAULT_DUPLICATE_PHONE_POLICY, MAX_BIRTHDAY_DAYS
 from src.models import AddressBook, Record
+from src.models.phone import normalize_phone
+from src.models.query import is_query
 from src.decorators import input_error
-from src.services import absolute_path_provider
-from src.utils.logger import success, info, error, simple_text
+from src.services.exporter import export_file
+from src.services.importer import import_file
+from src.storage import create_storage
+from src.utils.logger import success, info, error, warning, simple_text
+from src.utils.pager import Page, parse_page_args
 
-CACHE_PATH = absolute_path_provider.get_absolute_path()
+storage = create_storage()
+atexit.register(storage.close)
 
 init(autoreset=True)
 
 
+def check_phone_owners(phone: str, name: str, book: AddressBook) -> str | None:
+    """Apply the duplicate phone policy to a number about to be given to `name`.
+
+    Returns a warning to show, or raises ValueError when duplicates are rejected.
+    Invalid numbers are left to the edit itself. A warning is skipped when it
+    would read every record of a lazily loaded book.
+    """
+    policy = os.environ.get(DUPLICATE_PHONE_ENV, DEFAULT_DUPLICATE_PHONE_POLICY)
+    if policy not in ("allow", "warn", "reject"):
+        raise ValueError(f"Unknown duplicate phone policy '{policy}'")
+    if policy == "allow" or normalize_phone(phone) is None:
+        return None
+    if policy == "warn" and not book.phone_lookup_is_cheap:
+        return None
+
+    owners = [record.name.value for record in book.find_by_phone(phone) if record.name.value != name]
+    if not owners:
+        return None
+    message = f"Phone {phone} already belongs to {', '.join(owners)}"
+    if policy == "reject":
+        raise ValueError(message)
+    return warning(message)
+
+
 @input_error
 def add_contact(args, book: AddressBook):
     """Add a new contact or update existing contact with phone/email."""
@@ -24,6 +56,10 @@ def add_contact(args, book: AddressBook):
     email = args[2] if len(args) > 2 else None
 
     record = book.find(name)
+    duplicate_warning = None
+    if record is None or record.find_phone(phone) is None:
+        duplicate_warning = check_phone_owners(phone, name, book)
+
     message = success(f"Contact for {name} is updated.")
     if record is None:
         record = Record(name)
@@ -36,6 +72,8 @@ def add_contact(args, book: AddressBook):
     if email:
         record.add_email(email)
 
+    if duplicate_warning:
+        message += f"\n{duplicate_warning}"
     return message
 
 
@@ -59,24 +97,30 @@ def change_contact(args, book: AddressBook) -> str:
     new_email = args[3] if len(args) > 3 else None
 
     record = book.find(name)
+    duplicate_warning = None
+    if record is not None and record.find_phone(old_phone) is not None:
+        duplicate_warning = check_phone_owners(new_phone, name, book)
 
     record.edit_phone(old_phone, new_phone)
 
     if new_email is not None:
         record.edit_email(new_email)
 
-    return success("Contact updated.")
+    message = success("Contact updated.")
+    if duplicate_warning:
+        message += f"\n{duplicate_warning}"
+    return message
 
 
 @input_error
-def find_contact(args, book: AddressBook) -> str:
-    """Find contacts by name, phone, or birthday."""
-    keyword, *_ = args
+def who_owns(args, book: AddressBook) -> str:
+    """Find contacts that have a phone number."""
+    phone = args[0]
 
-    records = book.search(keyword)
+    records = book.find_by_phone(phone)
 
     if len(records) == 0:
-        return error(f"Nothing was found by keyword '{keyword}'")
+        return error(f"Nobody has phone number '{phone}'")
 
     all_contacts_str = ""
     for record in records:
@@ -84,16 +128,61 @@ def find_contact(args, book: AddressBook) -> str:
     return simple_text(all_contacts_str)
 
 
+def render_record(record: Record) -> str:
+    return simple_text(f"\n{record}")
+
+
+@input_error
+def find_contact(args, book: AddressBook) -> str | Page:
+    """Find contacts by name, phone, or birthday, or by a `field:value` query."""
+    args, limit, offset = parse_page_args(args)
+    keyword, *_ = args
+
+    text = " ".join(args)
+    if is_query(text):
+        records = book.query(text)
+        if len(records) == 0:
+            return error(f"Nothing was found by query '{text}'")
+        return Page(records, offset, limit, render_record, total=len(records))
+
+    records = book.search(keyword)
+
+    if len(records) == 0:
+        message = error(f"Nothing was found by keyword '{keyword}'")
+        suggestions = book.search(keyword, fuzzy=True)
+        if suggestions:
+            names = ", ".join(record.name.value for record in suggestions)
+            message += "\n" + info(f"Did you mean: {names}?")
+        return message
+
+    return Page(records, offset, limit, render_record, total=len(records))
+
+
 @input_error
-def find_all_contacts(book: AddressBook) -> str:
-    """Display all contacts in the address book."""
+def explain_query(args, book: AddressBook) -> str:
+    """Run a `field:value` query and show the plan the search used."""
+    if not args:
+        raise IndexError("Query is missing")
+    records, steps = book.explain(" ".join(args))
+
+    lines = [f"{'#':<3} {'filter':<24} {'method':<6} {'estimate':>9} {'rows':>9} {'ms':>9}"]
+    for number, step in enumerate(steps, 1):
+        lines.append(
+            f"{number:<3} {step.filter:<24} {step.method:<6} {step.estimate:>9} {step.rows:>9} {step.ms:>9.2f}"
+        )
+    lines.append(f"{len(records)} contact(s) found")
+    return simple_text("\n".join(lines))
+
+
+@input_error
+def find_all_contacts(args, book: AddressBook) -> str | Page:
+    """Display all contacts in the address book, a page at a time."""
+    _, limit, offset = parse_page_args(args)
     if len(book) == 0:
         return info("Contacts book is empty")
 
-    all_contacts_str = ""
-    for name, record in book.items():
-        all_contacts_str += f"{record}\n"
-    return simple_text(all_contacts_str)
+    # Page through names, records are only read for the page shown
+    return Page(book.data, offset, limit, lambda name: render_record(book.data[name]), total=len(book))
 
 
 @input_error
@@ -114,10 +203,15 @@ def show_birthday(args, book: AddressBook) -> str:
 
 
 @input_error
-def get_upcoming_birthdays(book: AddressBook) -> str:
-    """Display birthdays for the next 7 days."""
-    upcoming_birthdays = book.get_upcoming_birthdays()
-    to_congratulate = "Next 7 days birthdays:"
+def get_upcoming_birthdays(args, book: AddressBook) -> str:
+    """Display birthdays for the next N days, 7 by default."""
+    days = args[0] if args else "7"
+    if not (days.isdigit() and days.isascii()) or int(days) > MAX_BIRTHDAY_DAYS:
+        raise ValueError(f"Number of days must be an integer from 0 to {MAX_BIRTHDAY_DAYS}")
+    days = int(days)
+
+    upcoming_birthdays = book.get_upcoming_birthdays(days)
+    to_congratulate = f"Next {days} days birthdays:"
     for b_day in upcoming_birthdays:
         to_congratulate += f"\n{b_day['name']} {b_day['congratulation_date']}"
 
@@ -153,22 +247,19 @@ def remove_note(args, book: AddressBook) -> str:
 
 
 @input_error
-def search_notes(args, book: AddressBook) -> str:
-    """Search notes by keyword across all contacts."""
-    keyword, *_ = args
+def search_notes(args, book: AddressBook) -> str | Page:
+    """Search notes across all contacts, best matches first."""
+    args, limit, offset = parse_page_args(args)
+    if not args:
+        raise IndexError("Query is empty")
+    keyword = " ".join(args)
     records = book.get_records_by_note_keyword(keyword)
 
     if not records:
         return error(f"No notes found containing '{keyword}'.")
 
-    result_lines = []
-    for record in records:
-        result_lines.append(f"\n{record}\n")
-
-    result_text = "".join(result_lines)
-    return simple_text(
-        f"Found {len(records)} record(s) with notes containing '{keyword}':\n{result_text}"
-    )
+    header = simple_text(f"Found {len(records)} record(s) with notes containing '{keyword}':")
+    return Page(records, offset, limit, render_record, header, len(records))
 
 
 @input_error
@@ -200,29 +291,166 @@ def get_notes_by_tag(args, book: AddressBook) -> str:
     return simple_text(notes_str)
 
 
+@input_error
+def notes_by_tag(args, book: AddressBook) -> str:
+    """Find notes with a tag across all contacts."""
+    tag = args[0]
+    note_ids = {}
+    for name, note_id in book.notes_by_tag(tag):
+        note_ids.setdefault(name, []).append(note_id)
+
+    if not note_ids:
+        return error(f"No notes found with tag '{tag}'")
+
+    result_lines = []
+    for name, ids in note_ids.items():
+        result_lines.append(f"{book.find(name).view(ids)}\n")
+    return simple_text("".join(result_lines))
+
+
+@input_error
+def show_tags(book: AddressBook) -> str:
+    """Display all tags with the number of notes using them."""
+    counts = book.tag_counts()
+    if not counts:
+        return info("No tags yet")
+
+    tags_str = "Tags:"
+    for tag, count in counts:
+        tags_str += f"\n{tag} ({count})"
+    return simple_text(tags_str)
+
+
+@input_error
+def show_cache_stats(book: AddressBook) -> str:
+    """Display hit and miss counts of the search result cache."""
+    stats = book.cache_info()
+    lookups = stats.hits + stats.misses
+    hit_rate = stats.hits / lookups * 100 if lookups else 0.0
+    return info(
+        f"Search cache: {stats.hits} hits, {stats.misses} misses ({hit_rate:.0f}% hits), "
+        f"{stats.size} of {stats.maxsize} results kept"
+    )
+
+
+@input_error
+def import_contacts(args, book: AddressBook) -> str:
+    """Import contacts from a CSV, JSONL or vCard file."""
+    path, *rest = args
+    path = os.path.expanduser(path)
+    file_format = rest[0] if rest else None
+    try:
+        report = import_file(book, path, file_format)
+    except OSError as e:
+        raise ValueError(f"Can't read '{path}': {e.strerror}")
+
+    lines = [
+        success(
+            f"Imported {report.rows} row(s): {report.added} added, {report.updated} updated, "
+            f"{len(report.errors)} failed in {report.seconds:.2f}s "
+            f"({report.rows_per_second:.0f} rows/s)."
+        )
+    ]
+    for line_num, message in report.errors[:10]:
+        lines.append(error(f"Line {line_num}: {message}"))
+    if len(report.errors) > 10:
+        lines.append(info(f"... and {len(report.errors) - 10} more error(s)"))
+    return "\n".join(lines)
+
+
+@input_error
+def export_contacts(args, book: AddressBook) -> str:
+    """Export all contacts to a CSV, JSONL or vCard file."""
+    path, *rest = args
+    path = os.path.expanduser(path)
+    file_format = rest[0] if rest else None
+    try:
+        report = export_file(book, path, file_format)
+    except OSError as e:
+        raise ValueError(f"Can't write '{path}': {e.strerror}")
+    return success(f"Exported {report.records} contact(s) to {report.path} in {report.seconds:.2f}s.")
+
+
 def init_address_book() -> AddressBook:
     """Load or create address book from cache."""
-    try:
-        with open(CACHE_PATH, "rb") as f:
-            return pickle.load(f)
-    except (FileNotFoundError, pickle.UnpicklingError):
-        return AddressBook()
+    book = storage.load()
+    book.mark_clean()
+    return book
 
 
 def save_data(book):
-    """Save address book to cache file."""
-    with open(CACHE_PATH, "wb") as f:
-        pickle.dump(book, f)
+    """Save address book to cache file if it changed since the last save."""
+    if not book.is_dirty:
+        return
+    storage.save(book)
+    book.mark_clean()
+
+
+@input_error
+def compact_storage(book: AddressBook) -> str:
+    """Fold incremental saves into a new full snapshot."""
+    save_data(book)
+    try:
+        compacted = storage.compact(book)
+    except OSError as e:
+        raise ValueError(f"Can't compact storage: {e.strerror}")
+    if not compacted:
+        return info("Current storage mode always saves the whole book, nothing to compact.")
+    return success("Storage compacted.")
 
 
 class BotAssistant(Cmd):
     prompt = ">>> "
     address_book = init_address_book()
+    next_page = None
+
+    def onecmd(self, line):
+        # Keep background writers from serializing the book mid-command
+        with storage.lock:
+            return super().onecmd(line)
+
+    def precmd(self, line):
+        updated, conflicts = storage.refresh(self.address_book)
+        if updated:
+            print(info(f"Loaded changes to {len(updated)} contact(s) from another session."))
+        for name in sorted(conflicts):
+            print(warning(f"Contact {name} was also changed in another session, keeping your version."))
+        return line
 
     def postcmd(self, stop, line):
         save_data(self.address_book)
+        save_error = storage.take_error()
+        if save_error is not None:
+            print(error(f"Couldn't save the address book, will try again: {save_error}"))
         return stop
 
+    def print_listing(self, command: str, arg: str, handler):
+        """Print a paged listing as it renders and remember how to get its next page."""
+        output = handler(arg.split(), self.address_book)
+        self.next_page = None
+        if not isinstance(output, Page):
+            print(output)
+            return
+
+        for chunk in output:
+            print(chunk, flush=True)
+
+        if output.next_offset is not None:
+            args, limit, _ = parse_page_args(arg.split())
+            self.next_page = " ".join([command, *args, "--offset", str(output.next_offset), "--limit", str(limit)])
+            print(info(f"{output.summary()}. Type 'more' for the next page."))
+        elif output.offset > 0:
+            print(info(f"{output.summary()}."))
+
+    def do_more(self, arg):
+        if self.next_page is None:
+            print(info("Nothing more to show"))
+            return
+        self.onecmd(self.next_page)
+
+    def help_more(self):
+        print(simple_text("Show the next page of the last all, find or search_notes"))
+
     def do_hello(self, arg):
         print(simple_text("How can I help you?"))
 
@@ -231,6 +459,11 @@ class BotAssistant(Cmd):
 
     def do_quit(self, arg):
         save_data(self.address_book)
+        try:
+            storage.close()
+        except Exception as e:
+            print(error(f"Couldn't save the address book: {e}"))
+            raise SystemExit(1)
         print(success("Good bye!"))
         return True
 
@@ -256,10 +489,18 @@ class BotAssistant(Cmd):
         print(simple_text("Change a contact's phone number"))
 
     def do_find(self, arg):
-        print(find_contact(arg.split(), self.address_book))
+        self.print_listing("find", arg, find_contact)
 
     def help_find(self):
-        print(simple_text("Find a contact by name"))
+        print(simple_text(
+            "Find contacts by name, phone or birthday, or by a query: find name:ann tag:work [--limit N] [--offset N]"
+        ))
+
+    def do_explain(self, arg):
+        print(explain_query(arg.split(), self.address_book))
+
+    def help_explain(self):
+        print(simple_text("Show how a query is run: explain name:ann tag:work bday:11"))
 
     def do_phone(self, arg):
         self.do_find(arg)
@@ -267,17 +508,23 @@ class BotAssistant(Cmd):
     def help_phone(self):
         print(simple_text("Find a contact by name"))
 
+    def do_who(self, arg):
+        print(who_owns(arg.split(), self.address_book))
+
+    def help_who(self):
+        print(simple_text("Show who has a phone number: who <phone>"))
+
     def do_birthdays(self, arg):
-        print(get_upcoming_birthdays(self.address_book))
+        print(get_upcoming_birthdays(arg.split(), self.address_book))
 
     def help_birthdays(self):
-        print(simple_text("Get upcoming birthdays for the next 7 days"))
+        print(simple_text("Get upcoming birthdays: birthdays [days], 7 days by default"))
 
     def do_all(self, arg):
-        print(find_all_contacts(self.address_book))
+        self.print_listing("all", arg, find_all_contacts)
 
     def help_all(self):
-        print(simple_text("Get all contacts"))
+        print(simple_text("Get all contacts, a page at a time: all [--limit N] [--offset N]"))
 
     def do_add_birthday(self, arg):
         print(add_birthday(arg.split(), self.address_book))
@@ -292,10 +539,10 @@ class BotAssistant(Cmd):
         print(simple_text("Show a birthday of a contact"))
 
     def do_get_upcoming(self, arg):
-        print(get_upcoming_birthdays(self.address_book))
+        print(get_upcoming_birthdays(arg.split(), self.address_book))
 
     def help_get_upcoming(self):
-        print(simple_text("Get upcoming birthdays for the next 7 days"))
+        print(simple_text("Get upcoming birthdays: birthdays [days], 7 days by default"))
 
     def do_add_note(self, arg):
         print(add_note(arg.split(), self.address_book))
@@ -304,10 +551,13 @@ class BotAssistant(Cmd):
         print(simple_text("Add a note to a contact"))
 
     def do_search_notes(self, arg):
-        print(search_notes(arg.split(), self.address_book))
+        self.print_listing("search_notes", arg, search_notes)
 
     def help_search_notes(self):
-        print(simple_text("Search notes by keyword"))
+        print(simple_text(
+            "Search notes: search_notes <words>, 'OR' between alternatives, 'word*' for prefixes, "
+            "[--limit N] [--offset N] to page"
+        ))
 
     def do_remove_note(self, arg):
         print(remove_note(arg.split(), self.address_book))
@@ -339,6 +589,43 @@ class BotAssistant(Cmd):
     def help_get_notes_by_tag(self):
         print(simple_text("Get notes by tag of a contact"))
 
+    def do_notes_by_tag(self, arg):
+        print(notes_by_tag(arg.split(), self.address_book))
+
+    def help_notes_by_tag(self):
+        print(simple_text("Get notes with a tag across all contacts: notes_by_tag <tag>"))
+
+    def do_tags(self, arg):
+        print(show_tags(self.address_book))
+
+    def help_tags(self):
+        print(simple_text("Show all tags with the number of notes using them"))
+
+    def do_cache(self, arg):
+        print(show_cache_stats(self.address_book))
+
+    def help_cache(self):
+        print(simple_text("Show hit and miss counts of the search result cache"))
+
+    def do_import(self, arg):
+        with storage.bulk():
+            print(import_contacts(arg.split(), self.address_book))
+
+    def help_import(self):
+        print(simple_text("Import contacts from a file: import <path> [csv|jsonl|vcard]"))
+
+    def do_export(self, arg):
+        print(export_contacts(arg.split(), self.address_book))
+
+    def help_export(self):
+        print(simple_text("Export contacts to a file: export <path> [csv|jsonl|vcard], '.gz' paths are compressed"))
+
+    def do_compact(self, arg):
+        print(compact_storage(self.address_book))
+
+    def help_compact(self):
+        print(simple_text("Fold saved changes into a new snapshot (delta and journal storage modes)"))
+
 
 def main():
     print(
@@ -347,6 +634,9 @@ def main():
         f"\nType {Fore.BLUE}'help'{Style.RESET_ALL} for more information."
     )
 
+    if storage.load_warning:
+        print(warning(f"{storage.load_warning}. Starting with an empty address book."))
+
     BotAssistant().cmdloop()
 
 
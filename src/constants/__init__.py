@@ -1,3 +1,51 @@
-from .constants import DATE_FORMAT, REGEX_DATE_FORMAT, REGEX_SHORT_DATE_FORMAT
+from .constants import (
+    DATE_FORMAT,
+    REGEX_DATE_FORMAT,
+    REGEX_SHORT_DATE_FORMAT,
+    STORAGE_MODE_ENV,
+    DEFAULT_STORAGE_MODE,
+    SAVE_DELAY_ENV,
+    SAVE_DELAY,
+    SAVE_RETRY_DELAY,
+    FSYNC_ENV,
+    DEFAULT_FSYNC_POLICY,
+    JOURNAL_COMPACT_THRESHOLD,
+    LAZY_CACHE_SIZE,
+    SHARED_LOG_ROTATE_SIZE,
+    DELTA_COMPACT_COUNT,
+    DELTA_FLUSH_INTERVAL,
+    DUPLICATE_PHONE_ENV,
+    DEFAULT_DUPLICATE_PHONE_POLICY,
+    MAX_BIRTHDAY_DAYS,
+    FUZZY_LIMIT,
+    FUZZY_MAX_DISTANCE,
+    QUERY_CACHE_SIZE,
+    PAGE_SIZE,
+    IMPORT_CHUNK_SIZE,
+)
 
-__all__ = ["DATE_FORMAT", "REGEX_DATE_FORMAT", "REGEX_SHORT_DATE_FORMAT"]
+__all__ = [
+    "DATE_FORMAT",
+    "REGEX_DATE_FORMAT",
+    "REGEX_SHORT_DATE_FORMAT",
+    "STORAGE_MODE_ENV",
+    "DEFAULT_STORAGE_MODE",
+    "SAVE_DELAY_ENV",
+    "SAVE_DELAY",
+    "SAVE_RETRY_DELAY",
+    "FSYNC_ENV",
+    "DEFAULT_FSYNC_POLICY",
+    "JOURNAL_COMPACT_THRESHOLD",
+    "LAZY_CACHE_SIZE",
+    "SHARED_LOG_ROTATE_SIZE",
+    "DELTA_COMPACT_COUNT",
+    "DELTA_FLUSH_INTERVAL",
+    "DUPLICATE_PHONE_ENV",
+    "DEFAULT_DUPLICATE_PHONE_POLICY",
+    "MAX_BIRTHDAY_DAYS",
+    "FUZZY_LIMIT",
+    "FUZZY_MAX_DISTANCE",
+    "QUERY_CACHE_SIZE",
+    "PAGE_SIZE",
+    "IMPORT_CHUNK_SIZE",
+]
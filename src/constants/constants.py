@@ -1,3 +1,34 @@
 DATE_FORMAT = "%d.%m.%Y"
 REGEX_DATE_FORMAT = r"\d{2}\.\d{2}\.\d{4}"
 REGEX_SHORT_DATE_FORMAT = r"\d{2}\.\d{2}"
+
+# Storage settings
+STORAGE_MODE_ENV = "JARVIS_STORAGE"
+DEFAULT_STORAGE_MODE = "pickle"
+SAVE_DELAY_ENV = "JARVIS_SAVE_DELAY"
+SAVE_DELAY = 1.0  # seconds without changes before the book is written
+SAVE_RETRY_DELAY = 5.0  # seconds before a failed background write is tried again
+FSYNC_ENV = "JARVIS_FSYNC"
+DEFAULT_FSYNC_POLICY = "always"  # "always" or "never"
+JOURNAL_COMPACT_THRESHOLD = 4 * 1024 * 1024  # bytes
+LAZY_CACHE_SIZE = 10_000  # records kept in memory by the lazy storage
+SHARED_LOG_ROTATE_SIZE = 1024 * 1024  # bytes of change log kept next to the pickle
+DELTA_COMPACT_COUNT = 32  # delta files kept before folding them into a snapshot
+DELTA_FLUSH_INTERVAL = 60.0  # seconds a session collects changes before writing a delta
+
+# Contact settings
+DUPLICATE_PHONE_ENV = "JARVIS_DUPLICATE_PHONES"
+DEFAULT_DUPLICATE_PHONE_POLICY = "warn"  # "allow", "warn" or "reject"
+
+MAX_BIRTHDAY_DAYS = 366  # longest window `birthdays` accepts
+
+# Search settings
+FUZZY_LIMIT = 5  # names suggested when a search finds nothing
+FUZZY_MAX_DISTANCE = 2  # edits allowed between a keyword and a suggested name
+QUERY_CACHE_SIZE = 256  # search results kept until the data they depend on changes
+
+# Display settings
+PAGE_SIZE = 20  # contacts shown at once by all, find and search_notes
+
+# Import settings
+IMPORT_CHUNK_SIZE = 5_000  # rows validated per worker task
@@ -37,12 +37,17 @@ def input_error(func):
         "change_contact": "Please provide Name, old number and new number",
         "show_birthday": "Please provide Name",
         "find_contact": "Please provide Name",
+        "explain_query": "Please provide query",
+        "who_owns": "Please provide phone number",
         "remove_contact": "Please provide Name",
         "add_note": "Please provide Name and note",
         "edit_note": "Please provide Name, note index and new note",
         "add_tags_to_note": "Please provide Name, note index and at least one tag",
         "remove_note": "Please provide Name and note index",
         "search_notes": "Please provide keyword to search",
+        "notes_by_tag": "Please provide tag",
+        "import_contacts": "Please provide file path",
+        "export_contacts": "Please provide file path",
     }
 
     not_exist_functions = {
@@ -1,10 +1,27 @@
 from collections import UserDict
-from datetime import datetime, date, timedelta
+from datetime import date, timedelta
 import re
-import copy
 
+from src.models.binary_codec import BinaryReader, BinaryWriter
+from src.models.birthday_index import BirthdayIndex
+from src.models.name_index import TrigramIndex
+from src.models.note_index import NoteHit, NoteIndex
+from src.models.phone_index import PhoneIndex
+from src.models.query import PlanStep, Query
+from src.models.query_cache import CacheInfo, QueryCache
 from src.models.record import Record
-from src.constants import DATE_FORMAT, REGEX_DATE_FORMAT, REGEX_SHORT_DATE_FORMAT
+from src.models.record_view import RecordView
+from src.models.tag_index import TagIndex
+from src.utils.gc_pause import gc_paused
+from src.constants import (
+    FUZZY_LIMIT,
+    FUZZY_MAX_DISTANCE,
+    REGEX_DATE_FORMAT,
+    REGEX_SHORT_DATE_FORMAT,
+)
+
+# Record mutations that change which notes carry which tags
+TAG_OPERATIONS = ("add_tags_to_note", "remove_tag_from_note", "edit_note", "remove_note")
 
 
 class AddressBook(UserDict):
@@ -12,110 +29,374 @@ class AddressBook(UserDict):
 
     def __init__(self):
         super().__init__()
+        self._subscribers = []
+        self.generation = 0
+        self._saved_generation = 0
+        self._dirty_names = set()
+        self._name_index = None
+        self._phone_index = None
+        self._birthday_index = None
+        self._note_index = None
+        self._tag_index = None
+        self._query_cache = QueryCache()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        transient = (
+            "_subscribers",
+            "generation",
+            "_saved_generation",
+            "_dirty_names",
+            "_name_index",
+            "_phone_index",
+            "_birthday_index",
+            "_note_index",
+            "_tag_index",
+            "_query_cache",
+        )
+        for key in transient:
+            state.pop(key, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._subscribers = []
+        self.generation = 0
+        self._saved_generation = 0
+        self._dirty_names = set()
+        self._name_index = None
+        self._phone_index = None
+        self._birthday_index = None
+        self._note_index = None
+        self._tag_index = None
+        self._query_cache = QueryCache()
+        for record in self.data.values():
+            record._listener = self._on_record_change
+
+    def to_bytes(self) -> bytes:
+        """Encode the whole book into the compact binary format."""
+        writer = BinaryWriter()
+        writer.write_uint(len(self.data))
+        for record in self.data.values():
+            record.write_binary(writer)
+        return writer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "AddressBook":
+        """Decode a book produced by `to_bytes`.
+
+        Raises ValueError for foreign, unsupported, truncated or damaged data.
+        """
+        book = cls()
+
+        try:
+            with gc_paused():
+                reader = BinaryReader(data)
+                for _ in range(reader.read_uint()):
+                    record = Record.read_binary(reader)
+                    record._listener = book._on_record_change
+                    book.data[record.name.value] = record
+        except (IndexError, OverflowError) as e:
+            raise ValueError("Binary address book is truncated or damaged") from e
+        return book
+
+    @property
+    def is_dirty(self) -> bool:
+        """True if the book changed since the last `mark_clean` call."""
+        return self.generation != self._saved_generation
+
+    def dirty_names(self) -> set[str]:
+        """Names of records added, changed or deleted since the last `mark_clean` call."""
+        return set(self._dirty_names)
+
+    def mark_clean(self):
+        """Forget pending changes, usually right after the book was saved."""
+        self._saved_generation = self.generation
+        self._dirty_names.clear()
+
+    def subscribe(self, callback):
+        """Register a callback called as `callback(op, name, args)` on every mutation."""
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        """Stop delivering mutations to a previously registered callback."""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def _emit(self, op: str, name: str, args: tuple):
+        self.generation += 1
+        self._query_cache.invalidate(op)
+        self._dirty_names.add(name)
+        for callback in list(self._subscribers):
+            callback(op, name, args)
+
+    def _on_record_change(self, record: Record, op: str, args: tuple):
+        if self._phone_index is not None and op in ("add_phone", "remove_phone", "edit_phone"):
+            self._update_phone_index(record, op, args)
+        if self._birthday_index is not None and op == "add_birthday":
+            self._birthday_index.set(record.name.value, record.birthday.value)
+        if self._note_index is not None and op in ("add_note", "edit_note", "remove_note"):
+            self._update_note_index(record, op, args)
+        if self._tag_index is not None and op in TAG_OPERATIONS:
+            self._update_tag_index(record, op, args)
+        self._emit(op, record.name.value, args)
+
+    def _update_phone_index(self, record: Record, op: str, args: tuple):
+        name = record.name.value
+        if op == "add_phone":
+            self._phone_index.add(args[0], name)
+            return
+        # A record may hold the same number twice, keep it while one copy is left
+        if record.find_phone(args[0]) is None:
+            self._phone_index.remove(args[0], name)
+        if op == "edit_phone":
+            self._phone_index.add(args[1], name)
+
+    def _update_note_index(self, record: Record, op: str, args: tuple):
+        name = record.name.value
+        if op == "add_note":
+            text, note_id = args
+            self._note_index.add(name, note_id, text)
+        elif op == "edit_note":
+            note_id, text = args
+            self._note_index.add(name, note_id, text)
+        else:
+            self._note_index.remove(name, args[0])
+
+    def _update_tag_index(self, record: Record, op: str, args: tuple):
+        name = record.name.value
+        if op == "add_tags_to_note":
+            self._tag_index.add(name, args[0], args[1])
+        elif op == "remove_tag_from_note":
+            self._tag_index.remove(name, args[0], args[1])
+        else:
+            # An edited note starts without tags, a removed one is gone
+            note_id = args[0]
+            self._tag_index.remove_note(name, note_id)
 
     def add_record(self, record: Record):
         """Add a record to the address book."""
-        self.data.update({record.name.value: record})
+        name = record.name.value
+        if self._record_indexes_built():
+            replaced = self.data.get(name)
+            if replaced is not None:
+                self._unindex_record(replaced)
+            self._index_record(record)
+
+        record._listener = self._on_record_change
+        self.data.update({name: record})
+        if self._name_index is not None:
+            self._name_index.add(name)
+        self._emit("add_record", name, (record,))
+
+    def _record_indexes_built(self) -> bool:
+        indexes = (self._phone_index, self._birthday_index, self._note_index, self._tag_index)
+        return any(index is not None for index in indexes)
+
+    def _index_record(self, record: Record):
+        """Add a record to the indexes built so far."""
+        name = record.name.value
+        if self._phone_index is not None:
+            for phone in record.phones:
+                self._phone_index.add(phone.value, name)
+        if self._birthday_index is not None and record.birthday is not None:
+            self._birthday_index.set(name, record.birthday.value)
+        if self._note_index is not None:
+            self._note_index.add_record(record)
+        if self._tag_index is not None:
+            self._tag_index.add_record(record)
+
+    def _unindex_record(self, record: Record):
+        """Drop a record from the indexes built so far."""
+        name = record.name.value
+        if self._phone_index is not None:
+            for phone in record.phones:
+                self._phone_index.remove(phone.value, name)
+        if self._birthday_index is not None:
+            self._birthday_index.remove(name)
+        if self._note_index is not None:
+            self._note_index.remove_record(record)
+        if self._tag_index is not None:
+            self._tag_index.remove_record(record)
+
+    @property
+    def name_index(self) -> TrigramIndex:
+        """Trigram index of contact names, built on first use."""
+        if self._name_index is None:
+            self._name_index = TrigramIndex(self.data)
+        return self._name_index
+
+    @property
+    def phone_index(self) -> PhoneIndex:
+        """Index of phone numbers, built on first use."""
+        if self._phone_index is None:
+            self._phone_index = PhoneIndex(self.data.values())
+        return self._phone_index
+
+    @property
+    def phone_lookup_is_cheap(self) -> bool:
+        """True when `find_by_phone` does not have to read every record from storage.
+
+        That is the case once the phone index is built, or when all records
+        are in memory anyway. Lazily loaded books would read them all.
+        """
+        return self._phone_index is not None or isinstance(self.data, dict)
+
+    @property
+    def birthday_index(self) -> BirthdayIndex:
+        """Index of birthdays by month and day, built on first use."""
+        if self._birthday_index is None:
+            self._birthday_index = BirthdayIndex(self.data.values())
+        return self._birthday_index
+
+    @property
+    def note_index(self) -> NoteIndex:
+        """Full-text index of notes, built on first use."""
+        if self._note_index is None:
+            self._note_index = NoteIndex(self.data.values())
+        return self._note_index
+
+    @property
+    def tag_index(self) -> TagIndex:
+        """Index of note tags across all contacts, built on first use."""
+        if self._tag_index is None:
+            self._tag_index = TagIndex(self.data.values())
+        return self._tag_index
+
+    def iter_records(self):
+        """Yield records one by one without building a list."""
+        for name in self.data:
+            yield self.data[name]
 
     def find(self, name: str) -> Record | None:
         """Find a record by contact name."""
         return self.data.get(name, None)
 
-    def search(self, keyword: str) -> list[Record]:
-        """Search records by name, phone, or birthday."""
-        matches = []
+    def find_by_phone(self, phone: str) -> list[Record]:
+        """Records that have this phone number, separators are ignored."""
+        digits = "".join(ch for ch in phone if ch.isdigit())
+        return [self.data[name] for name in self.phone_index.exact(digits)]
+
+    def search(
+        self,
+        keyword: str,
+        fuzzy: bool = False,
+        limit: int = FUZZY_LIMIT,
+        max_distance: int = FUZZY_MAX_DISTANCE,
+    ) -> list[Record]:
+        """Search records by name, phone, or birthday.
+
+        Name matches keep the book order, phone matches are ordered by number.
+        With `fuzzy`, returns up to `limit` records whose names are within
+        `max_distance` edits of the keyword, closest first.
+        """
         if keyword == "" or keyword.isspace():
-            return matches
-
-        # Searching by birthday date
-        if re.match(REGEX_DATE_FORMAT, keyword) or re.match(
-            REGEX_SHORT_DATE_FORMAT, keyword
-        ):
-            for record in self.data.values():
-                if (
-                    record.birthday is not None
-                    and re.search(keyword, record.birthday.__str__()) is not None
-                ):
-                    matches.append(record)
-            return matches
-
-        if keyword.isnumeric():
+            return []
+
+        cache = self._query_cache
+        if fuzzy:
+            key = ("fuzzy", keyword.casefold(), limit, max_distance)
+            names = cache.get(key, (), lambda: self.name_index.fuzzy(keyword, limit, max_distance))
+        elif re.match(REGEX_DATE_FORMAT, keyword) or re.match(REGEX_SHORT_DATE_FORMAT, keyword):
+            # Searching by birthday date
+            names = cache.get(("search", keyword), ("bday",), lambda: self._search_birthdays(keyword))
+        elif keyword.isnumeric():
             # Searching for phone number
-            for record in self.data.values():
-                for phone_number in record.phones:
-                    if re.search(keyword, phone_number.value) is not None:
-                        matches.append(record)
+            names = cache.get(("search", keyword), ("phone",), lambda: self.phone_index.substring(keyword))
         else:
-            # Searching for name
-            for record in self.data.values():
-                if re.search(keyword.lower(), record.name.value.lower()) is not None:
-                    matches.append(record)
+            # Searching for name, only matching records are loaded
+            names = cache.get(("search", keyword.casefold()), (), lambda: self.name_index.search(keyword))
+
+        return [self.data[name] for name in names]
 
-        return matches
+    def _search_birthdays(self, keyword: str) -> list[str]:
+        return [
+            name
+            for name, record in self.data.items()
+            if record.birthday is not None and re.search(keyword, str(record.birthday)) is not None
+        ]
+
+    def cache_info(self) -> CacheInfo:
+        """Hits, misses and size of the cache of search results."""
+        return self._query_cache.info()
+
+    def query(self, text: str) -> list[Record]:
+        """Records matching a structured query like `name:ann tag:work bday:11`, see `Query`."""
+        query = Query.parse(text)
+        fields = tuple(condition.field for condition in query.filters)
+        key = ("query", " ".join(str(condition) for condition in query.filters))
+        names = self._query_cache.get(key, fields, lambda: query.run(self)[0])
+        return [self.data[name] for name in names]
+
+    def explain(self, text: str) -> tuple[list[Record], list[PlanStep]]:
+        """Run a structured query, bypassing the cache, and also return the plan steps with timings."""
+        names, steps = Query.parse(text).run(self)
+        return [self.data[name] for name in names], steps
 
     def delete(self, name):
         """Delete a record by name."""
         target_record = self.find(name)
         if target_record is not None:
             self.data.pop(name)
+            if self._name_index is not None:
+                self._name_index.remove(name)
+            self._unindex_record(target_record)
+            target_record._listener = None
+            self._emit("delete", name, ())
 
-    def get_upcoming_birthdays(self) -> list[dict]:
-        """Get birthdays for the next 7 days."""
-        today = date.today()
-        birthdays = []
-
-        for record in self.data.values():
-            if record.birthday is None:
-                continue
+    def get_upcoming_birthdays(self, days: int = 7, today: date | None = None) -> list[dict]:
+        """Get birthdays to congratulate from today to `days` days ahead.
 
-            user_name = record.name
-            birthday_str = record.birthday
-            og_birthday_date = datetime.strptime(
-                birthday_str.__repr__(), DATE_FORMAT
-            ).date()
+        Birthdays on a weekend are congratulated on the following Monday, so
+        a birthday from the last weekend can still show up today.
+        """
+        today = today or date.today()
+        key = ("birthdays", days, today)
+        return list(self._query_cache.get(key, ("bday",), lambda: self._upcoming_birthdays(days, today)))
 
-            birthday_date_this_year = date(
-                today.year, og_birthday_date.month, og_birthday_date.day
-            )
+    def _upcoming_birthdays(self, days: int, today: date) -> list[dict]:
+        end = today + timedelta(days=days)
+        birthdays = []
 
+        for birthday, name in self.birthday_index.between(today - timedelta(days=2), end):
+            congratulation_date = birthday
             # Check if birthday happens on
             # weekend and add offset for congratulation
-            if birthday_date_this_year.isoweekday() == 6:
-                birthday_date_this_year += timedelta(days=2)
-            elif birthday_date_this_year.isoweekday() == 7:
-                birthday_date_this_year += timedelta(days=1)
-
-            date_dif = birthday_date_this_year - today
-            # Check only 7 upcoming days including today,
-            # ignore b-days in past or further in future
-            if 7 >= date_dif.days >= 0:
+            if congratulation_date.isoweekday() == 6:
+                congratulation_date += timedelta(days=2)
+            elif congratulation_date.isoweekday() == 7:
+                congratulation_date += timedelta(days=1)
+
+            if today <= congratulation_date <= end:
                 birthdays.append(
                     {
-                        "name": user_name,
-                        "congratulation_date": birthday_date_this_year.strftime(
-                            "%Y.%m.%d"
-                        ),
+                        "name": self.data[name].name,
+                        "congratulation_date": congratulation_date.strftime("%Y.%m.%d"),
                     }
                 )
 
         return birthdays
 
-    def get_records_by_note_keyword(self, keyword: str) -> list[Record]:
-        """Find records by keyword in notes."""
-        matches = []
-        keyword = keyword.strip()
-        if not keyword:
-            return matches
+    def search_notes(self, query: str, limit: int | None = None) -> list[NoteHit]:
+        """Full-text search over all notes, best matches first.
 
-        for record in self.data.values():
-            matching_notes = {
-                note_id: note
-                for note_id, note in record.notes.items()
-                if keyword.lower() in note.value.lower()
-            }
-            if matching_notes:
-                filtered_record = copy.copy(record)
-                filtered_record.notes = matching_notes
-                matches.append(filtered_record)
-
-        return matches
+        All words of the query must appear in a note; `OR` separates
+        alternatives and `word*` matches words by prefix.
+        """
+        key = ("notes", " ".join(query.split()), limit)
+        return list(self._query_cache.get(key, ("note",), lambda: self.note_index.search(query, limit)))
+
+    def notes_by_tag(self, tag: str) -> list[tuple[str, int]]:
+        """(contact name, note id) pairs of all notes tagged with `tag`."""
+        return self.tag_index.notes(tag)
+
+    def tag_counts(self) -> list[tuple[str, int]]:
+        """(tag, number of notes) pairs, most used tags first."""
+        return self.tag_index.counts()
+
+    def get_records_by_note_keyword(self, keyword: str) -> list[RecordView]:
+        """Find records by a note query, as views showing only the matching notes."""
+        note_ids = {}
+        for hit in self.search_notes(keyword):
+            note_ids.setdefault(hit.name, []).append(hit.note_id)
+        return [self.data[name].view(ids) for name, ids in note_ids.items()]
@@ -0,0 +1,93 @@
+import struct
+
+MAGIC = b"JRVB"
+FORMAT_VERSION = 2
+# Version 1 had no note ID counter, the next ID follows the highest note
+SUPPORTED_VERSIONS = (1, 2)
+HEADER = struct.Struct("<4sH")
+
+
+class BinaryWriter:
+    """Builds the binary address book format.
+
+    Integers are stored as LEB128 varints and strings as a varint byte length
+    followed by UTF-8 bytes. Tags are replaced with IDs into a table written
+    in front of the records.
+    """
+
+    def __init__(self):
+        self._body = bytearray()
+        self._tag_ids = {}
+
+    def write_uint(self, value: int):
+        body = self._body
+        while value >= 0x80:
+            body.append((value & 0x7F) | 0x80)
+            value >>= 7
+        body.append(value)
+
+    def write_str(self, value: str):
+        data = value.encode("utf-8")
+        self.write_uint(len(data))
+        self._body += data
+
+    def write_tag(self, tag: str):
+        tag_id = self._tag_ids.get(tag)
+        if tag_id is None:
+            tag_id = self._tag_ids[tag] = len(self._tag_ids)
+        self.write_uint(tag_id)
+
+    def getvalue(self) -> bytes:
+        """Return header, tag table and records as one bytes object."""
+        head = BinaryWriter()
+        head._body += HEADER.pack(MAGIC, FORMAT_VERSION)
+        head.write_uint(len(self._tag_ids))
+        for tag in self._tag_ids:
+            head.write_str(tag)
+        return bytes(head._body + self._body)
+
+
+class BinaryReader:
+    """Reads data produced by `BinaryWriter`."""
+
+    def __init__(self, data: bytes):
+        if len(data) < HEADER.size:
+            raise ValueError("Data is too short for the binary format")
+        magic, version = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Not a binary address book")
+        if version not in SUPPORTED_VERSIONS:
+            raise ValueError(f"Unsupported binary format version {version}")
+
+        self.version = version
+        self._data = data
+        self._pos = HEADER.size
+        self.tags = [self.read_str() for _ in range(self.read_uint())]
+
+    def read_uint(self) -> int:
+        data, pos = self._data, self._pos
+        byte = data[pos]
+        pos += 1
+        if byte < 0x80:
+            self._pos = pos
+            return byte
+
+        value = byte & 0x7F
+        shift = 7
+        while True:
+            byte = data[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                self._pos = pos
+                return value
+            shift += 7
+
+    def read_str(self) -> str:
+        length = self.read_uint()
+        start = self._pos
+        self._pos = start + length
+        return self._data[start:self._pos].decode("utf-8")
+
+    def read_tag(self) -> str:
+        return self.tags[self.read_uint()]
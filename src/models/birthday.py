@@ -1,21 +1,52 @@
-from datetime import datetime
+from datetime import date
 
 from src.models.field import Field
-from src.constants import DATE_FORMAT
+
+
+def parse_date(text: str) -> date:
+    """Parse a DD.MM.YYYY date, day and month may have one or two digits."""
+    parts = text.split(".")
+    if len(parts) == 3:
+        day, month, year = parts
+        if (
+            0 < len(day) <= 2 and day.isdecimal()
+            and 0 < len(month) <= 2 and month.isdecimal()
+            and len(year) == 4 and year.isdecimal()
+        ):
+            try:
+                return date(int(year), int(month), int(day))
+            except ValueError:
+                pass
+    raise ValueError("Invalid date format. Use DD.MM.YYYY")
 
 
 class Birthday(Field):
-    """Represents a birthday field in DD.MM.YYYY format."""
+    """Represents a birthday field in DD.MM.YYYY format.
+
+    The value is a `date`, its DD.MM.YYYY text is built once and cached.
+    """
+
+    __slots__ = ("_text",)
 
     @Field.value.setter
     def value(self, value):
-        try:
-            self._value = datetime.strptime(value, DATE_FORMAT)
-        except ValueError:
-            raise ValueError("Invalid date format. Use DD.MM.YYYY")
+        if not isinstance(value, str):
+            raise TypeError(f"Birthday must be a string, not {type(value).__name__}")
+        self._value = parse_date(value)
+        self._text = value if len(value) == 10 and value.isascii() else None
 
     def __str__(self):
-        return f"{datetime.strftime(self.value, DATE_FORMAT)}"
+        # Fields made with `trusted` or loaded from old pickles have no text yet
+        text = getattr(self, "_text", None)
+        if text is None:
+            value = self._value
+            text = self._text = f"{value.day:02d}.{value.month:02d}.{value.year:04d}"
+        return text
 
     def __repr__(self):
-        return datetime.strftime(self.value, DATE_FORMAT)
+        return str(self)
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state.pop("_text", None)
+        return state
@@ -0,0 +1,84 @@
+from bisect import bisect_left, bisect_right, insort
+from calendar import isleap
+from datetime import date
+
+
+class BirthdayIndex:
+    """Contact names grouped by birthday (month, day), with sorted keys for range queries.
+
+    There are at most 366 keys, so a range query bisects the keys and then
+    only touches the names of matching days.
+    """
+
+    def __init__(self, records=()):
+        self._names = {}  # (month, day) -> set of names
+        self._keys = {}  # name -> (month, day)
+        for record in records:
+            if record.birthday is not None:
+                self._add(record.name.value, record.birthday.value)
+        self._sorted_keys = sorted(self._names)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def set(self, name: str, birthday):
+        """Store the birthday (a date or datetime) of a contact, replacing the previous one."""
+        self.remove(name)
+        key = self._add(name, birthday)
+        if len(self._names[key]) == 1:
+            insort(self._sorted_keys, key)
+
+    def remove(self, name: str):
+        key = self._keys.pop(name, None)
+        if key is None:
+            return
+        names = self._names[key]
+        names.discard(name)
+        if not names:
+            del self._names[key]
+            del self._sorted_keys[bisect_left(self._sorted_keys, key)]
+
+    def between(self, start: date, end: date) -> list[tuple[date, str]]:
+        """(birthday date, name) pairs for birthdays from `start` to `end` inclusive.
+
+        Feb 29 birthdays fall on Feb 28 in common years. Windows longer than
+        a year list a contact once per year.
+        """
+        matches = []
+        for year in range(start.year, end.year + 1):
+            first = max(start, date(year, 1, 1))
+            last = min(end, date(year, 12, 31))
+            last_key = (last.month, last.day)
+            if not isleap(year) and last_key == (2, 28):
+                last_key = (2, 29)
+
+            keys = self._sorted_keys
+            lo = bisect_left(keys, (first.month, first.day))
+            hi = bisect_right(keys, last_key)
+            for key in keys[lo:hi]:
+                month, day = key
+                if key == (2, 29) and not isleap(year):
+                    day = 28
+                birthday = date(year, month, day)
+                matches.extend((birthday, name) for name in sorted(self._names[key]))
+        return matches
+
+    def names(self, month: int, day: int | None = None) -> "set[str]":
+        """Names of contacts born on `day` of `month`, or on any day of `month`."""
+        return set().union(*(self._names[key] for key in self._month_keys(month, day)))
+
+    def count(self, month: int, day: int | None = None) -> int:
+        """Number of contacts `names` returns, without collecting them."""
+        return sum(len(self._names[key]) for key in self._month_keys(month, day))
+
+    def _month_keys(self, month: int, day: int | None) -> list[tuple[int, int]]:
+        if day is not None:
+            return [(month, day)] if (month, day) in self._names else []
+        keys = self._sorted_keys
+        return keys[bisect_left(keys, (month, 0)):bisect_left(keys, (month + 1, 0))]
+
+    def _add(self, name: str, birthday) -> tuple[int, int]:
+        key = (birthday.month, birthday.day)
+        self._keys[name] = key
+        self._names.setdefault(key, set()).add(name)
+        return key
@@ -1,12 +1,40 @@
 class Field:
-    """Base class for all model fields."""
+    """Base class for all model fields.
+
+    Fields use `__slots__` instead of a per-instance `__dict__`, a book holds
+    several of them for every contact.
+    """
+
+    __slots__ = ("_value",)
 
     def __init__(self, value):
         self.value = value
 
+    def __getstate__(self):
+        return {
+            slot: getattr(self, slot)
+            for cls in type(self).__mro__
+            for slot in getattr(cls, "__slots__", ())
+            if hasattr(self, slot)
+        }
+
+    def __setstate__(self, state):
+        # Pickles written before fields had slots may hold a (dict, slots) pair
+        if isinstance(state, tuple):
+            state = {**(state[0] or {}), **(state[1] or {})}
+        for slot, value in state.items():
+            object.__setattr__(self, slot, value)
+
     def __str__(self):
         return str(self.value)
 
+    @classmethod
+    def trusted(cls, value):
+        """Create a field from an already validated value, skipping validation."""
+        field = cls.__new__(cls)
+        field._value = value
+        return field
+
     @property
     def value(self):
         return self._value
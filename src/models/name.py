@@ -3,4 +3,4 @@ from src.models.field import Field
 
 class Name(Field):
     """Represents a contact's name field."""
-    pass
+    __slots__ = ()
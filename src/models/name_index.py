@@ -0,0 +1,220 @@
+import heapq
+from collections import Counter
+from itertools import chain
+from operator import itemgetter
+
+from src.utils.gc_pause import gc_paused
+
+# Mark the start and the end of a word, never part of a typed keyword
+WORD_START = "\x02"
+WORD_END = "\x03"
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Edit distance between `a` and `b`, or `limit + 1` once it exceeds `limit`.
+
+    Insertions, deletions, substitutions and swaps of adjacent characters
+    count as one edit each.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    before = None
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            distance = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            )
+            if before is not None and j > 1 and char_a == b[j - 2] and a[i - 2] == char_b:
+                distance = min(distance, before[j - 2] + 1)
+            current.append(distance)
+        if min(current) > limit:
+            return limit + 1
+        before, previous = previous, current
+    return min(previous[-1], limit + 1)
+
+
+class TrigramIndex:
+    """Inverted index from casefolded name trigrams to contact names.
+
+    A search intersects the posting sets of the keyword's trigrams and then
+    checks the remaining candidates with a literal substring test, so only
+    a handful of names are compared instead of the whole book. Keywords
+    shorter than a trigram fall back to a scan of the casefolded names.
+    Results keep the order in which names were first added.
+
+    Distinct name words are indexed separately by bigrams padded with start
+    and end marks. A fuzzy search for a word computes edit distances only
+    for words that share enough bigrams with it, best candidates first, so
+    its cost follows the number of distinct words rather than contacts.
+    """
+
+    def __init__(self, names=()):
+        self._postings = {}
+        self._folded = {}
+        self._order = {}
+        self._next_order = 0
+        self._words = {}
+        self._word_postings = {}
+
+        with gc_paused():
+            for name in names:
+                self.add(name)
+
+    def __len__(self):
+        return len(self._folded)
+
+    @staticmethod
+    def trigrams(text: str) -> set[str]:
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    @staticmethod
+    def word_bigrams(word: str) -> set[str]:
+        """Bigrams of `word` padded with start and end marks."""
+        word = f"{WORD_START}{word}{WORD_END}"
+        return {word[i:i + 2] for i in range(len(word) - 1)}
+
+    def add(self, name: str):
+        if name in self._folded:
+            return
+        folded = name.casefold()
+        self._folded[name] = folded
+        self._order[name] = self._next_order
+        self._next_order += 1
+
+        postings = self._postings
+        for i in range(len(folded) - 2):
+            trigram = folded[i:i + 3]
+            names = postings.get(trigram)
+            if names is None:
+                postings[trigram] = {name}
+            else:
+                names.add(name)
+
+        for word in set(folded.split()):
+            names = self._words.get(word)
+            if names is not None:
+                names.add(name)
+                continue
+            self._words[word] = {name}
+            for bigram in self.word_bigrams(word):
+                words = self._word_postings.get(bigram)
+                if words is None:
+                    self._word_postings[bigram] = {word}
+                else:
+                    words.add(word)
+
+    def remove(self, name: str):
+        folded = self._folded.pop(name, None)
+        if folded is None:
+            return
+        del self._order[name]
+        for trigram in self.trigrams(folded):
+            names = self._postings[trigram]
+            names.discard(name)
+            if not names:
+                del self._postings[trigram]
+
+        for word in set(folded.split()):
+            names = self._words[word]
+            names.discard(name)
+            if names:
+                continue
+            del self._words[word]
+            for bigram in self.word_bigrams(word):
+                words = self._word_postings[bigram]
+                words.discard(word)
+                if not words:
+                    del self._word_postings[bigram]
+
+    def search(self, keyword: str) -> list[str]:
+        """Names containing `keyword`, ignoring case."""
+        keyword = keyword.casefold()
+        trigrams = self.trigrams(keyword)
+        if not trigrams:
+            return [name for name, folded in self._folded.items() if keyword in folded]
+
+        postings = []
+        for trigram in trigrams:
+            names = self._postings.get(trigram)
+            if not names:
+                return []
+            postings.append(names)
+        postings.sort(key=len)
+
+        candidates = postings[0].intersection(*postings[1:])
+        matches = [name for name in candidates if keyword in self._folded[name]]
+        matches.sort(key=self._order.__getitem__)
+        return matches
+
+    def estimate(self, keyword: str) -> int:
+        """Upper bound of the number of names `search` returns for `keyword`."""
+        trigrams = self.trigrams(keyword.casefold())
+        if not trigrams:
+            return len(self._folded)
+        return min(len(self._postings.get(trigram, ())) for trigram in trigrams)
+
+    def sort(self, names) -> list[str]:
+        """Indexed `names` in the order in which they were first added."""
+        return sorted(names, key=self._order.__getitem__)
+
+    def fuzzy(self, keyword: str, limit: int = 5, max_distance: int = 2) -> list[str]:
+        """Up to `limit` names closest to `keyword` within `max_distance` edits.
+
+        A one-word keyword is compared with every word of a name, so "jonh"
+        finds "John Smith", a longer keyword is compared with whole names.
+        Only names sharing at least one bigram of a word, or one trigram of a
+        longer keyword, are considered. Closer names come first, ties keep the
+        order in which names were added.
+        """
+        words = keyword.casefold().split()
+        if not words or limit <= 0:
+            return []
+
+        # An edit changes at most `span` grams: a swap touches three bigrams
+        # or four trigrams, so each missing gram puts a candidate further away
+        if len(words) == 1:
+            keyword = words[0]
+            grams, span = self.word_bigrams(keyword), 3
+            postings, text_of, names_of = self._word_postings, str, self._words.__getitem__
+        else:
+            keyword = " ".join(words)
+            grams, span = self.trigrams(keyword), 4
+            postings, text_of, names_of = self._postings, self._folded.__getitem__, lambda name: (name,)
+        shared = Counter(chain.from_iterable(postings.get(gram, ()) for gram in grams))
+
+        min_shared = len(grams) - span * max_distance
+        candidates = [item for item in shared.items() if item[1] >= min_shared]
+        candidates.sort(key=itemgetter(1), reverse=True)
+
+        distances = {}
+        per_distance = [0] * (max_distance + 1)
+        worst = max_distance
+        for candidate, count in candidates:
+            if -(-(len(grams) - count) // span) > worst:
+                break
+            text = text_of(candidate)
+            if abs(len(text) - len(keyword)) > worst:
+                continue
+            distance = edit_distance(keyword, text, worst)
+            if distance > worst:
+                continue
+            for name in names_of(candidate):
+                previous = distances.get(name)
+                if previous is not None:
+                    if previous <= distance:
+                        continue
+                    per_distance[previous] -= 1
+                distances[name] = distance
+                per_distance[distance] += 1
+            worst = next(
+                (d for d in range(max_distance + 1) if sum(per_distance[:d + 1]) >= limit),
+                max_distance,
+            )
+
+        order = self._order
+        return heapq.nsmallest(limit, distances, key=lambda name: (distances[name], order[name]))
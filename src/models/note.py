@@ -1,14 +1,39 @@
-from src.models.tag import Tag
+from src.models.tag import Tag, tag_table
 from src.models.field import Field
 
+NO_TAGS = tag_table.tag_set(())
+
 
 class Note(Field):
-    """Represents a note with optional tags."""
+    """Represents a note with optional tags.
+
+    Tags are kept as an interned set of tag IDs from `tag_table`, shared
+    with every other note that has the same tags.
+    """
+
+    __slots__ = ("_tags",)
 
     def __init__(self, note_value):
         super().__init__(note_value)
 
-        self._tags = []
+        self._tags = NO_TAGS
+
+    @classmethod
+    def trusted(cls, value):
+        note = super().trusted(value)
+        note._tags = NO_TAGS
+        return note
+
+    def __getstate__(self):
+        # Tag IDs are only valid in this process, pickles keep the tag strings
+        return {"_value": self._value, "_tags": self.tag_values()}
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        # Pickles written before interning hold a list of Tag objects
+        tags = [tag if isinstance(tag, str) else tag.value for tag in self._tags]
+        self._tags = NO_TAGS
+        self.add_tags(tags)
 
     @Field.value.setter
     def value(self, value):
@@ -17,14 +42,27 @@ class Note(Field):
         self._value = value.strip()
 
     def add_tags(self, tags: list[str]):
-        """Add tags to the note."""
-        new_tags = [Tag(tag) for tag in tags]
-        self._tags.extend(new_tags)
+        """Add tags to the note, tags it already has are skipped."""
+        tag_ids = dict(self._tags)
+        for tag in tags:
+            tag_ids[tag_table.intern(tag)] = None
+        if len(tag_ids) != len(self._tags):
+            self._tags = tag_table.tag_set(tag_ids)
 
     def remove_tag(self, tag: str):
         """Remove a tag from the note."""
-        self._tags = [t for t in self._tags if t.value != tag]
+        tag_id = tag_table.id(tag)
+        if tag_id in self._tags:
+            self._tags = tag_table.tag_set(other for other in self._tags if other != tag_id)
+
+    def has_tag(self, tag: str) -> bool:
+        """True if the note is tagged with `tag`."""
+        return tag_table.id(tag) in self._tags
+
+    def tag_values(self) -> list[str]:
+        """Tags of the note as strings, in alphabetical order."""
+        return [tag_table.tag(tag_id) for tag_id in self._tags]
 
     def get_tags(self) -> list[Tag]:
         """Get all tags assigned to this note."""
-        return self._tags
+        return [Tag.trusted(tag_table.tag(tag_id)) for tag_id in self._tags]
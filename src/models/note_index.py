@@ -0,0 +1,152 @@
+import math
+import re
+from bisect import bisect_left
+from typing import NamedTuple
+
+TOKEN_REGEX = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into casefolded word tokens."""
+    return TOKEN_REGEX.findall(text.casefold())
+
+
+class NoteHit(NamedTuple):
+    name: str
+    note_id: int
+    score: float
+
+
+class NoteIndex:
+    """Inverted index over note words with BM25 ranking.
+
+    A query is a list of words that must all appear in a note. `OR` between
+    words starts an alternative group, and a word ending with `*` matches
+    every word starting with it, e.g. `meet* OR call mom`.
+    """
+
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, records=()):
+        self._postings = {}  # token -> {(name, note_id): term frequency}
+        self._doc_tokens = {}  # (name, note_id) -> distinct tokens
+        self._lengths = {}  # (name, note_id) -> number of tokens
+        self._total_length = 0
+        self._vocabulary = None  # sorted tokens for prefix queries, rebuilt on demand
+        for record in records:
+            self.add_record(record)
+
+    def __len__(self):
+        return len(self._lengths)
+
+    def add(self, name: str, note_id: int, text: str):
+        """Index a note, replacing an earlier version of it."""
+        doc = (name, note_id)
+        if doc in self._lengths:
+            self.remove(name, note_id)
+
+        tokens = tokenize(text)
+        counts = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+
+        for token, frequency in counts.items():
+            posting = self._postings.get(token)
+            if posting is None:
+                self._postings[token] = {doc: frequency}
+                self._vocabulary = None
+            else:
+                posting[doc] = frequency
+        self._doc_tokens[doc] = tuple(counts)
+        self._lengths[doc] = len(tokens)
+        self._total_length += len(tokens)
+
+    def remove(self, name: str, note_id: int):
+        doc = (name, note_id)
+        tokens = self._doc_tokens.pop(doc, None)
+        if tokens is None:
+            return
+        self._total_length -= self._lengths.pop(doc)
+        for token in tokens:
+            posting = self._postings[token]
+            del posting[doc]
+            if not posting:
+                del self._postings[token]
+                self._vocabulary = None
+
+    def add_record(self, record):
+        for note_id, note in record.notes.items():
+            self.add(record.name.value, note_id, note.value)
+
+    def remove_record(self, record):
+        for note_id in record.notes:
+            self.remove(record.name.value, note_id)
+
+    def search(self, query: str, limit: int | None = None) -> list[NoteHit]:
+        """Notes matching the query, best matches first."""
+        scores = {}
+        for group in self.parse(query):
+            for doc, score in self._match_all(group).items():
+                scores[doc] = scores.get(doc, 0.0) + score
+
+        hits = [NoteHit(name, note_id, score) for (name, note_id), score in scores.items()]
+        hits.sort(key=lambda hit: (-hit.score, hit.name, hit.note_id))
+        return hits if limit is None else hits[:limit]
+
+    def estimate(self, query: str) -> int:
+        """Upper bound of the number of notes matching the query, without scoring them."""
+        return sum(min(self._frequency(*term) for term in group) for group in self.parse(query))
+
+    @staticmethod
+    def parse(query: str) -> list[list[tuple[str, bool]]]:
+        """Split a query into OR groups of (token, is prefix) terms."""
+        groups = [[]]
+        for word in query.split():
+            if word == "OR":
+                groups.append([])
+                continue
+            tokens = tokenize(word)
+            for i, token in enumerate(tokens):
+                groups[-1].append((token, word.endswith("*") and i == len(tokens) - 1))
+        return [group for group in groups if group]
+
+    def _match_all(self, group: list[tuple[str, bool]]) -> dict:
+        term_scores = sorted((self._term_scores(*term) for term in group), key=len)
+        matches = term_scores[0]
+        for scores in term_scores[1:]:
+            if not matches:
+                break
+            matches = {doc: score + scores[doc] for doc, score in matches.items() if doc in scores}
+        return matches
+
+    def _frequency(self, token: str, prefix: bool) -> int:
+        tokens = self._expand(token) if prefix else [token]
+        return sum(len(self._postings.get(token, ())) for token in tokens)
+
+    def _term_scores(self, token: str, prefix: bool) -> dict:
+        tokens = self._expand(token) if prefix else [token]
+        docs = len(self._lengths)
+        average_length = self._total_length / docs if docs else 0.0
+
+        scores = {}
+        for token in tokens:
+            posting = self._postings.get(token)
+            if not posting:
+                continue
+            idf = math.log(1 + (docs - len(posting) + 0.5) / (len(posting) + 0.5))
+            for doc, frequency in posting.items():
+                norm = 1 - self.B + self.B * self._lengths[doc] / average_length if average_length else 1.0
+                score = idf * frequency * (self.K1 + 1) / (frequency + self.K1 * norm)
+                scores[doc] = scores.get(doc, 0.0) + score
+        return scores
+
+    def _expand(self, prefix: str) -> list[str]:
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+        start = bisect_left(vocabulary, prefix)
+        end = start
+        while end < len(vocabulary) and vocabulary[end].startswith(prefix):
+            end += 1
+        return vocabulary[start:end]
@@ -0,0 +1,60 @@
+from itertools import islice
+from operator import itemgetter
+
+
+class Notes(dict):
+    """Notes of a record by ID, kept in ID order.
+
+    New IDs come from `next_id`, a counter that only grows: adding a note
+    is constant time and the ID of a removed note is never given out again.
+    Notes stored under an explicit ID (loading, journal replay) move the
+    counter past it. The counter is saved together with the record.
+    """
+
+    __slots__ = ("next_id",)
+
+    def __init__(self, notes=(), next_id: int = 1):
+        super().__init__()
+        self.next_id = next_id
+        self.update(notes)
+
+    def __reduce__(self):
+        return type(self), (list(self.items()), self.next_id)
+
+    def __setitem__(self, note_id: int, note):
+        if note_id in self or not self or note_id > next(reversed(self)):
+            super().__setitem__(note_id, note)
+        else:
+            # An ID below the newest one only comes from loaded data, re-sort once
+            items = sorted([*self.items(), (note_id, note)], key=itemgetter(0))
+            super().clear()
+            super().update(items)
+        if note_id >= self.next_id:
+            self.next_id = note_id + 1
+
+    def update(self, notes=(), **kwargs):
+        for note_id, note in notes.items() if isinstance(notes, dict) else notes:
+            self[note_id] = note
+        if kwargs:
+            raise TypeError("Note IDs must be integers")
+
+    def setdefault(self, note_id: int, note=None):
+        if note_id not in self:
+            self[note_id] = note
+        return self[note_id]
+
+    def add(self, note) -> int:
+        """Store `note` under the next ID and return the ID."""
+        note_id = self.next_id
+        self[note_id] = note
+        return note_id
+
+    def range(self, start: int, stop: int) -> dict:
+        """Notes with `start <= id < stop`, in ID order."""
+        if stop - start <= len(self):
+            return {note_id: self[note_id] for note_id in range(start, stop) if note_id in self}
+        return {note_id: note for note_id, note in self.items() if start <= note_id < stop}
+
+    def latest(self, count: int) -> dict:
+        """The `count` most recently added notes, in ID order."""
+        return dict(reversed(list(islice(reversed(self.items()), max(count, 0)))))
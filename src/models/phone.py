@@ -1,7 +1,29 @@
-import re
-
 from src.models.field import Field
 
+# Separators dropped from a phone number: whitespace, dash, dot, parentheses.
+# U+3000 (ideographic space) is the last whitespace character.
+SEPARATORS = str.maketrans(
+    {char: None for char in map(chr, range(0x3001)) if char.isspace() or char in "().-"}
+)
+
+
+def normalize_phone(phone_number: str) -> str | None:
+    """Digits of a phone number, or None if it is not 10-15 ASCII digits.
+
+    Separators and an optional leading '+' are allowed. A number that is
+    already only digits is returned as is without building a copy. Other
+    Unicode digits (superscripts, fullwidth, ...) are rejected, stored
+    numbers must survive the integer encoding of the binary format.
+    """
+    phone_number = phone_number.strip()
+    if not (phone_number.isdigit() and phone_number.isascii()):
+        phone_number = phone_number.translate(SEPARATORS)
+        if phone_number.startswith("+"):
+            phone_number = phone_number[1:]
+        if not (phone_number.isdigit() and phone_number.isascii()):
+            return None
+    return phone_number if 10 <= len(phone_number) <= 15 else None
+
 
 def is_valid_phone_regex(phone_number: str) -> bool:
     """Validate phone number format. Allows 10-15 digits with optional separators and leading '+'.
@@ -15,44 +37,26 @@ def is_valid_phone_regex(phone_number: str) -> bool:
 
     if not isinstance(phone_number, str):
         return False
-
-    phone_number = phone_number.strip()
-    if not phone_number:
-        return False
-
-    # Remove common separators: space, dash, dot, parentheses
-    cleaned = re.sub(r"[()\s.-]", "", phone_number)
-
-    # Optional leading '+'
-    if cleaned.startswith("+"):
-        cleaned = cleaned[1:]
-
-    if not cleaned.isdigit():
-        return False
-
-    return 10 <= len(cleaned) <= 15
+    return normalize_phone(phone_number) is not None
 
 
 class Phone(Field):
     """Represents a phone number field with validation."""
 
+    __slots__ = ()
+
     @Field.value.setter
     def value(self, phone_raw: str):
         if not isinstance(phone_raw, str):
             raise ValueError("Phone number must be a string")
 
-        phone_raw = phone_raw.strip()
-        if not phone_raw:
+        if not phone_raw or phone_raw.isspace():
             raise ValueError("Phone number cannot be empty")
 
-        if not is_valid_phone_regex(phone_raw):
+        digits_only = normalize_phone(phone_raw)
+        if digits_only is None:
             raise ValueError("Invalid phone number format")
 
-        digits_only = "".join(ch for ch in phone_raw if ch.isdigit())
-
-        if len(digits_only) < 10:
-            raise ValueError("Phone number must contain at least 10 digits")
-
         self._value = digits_only
 
     def __str__(self):
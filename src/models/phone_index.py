@@ -0,0 +1,141 @@
+from array import array
+from bisect import bisect_left, insort
+
+from src.utils.gc_pause import gc_paused
+
+
+class PhoneIndex:
+    """Index of normalized phone digits for exact, prefix, suffix and substring lookups.
+
+    Every distinct number gets an integer ID. Prefix and suffix lookups
+    bisect sorted lists of the numbers and of their reversed digits.
+    Substring lookups take the IDs listed under the rarest 4-digit gram of
+    the keyword and check only those numbers. Postings are compact arrays;
+    IDs of removed numbers are skipped and dropped on the next rebuild.
+    """
+
+    GRAM = 4
+
+    def __init__(self, records=()):
+        self._owners = {}  # digits -> set of contact names
+        self._ids = {}  # digits -> ID
+        self._phones = []  # ID -> digits, None once removed
+        self._grams = {}  # gram -> array of IDs
+        self._sorted = []
+        self._reversed = []
+        self._dead = 0
+
+        with gc_paused():
+            for record in records:
+                for phone in record.phones:
+                    self._add_owner(phone.value, record.name.value)
+        self._sorted = sorted(self._owners)
+        self._reversed = sorted(digits[::-1] for digits in self._owners)
+
+    def __len__(self):
+        return len(self._owners)
+
+    def add(self, digits: str, name: str):
+        if self._add_owner(digits, name):
+            insort(self._sorted, digits)
+            insort(self._reversed, digits[::-1])
+
+    def remove(self, digits: str, name: str):
+        owners = self._owners.get(digits)
+        if owners is None:
+            return
+        owners.discard(name)
+        if owners:
+            return
+
+        del self._owners[digits]
+        self._phones[self._ids.pop(digits)] = None
+        self._dead += 1
+        self._remove_sorted(self._sorted, digits)
+        self._remove_sorted(self._reversed, digits[::-1])
+        if self._dead > len(self._owners):
+            self._rebuild_grams()
+
+    def exact(self, digits: str) -> list[str]:
+        """Names of contacts that have exactly this number."""
+        return sorted(self._owners.get(digits, ()))
+
+    def prefix(self, digits: str) -> list[str]:
+        """Names of contacts with a number starting with `digits`."""
+        return self._names(self._range(self._sorted, digits))
+
+    def suffix(self, digits: str) -> list[str]:
+        """Names of contacts with a number ending with `digits`."""
+        return self._names(phone[::-1] for phone in self._range(self._reversed, digits[::-1]))
+
+    def substring(self, digits: str) -> list[str]:
+        """Names of contacts with a number containing `digits`."""
+        if len(digits) < self.GRAM:
+            return self._names(phone for phone in self._sorted if digits in phone)
+
+        postings = []
+        for i in range(len(digits) - self.GRAM + 1):
+            ids = self._grams.get(digits[i:i + self.GRAM])
+            if ids is None:
+                return []
+            postings.append(ids)
+
+        phones = self._phones
+        candidates = (phones[phone_id] for phone_id in min(postings, key=len))
+        return self._names(sorted(phone for phone in candidates if phone is not None and digits in phone))
+
+    def estimate(self, digits: str) -> int:
+        """Upper bound of the number of numbers `substring` checks for `digits`."""
+        if len(digits) < self.GRAM:
+            return len(self._owners)
+        return min(len(self._grams.get(digits[i:i + self.GRAM], ())) for i in range(len(digits) - self.GRAM + 1))
+
+    def _add_owner(self, digits: str, name: str) -> bool:
+        """Register `name` as an owner of `digits`; True if the number is new."""
+        owners = self._owners.get(digits)
+        if owners is not None:
+            owners.add(name)
+            return False
+
+        self._owners[digits] = {name}
+        phone_id = self._ids[digits] = len(self._phones)
+        self._phones.append(digits)
+        self._index_grams(digits, phone_id)
+        return True
+
+    def _index_grams(self, digits: str, phone_id: int):
+        grams = self._grams
+        for gram in {digits[i:i + self.GRAM] for i in range(len(digits) - self.GRAM + 1)}:
+            ids = grams.get(gram)
+            if ids is None:
+                grams[gram] = array("I", (phone_id,))
+            else:
+                ids.append(phone_id)
+
+    def _rebuild_grams(self):
+        live = [digits for digits in self._phones if digits is not None]
+        self._phones, self._ids, self._grams, self._dead = [], {}, {}, 0
+        for digits in live:
+            phone_id = self._ids[digits] = len(self._phones)
+            self._phones.append(digits)
+            self._index_grams(digits, phone_id)
+
+    @staticmethod
+    def _range(values: list[str], prefix: str) -> list[str]:
+        start = bisect_left(values, prefix)
+        # "\x7f" sorts after every digit, so this is the end of the prefix range
+        return values[start:bisect_left(values, prefix + "\x7f", start)]
+
+    @staticmethod
+    def _remove_sorted(values: list[str], value: str):
+        index = bisect_left(values, value)
+        if index < len(values) and values[index] == value:
+            del values[index]
+
+    def _names(self, phones) -> list[str]:
+        """Owners of `phones` without duplicates, in the order of the numbers."""
+        names = {}
+        for phone in phones:
+            for name in sorted(self._owners[phone]):
+                names[name] = None
+        return list(names)
@@ -0,0 +1,263 @@
+import re
+import shlex
+import time
+from datetime import date
+from typing import NamedTuple
+
+from src.constants import REGEX_DATE_FORMAT, REGEX_SHORT_DATE_FORMAT
+from src.models.note_index import NoteIndex, tokenize
+
+# MM, DD.MM or DD.MM.YYYY
+BIRTHDAY_FILTER_REGEX = re.compile(r"^(\d{1,2})(?:\.(\d{1,2})(?:\.(\d{4}))?)?$")
+
+
+class PlanStep(NamedTuple):
+    filter: str
+    method: str  # "index", "check" or "scan"
+    estimate: int
+    rows: int
+    ms: float
+
+
+class Filter:
+    """One `field:value` condition of a query.
+
+    `estimate` is an upper bound of the contacts an index lookup returns, or
+    None when the field has no index. `lookup` returns matching names through
+    the index and `matches` checks a single record.
+    """
+
+    field = None
+
+    def __init__(self, value: str):
+        self.value = value
+
+    def __str__(self):
+        return f"{self.field}:{self.value}"
+
+    def estimate(self, book) -> int | None:
+        return None
+
+    def lookup(self, book) -> set[str]:
+        raise NotImplementedError
+
+    def matches(self, record) -> bool:
+        raise NotImplementedError
+
+
+class NameFilter(Filter):
+    field = "name"
+
+    def __init__(self, value: str):
+        super().__init__(value)
+        self._folded = value.casefold()
+
+    def estimate(self, book) -> int:
+        return book.name_index.estimate(self.value)
+
+    def lookup(self, book) -> set[str]:
+        return set(book.name_index.search(self.value))
+
+    def matches(self, record) -> bool:
+        return self._folded in record.name.value.casefold()
+
+
+class PhoneFilter(Filter):
+    field = "phone"
+
+    def __init__(self, value: str):
+        digits = "".join(ch for ch in value if ch.isdigit())
+        if not digits:
+            raise ValueError("Phone filter must contain digits")
+        super().__init__(digits)
+
+    def estimate(self, book) -> int:
+        return book.phone_index.estimate(self.value)
+
+    def lookup(self, book) -> set[str]:
+        return set(book.phone_index.substring(self.value))
+
+    def matches(self, record) -> bool:
+        return any(self.value in phone.value for phone in record.phones)
+
+
+class EmailFilter(Filter):
+    field = "email"
+
+    def __init__(self, value: str):
+        super().__init__(value)
+        self._folded = value.casefold()
+
+    def matches(self, record) -> bool:
+        return record.email is not None and self._folded in record.email.value.casefold()
+
+
+class BirthdayFilter(Filter):
+    field = "bday"
+
+    def __init__(self, value: str):
+        super().__init__(value)
+        match = BIRTHDAY_FILTER_REGEX.match(value)
+        if match is None:
+            raise ValueError("Birthday filter must be MM, DD.MM or DD.MM.YYYY")
+
+        first, second, year = match.groups()
+        if second is None:
+            self.day, self.month = None, int(first)
+        else:
+            self.day, self.month = int(first), int(second)
+        self.year = int(year) if year else None
+        try:
+            date(self.year or 2000, self.month, self.day or 1)
+        except ValueError:
+            raise ValueError(f"Invalid date in birthday filter '{value}'")
+
+    def estimate(self, book) -> int:
+        return book.birthday_index.count(self.month, self.day)
+
+    def lookup(self, book) -> set[str]:
+        names = book.birthday_index.names(self.month, self.day)
+        if self.year is None:
+            return names
+        return {name for name in names if book.data[name].birthday.value.year == self.year}
+
+    def matches(self, record) -> bool:
+        if record.birthday is None:
+            return False
+        birthday = record.birthday.value
+        return (
+            birthday.month == self.month
+            and self.day in (None, birthday.day)
+            and self.year in (None, birthday.year)
+        )
+
+
+class TagFilter(Filter):
+    field = "tag"
+
+    def estimate(self, book) -> int:
+        return book.tag_index.count(self.value)
+
+    def lookup(self, book) -> set[str]:
+        return {name for name, _ in book.tag_index.notes(self.value)}
+
+    def matches(self, record) -> bool:
+        return any(note.has_tag(self.value) for note in record.notes.values())
+
+
+class NoteFilter(Filter):
+    field = "note"
+
+    def __init__(self, value: str):
+        super().__init__(value)
+        self._groups = NoteIndex.parse(value)
+        if not self._groups:
+            raise ValueError("Note filter must contain words")
+
+    def estimate(self, book) -> int:
+        return book.note_index.estimate(self.value)
+
+    def lookup(self, book) -> set[str]:
+        return {hit.name for hit in book.search_notes(self.value)}
+
+    def matches(self, record) -> bool:
+        for note in record.notes.values():
+            tokens = set(tokenize(note.value))
+            for group in self._groups:
+                if all(
+                    any(token.startswith(term) for token in tokens) if prefix else term in tokens
+                    for term, prefix in group
+                ):
+                    return True
+        return False
+
+
+FILTERS = {
+    cls.field: cls
+    for cls in (NameFilter, PhoneFilter, EmailFilter, BirthdayFilter, TagFilter, NoteFilter)
+}
+FIELD_REGEX = re.compile(rf"^({'|'.join(FILTERS)}):")
+
+
+def is_query(text: str) -> bool:
+    """True if `text` has at least one `field:value` filter."""
+    return any(FIELD_REGEX.match(word) for word in text.split())
+
+
+class Query:
+    """A structured query such as `name:ann tag:work bday:11 email:@corp.com`.
+
+    Every filter must match. Words without a field are guessed the way
+    `AddressBook.search` does: dates are birthdays, numbers are phones and
+    anything else is a name. Quote values with spaces: `note:"call mom"`.
+
+    The planner starts from the filter whose index promises the fewest
+    contacts. Each next filter either intersects its own index lookup, when
+    that is expected to be smaller than the candidates left, or is checked
+    against the remaining records one by one. Fields without an index, like
+    email, are always checked.
+    """
+
+    def __init__(self, filters: list[Filter]):
+        self.filters = filters
+
+    @classmethod
+    def parse(cls, text: str) -> "Query":
+        try:
+            words = shlex.split(text)
+        except ValueError:
+            raise ValueError("Unbalanced quotes in query")
+
+        filters = []
+        for word in words:
+            field, separator, value = word.partition(":")
+            if separator and field.isalpha():
+                if field not in FILTERS:
+                    raise ValueError(f"Unknown field '{field}', use one of: {', '.join(FILTERS)}")
+                if not value:
+                    raise ValueError(f"Please provide a value for '{field}:'")
+                filters.append(FILTERS[field](value))
+            else:
+                filters.append(cls._guess(word))
+
+        if not filters:
+            raise ValueError("Query is empty")
+        return cls(filters)
+
+    @staticmethod
+    def _guess(word: str) -> Filter:
+        if re.match(REGEX_DATE_FORMAT, word) or re.match(REGEX_SHORT_DATE_FORMAT, word):
+            return BirthdayFilter(word)
+        if word.isnumeric():
+            return PhoneFilter(word)
+        return NameFilter(word)
+
+    def run(self, book) -> tuple[list[str], list[PlanStep]]:
+        """Names of matching contacts in book order, and the executed plan steps."""
+        planned = []
+        for position, condition in enumerate(self.filters):
+            estimate = condition.estimate(book)
+            indexed = estimate is not None
+            planned.append((not indexed, estimate if indexed else len(book), position, condition))
+        planned.sort(key=lambda item: item[:3])
+
+        candidates = None
+        steps = []
+        for unindexed, estimate, _, condition in planned:
+            start = time.perf_counter()
+            if candidates is None and unindexed:
+                method = "scan"
+                candidates = {name for name, record in book.data.items() if condition.matches(record)}
+            elif candidates is None or (not unindexed and estimate <= len(candidates)):
+                method = "index"
+                names = condition.lookup(book)
+                candidates = names if candidates is None else candidates & names
+            else:
+                method = "check"
+                candidates = {name for name in candidates if condition.matches(book.data[name])}
+            elapsed = (time.perf_counter() - start) * 1000
+            steps.append(PlanStep(str(condition), method, estimate, len(candidates), elapsed))
+            if not candidates:
+                break
+
+        return book.name_index.sort(candidates), steps
@@ -0,0 +1,76 @@
+from collections import OrderedDict
+from typing import NamedTuple
+
+from src.constants import QUERY_CACHE_SIZE
+
+# Query fields each record mutation can change. Anything else, like adding
+# or deleting a record, changes "name", which every cached result depends on.
+OPERATION_FIELDS = {
+    "add_phone": ("phone",),
+    "remove_phone": ("phone",),
+    "edit_phone": ("phone",),
+    "add_birthday": ("bday",),
+    "add_email": ("email",),
+    "edit_email": ("email",),
+    "add_note": ("note",),
+    "edit_note": ("note", "tag"),
+    "remove_note": ("note", "tag"),
+    "add_tags_to_note": ("tag",),
+    "remove_tag_from_note": ("tag",),
+}
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class QueryCache:
+    """Bounded LRU cache of query results, invalidated per query field.
+
+    Every field ("name", "phone", "bday", ...) has a version that a mutation
+    of that field bumps. An entry stores the versions of the fields its
+    result was computed from and only counts as a hit while they are all
+    unchanged, so adding a phone keeps cached note searches valid.
+    """
+
+    def __init__(self, maxsize: int = QUERY_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (field versions, result)
+        self._versions = {}  # field -> version
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, fields: tuple[str, ...], compute):
+        """Cached result for `key`, calling `compute()` if it is missing or stale."""
+        versions = tuple(self._versions.get(field, 0) for field in ("name", *fields))
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == versions:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        result = compute()
+        if self.maxsize > 0:
+            self._entries[key] = (versions, result)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def invalidate(self, op: str):
+        """Make results that depend on fields changed by `op` stale."""
+        for field in OPERATION_FIELDS.get(op, ("name",)):
+            self._versions[field] = self._versions.get(field, 0) + 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, len(self._entries), self.maxsize)
@@ -1,42 +1,92 @@
+from datetime import date
+
+from src.models.binary_codec import BinaryReader, BinaryWriter
 from src.models.name import Name
 from src.models.phone import Phone
 from src.models.birthday import Birthday
 from src.models.note import Note
+from src.models.notes import Notes
 from src.models.email import Email
+from src.models.record_view import RecordView
 
 
 class Record:
     """Represents a contact record with name, phones, birthday, email, and notes."""
 
+    __slots__ = ("name", "phones", "birthday", "notes", "email", "generation", "_listener")
+
     def __init__(self, name):
         self.name = Name(name)
         self.phones = []
         self.birthday = None
-        self.notes = {}
+        self.notes = Notes()
         self.email = None
+        self.generation = 0
+        self._listener = None
+
+    def __getstate__(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__ if slot != "_listener"}
+
+    def __setstate__(self, state):
+        # Pickles written before records had slots hold a plain __dict__
+        self.generation = 0
+        for slot, value in state.items():
+            if slot in self.__slots__:
+                setattr(self, slot, value)
+        # Older pickles keep notes in a plain dict without an ID counter
+        if not isinstance(self.notes, Notes):
+            self.notes = Notes(self.notes)
+        self._listener = None
+
+    def _notify(self, op: str, *args):
+        """Count a mutation and report it to the address book that owns this record."""
+        self.generation += 1
+        if self._listener is not None:
+            self._listener(self, op, args)
+
+    def add_phone(self, phone: str, trusted: bool = False):
+        """Add a phone number to the record.
 
-    def add_phone(self, phone: str):
-        """Add a phone number to the record."""
+        `trusted` skips validation for digits that were already normalized.
+        """
         match_phone = self.find_phone(phone)
         if match_phone is None:
-            self.phones.append(Phone(phone))
+            new_phone = Phone.trusted(phone) if trusted else Phone(phone)
+            self.phones.append(new_phone)
+            self._notify("add_phone", new_phone.value)
 
-    def add_birthday(self, birthday):
-        """Set birthday for the record."""
-        self.birthday = Birthday(birthday)
+    def add_birthday(self, birthday, trusted: bool = False):
+        """Set birthday for the record.
+
+        With `trusted` the birthday is an already parsed date.
+        """
+        self.birthday = Birthday.trusted(birthday) if trusted else Birthday(birthday)
+        self._notify("add_birthday", str(self.birthday))
 
     def remove_phone(self, phone):
         """Remove a phone number from the record."""
         match_phone = self.find_phone(phone)
         if match_phone:
             self.phones.remove(match_phone)
+            self._notify("remove_phone", match_phone.value)
 
     def edit_phone(self, phone, new_phone):
-        """Edit an existing phone number."""
+        """Edit an existing phone number.
+
+        Like `add_phone`, a number the record already has is not added twice:
+        the old number is only removed then.
+        """
         match_phone = self.find_phone(phone)
         if match_phone:
+            new_phone = Phone(new_phone)
+            if new_phone.value == match_phone.value:
+                return
+            if self.find_phone(new_phone.value) is not None:
+                self.remove_phone(match_phone.value)
+                return
             index = self.phones.index(match_phone)
-            self.phones[index] = Phone(new_phone)
+            self.phones[index] = new_phone
+            self._notify("edit_phone", match_phone.value, new_phone.value)
 
     def find_phone(self, target_phone):
         """Find a phone number in the record."""
@@ -47,18 +97,28 @@ class Record:
 
         return None
 
-    def add_email(self, email: str):
-        """Set email for the record."""
-        self.email = Email(email)
+    def add_email(self, email: str, trusted: bool = False):
+        """Set email for the record, `trusted` skips validation."""
+        self.email = Email.trusted(email) if trusted else Email(email)
+        self._notify("add_email", self.email.value)
 
     def edit_email(self, new_email: str):
         """Edit email address."""
         self.email = Email(new_email)
+        self._notify("edit_email", self.email.value)
+
+    def add_note(self, note, note_id=None):
+        """Add a note to the record.
 
-    def add_note(self, note):
-        """Add a note to the record."""
-        next_id = max(self.notes.keys(), default=0) + 1
-        self.notes[next_id] = Note(note)
+        The ID is allocated automatically unless given explicitly
+        (used when replaying a journal). Allocated IDs are never reused,
+        even after the newest note is removed.
+        """
+        if note_id is None:
+            note_id = self.notes.add(Note(note))
+        else:
+            self.notes[note_id] = Note(note)
+        self._notify("add_note", self.notes[note_id].value, note_id)
 
     def edit_note(self, note_id, new_value):
         """Edit an existing note by ID."""
@@ -66,6 +126,7 @@ class Record:
             raise KeyError(f"Note with id {note_id} not found")
 
         self.notes[note_id] = Note(new_value)
+        self._notify("edit_note", note_id, self.notes[note_id].value)
 
     def remove_note(self, note_id):
         """Remove a note by ID."""
@@ -73,6 +134,7 @@ class Record:
             raise KeyError(f"Note with id {note_id} not found")
 
         del self.notes[note_id]
+        self._notify("remove_note", note_id)
 
     def add_tags_to_note(self, note_id, tag: list[str]):
         """Add tags to a note."""
@@ -80,6 +142,7 @@ class Record:
             raise KeyError(f"Note with id {note_id} not found")
 
         self.notes[note_id].add_tags(tag)
+        self._notify("add_tags_to_note", note_id, list(tag))
 
     def remove_tag_from_note(self, note_id, tag: str):
         """Remove a tag from a note."""
@@ -87,15 +150,99 @@ class Record:
             raise KeyError(f"Note with id {note_id} not found")
 
         self.notes[note_id].remove_tag(tag)
+        self._notify("remove_tag_from_note", note_id, tag)
+
+    def find_note_by_tag(self, tag: str) -> str:
+        """Show the record with only the notes tagged with `tag`."""
+        return str(self.view(note_id for note_id, note in self.notes.items() if note.has_tag(tag)))
+
+    def view(self, note_ids) -> RecordView:
+        """Read-only view of the record showing only the notes with `note_ids`."""
+        return RecordView(self, note_ids)
 
-    def find_note_by_tag(self, tag: str) -> {Note}:
-        """Find all notes by tag."""
-        matched_notes = {}
+    def to_dict(self) -> dict:
+        """Convert the record into plain data (used by storage backends)."""
+        return {
+            "name": self.name.value,
+            "phones": [phone.value for phone in self.phones],
+            "email": self.email.value if self.email else None,
+            "birthday": str(self.birthday) if self.birthday else None,
+            "notes": [
+                {
+                    "id": note_id,
+                    "text": note.value,
+                    "tags": note.tag_values(),
+                }
+                for note_id, note in self.notes.items()
+            ],
+            "next_note_id": self.notes.next_id,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Record":
+        """Build a record from plain data produced by `to_dict`."""
+        record = cls(data["name"])
+        for phone in data.get("phones", []):
+            record.add_phone(phone)
+        if data.get("email"):
+            record.add_email(data["email"])
+        if data.get("birthday"):
+            record.add_birthday(data["birthday"])
+        for note in data.get("notes", []):
+            record.add_note(note["text"], note["id"])
+            if note.get("tags"):
+                record.add_tags_to_note(note["id"], note["tags"])
+        record.notes.next_id = max(record.notes.next_id, data.get("next_note_id", 1))
+        return record
+
+    def write_binary(self, writer: BinaryWriter):
+        """Encode the record into the binary address book format."""
+        writer.write_str(self.name.value)
+
+        writer.write_uint(len(self.phones))
+        for phone in self.phones:
+            # Digit count keeps leading zeros, the digits go as one integer
+            writer.write_uint(len(phone.value))
+            writer.write_uint(int(phone.value))
+
+        writer.write_str(self.email.value if self.email else "")
+        writer.write_uint(self.birthday.value.toordinal() if self.birthday else 0)
+
+        writer.write_uint(len(self.notes))
         for note_id, note in self.notes.items():
-            for note_tag in note.get_tags():
-                if note_tag.value == tag:
-                    matched_notes[note_id] = note
-        return self.show_info(matched_notes)
+            writer.write_uint(note_id)
+            writer.write_str(note.value)
+            tags = note.tag_values()
+            writer.write_uint(len(tags))
+            for tag in tags:
+                writer.write_tag(tag)
+        writer.write_uint(self.notes.next_id)
+
+    @classmethod
+    def read_binary(cls, reader: BinaryReader) -> "Record":
+        """Decode a record written by `write_binary`."""
+        record = cls(reader.read_str())
+
+        for _ in range(reader.read_uint()):
+            digits_count = reader.read_uint()
+            record.phones.append(Phone.trusted(str(reader.read_uint()).zfill(digits_count)))
+
+        email = reader.read_str()
+        if email:
+            record.email = Email.trusted(email)
+        ordinal = reader.read_uint()
+        if ordinal:
+            record.birthday = Birthday.trusted(date.fromordinal(ordinal))
+
+        for _ in range(reader.read_uint()):
+            note_id = reader.read_uint()
+            note = Note.trusted(reader.read_str())
+            note.add_tags([reader.read_tag() for _ in range(reader.read_uint())])
+            record.notes[note_id] = note
+        if reader.version >= 2:
+            record.notes.next_id = max(record.notes.next_id, reader.read_uint())
+
+        return record
 
     def get_formatered_notes(self, notes) -> str:
         """Format notes for display."""
@@ -0,0 +1,77 @@
+from collections.abc import Mapping
+
+
+class NoteSubset(Mapping):
+    """Read-only mapping of some notes of a record, note ID -> note text.
+
+    The notes are looked up in the record on access, so a note removed
+    from the record also disappears from the subset.
+    """
+
+    __slots__ = ("_notes", "_note_ids", "_id_set")
+
+    def __init__(self, notes: dict, note_ids: tuple, id_set: frozenset):
+        self._notes = notes
+        self._note_ids = note_ids
+        self._id_set = id_set
+
+    def __getitem__(self, note_id) -> str:
+        if note_id not in self._id_set:
+            raise KeyError(note_id)
+        return self._notes[note_id].value
+
+    def __iter__(self):
+        notes = self._notes
+        return (note_id for note_id in self._note_ids if note_id in notes)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+class RecordView:
+    """Read-only view of a record that shows only some of its notes.
+
+    Search results are views instead of copies: nothing is copied per hit.
+    Fields are returned as plain values (strings and a date), never as the
+    record's field objects, so a view cannot change the record. It renders
+    through `Record.show_info` like the record itself.
+    """
+
+    __slots__ = ("_record", "_note_ids", "_id_set")
+
+    def __init__(self, record, note_ids):
+        self._record = record
+        self._note_ids = tuple(note_ids)
+        self._id_set = frozenset(self._note_ids)
+
+    @property
+    def record(self):
+        """The viewed record."""
+        return self._record
+
+    @property
+    def name(self) -> str:
+        return self._record.name.value
+
+    @property
+    def phones(self) -> tuple[str, ...]:
+        return tuple(phone.value for phone in self._record.phones)
+
+    @property
+    def email(self) -> str | None:
+        email = self._record.email
+        return email.value if email else None
+
+    @property
+    def birthday(self):
+        """Birthday as a date, or None."""
+        birthday = self._record.birthday
+        return birthday.value if birthday else None
+
+    @property
+    def notes(self) -> NoteSubset:
+        return NoteSubset(self._record.notes, self._note_ids, self._id_set)
+
+    def __str__(self):
+        notes = self._record.notes
+        return self._record.show_info({note_id: notes[note_id] for note_id in self._note_ids if note_id in notes})
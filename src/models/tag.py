@@ -1,6 +1,70 @@
+import threading
+import weakref
+
 from src.models.field import Field
 
 
 class Tag(Field):
     """Represents a tag for organizing notes."""
-    pass
+    __slots__ = ()
+
+
+class TagSet(dict):
+    """Shared set of tag IDs, a dict with None values ordered by tag."""
+
+    __slots__ = ("__weakref__",)
+
+
+class TagTable:
+    """Intern table from tag strings to small integer IDs.
+
+    Notes store their tags as a set of IDs. Sets are interned as well:
+    every note with the same tags shares one set, so a repeated tag costs a
+    reference instead of a `Tag` object and its string. Shared sets must
+    never be mutated, `tag_set` returns the interned set for a new
+    combination instead. A set no note refers to any more is dropped.
+
+    Background compactions load notes while the command loop edits them,
+    so interning is guarded by a lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ids = {}  # tag -> id
+        self._tags = []  # id -> tag
+        self._sets = weakref.WeakValueDictionary()  # frozenset of ids -> shared TagSet
+
+    def __len__(self):
+        return len(self._tags)
+
+    def intern(self, tag: str) -> int:
+        """ID of `tag`, assigning the next one on first use."""
+        tag_id = self._ids.get(tag)
+        if tag_id is None:
+            with self._lock:
+                tag_id = self._ids.get(tag)
+                if tag_id is None:
+                    tag_id = len(self._tags)
+                    self._tags.append(tag)
+                    self._ids[tag] = tag_id
+        return tag_id
+
+    def id(self, tag: str) -> int | None:
+        """ID of `tag`, or None if no note was ever tagged with it."""
+        return self._ids.get(tag)
+
+    def tag(self, tag_id: int) -> str:
+        return self._tags[tag_id]
+
+    def tag_set(self, tag_ids) -> TagSet:
+        """The shared set of `tag_ids`, ordered by tag."""
+        key = frozenset(tag_ids)
+        with self._lock:
+            tag_set = self._sets.get(key)
+            if tag_set is None:
+                tag_set = self._sets[key] = TagSet.fromkeys(sorted(key, key=self._tags.__getitem__))
+        return tag_set
+
+
+# Notes exist outside of a book (and in several books), so they share one table
+tag_table = TagTable()
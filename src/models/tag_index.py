@@ -0,0 +1,51 @@
+class TagIndex:
+    """Index from tags to the notes that carry them across all contacts."""
+
+    def __init__(self, records=()):
+        self._notes = {}  # tag -> set of (name, note_id)
+        self._tags = {}  # (name, note_id) -> set of tags
+        for record in records:
+            self.add_record(record)
+
+    def add(self, name: str, note_id: int, tags):
+        note = (name, note_id)
+        for tag in tags:
+            self._tags.setdefault(note, set()).add(tag)
+            self._notes.setdefault(tag, set()).add(note)
+
+    def remove(self, name: str, note_id: int, tag: str):
+        note = (name, note_id)
+        tags = self._tags.get(note)
+        if tags is None or tag not in tags:
+            return
+        tags.discard(tag)
+        if not tags:
+            del self._tags[note]
+        notes = self._notes[tag]
+        notes.discard(note)
+        if not notes:
+            del self._notes[tag]
+
+    def remove_note(self, name: str, note_id: int):
+        for tag in list(self._tags.get((name, note_id), ())):
+            self.remove(name, note_id, tag)
+
+    def add_record(self, record):
+        for note_id, note in record.notes.items():
+            self.add(record.name.value, note_id, note.tag_values())
+
+    def remove_record(self, record):
+        for note_id in record.notes:
+            self.remove_note(record.name.value, note_id)
+
+    def notes(self, tag: str) -> list[tuple[str, int]]:
+        """(contact name, note id) pairs of notes tagged with `tag`."""
+        return sorted(self._notes.get(tag, ()))
+
+    def count(self, tag: str) -> int:
+        """Number of notes tagged with `tag`."""
+        return len(self._notes.get(tag, ()))
+
+    def counts(self) -> list[tuple[str, int]]:
+        """(tag, number of notes) pairs, most used tags first."""
+        return sorted(((tag, len(notes)) for tag, notes in self._notes.items()), key=lambda item: (-item[1], item[0]))
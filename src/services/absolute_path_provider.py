@@ -1,12 +1,14 @@
 from pathlib import Path
 
 
-def get_absolute_path() -> str:
-    """Get absolute path to address book cache file."""
-    user_dir = Path.home()
-
-    cache_folder = user_dir / "AddressBookCache"
+def get_cache_folder() -> Path:
+    """Get the folder that holds all address book data files."""
+    cache_folder = Path.home() / "AddressBookCache"
     cache_folder.mkdir(exist_ok=True)  # Create if not existing
+    return cache_folder
 
-    file_path = cache_folder / "address_book.pkl"
+
+def get_absolute_path(file_name: str = "address_book.pkl") -> str:
+    """Get absolute path to address book cache file."""
+    file_path = get_cache_folder() / file_name
     return str(file_path)
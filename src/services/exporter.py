@@ -0,0 +1,86 @@
+import csv
+import json
+import time
+
+from src.models import AddressBook, Record
+from src.services.file_formats import detect_format, open_text, vcard_escape
+
+CSV_COLUMNS = ["name", "phone", "email", "birthday"]
+
+
+class ExportReport:
+    """Summary of an export."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.records = 0
+        self.seconds = 0.0
+
+
+def csv_row(record: Record) -> list[str]:
+    """CSV row in the same layout the importer reads."""
+    return [
+        record.name.value,
+        ";".join(phone.value for phone in record.phones),
+        record.email.value if record.email else "",
+        str(record.birthday) if record.birthday else "",
+    ]
+
+
+def vcard_lines(record: Record) -> list[str]:
+    """vCard 3.0 lines describing one record."""
+    lines = ["BEGIN:VCARD", "VERSION:3.0", f"FN:{vcard_escape(record.name.value)}"]
+    lines += [f"TEL:{phone.value}" for phone in record.phones]
+    if record.email:
+        lines.append(f"EMAIL:{record.email.value}")
+    if record.birthday:
+        lines.append(f"BDAY:{record.birthday.value.strftime('%Y-%m-%d')}")
+    lines += [f"NOTE:{vcard_escape(note.value)}" for note in record.notes.values()]
+    lines.append("END:VCARD")
+    return lines
+
+
+def _write_csv(f, records):
+    writer = csv.writer(f)
+    writer.writerow(CSV_COLUMNS)
+    for record in records:
+        writer.writerow(csv_row(record))
+        yield
+
+
+def _write_jsonl(f, records):
+    for record in records:
+        f.write(json.dumps(record.to_dict(), ensure_ascii=False))
+        f.write("\n")
+        yield
+
+
+def _write_vcard(f, records):
+    for record in records:
+        f.write("\r\n".join(vcard_lines(record)))
+        f.write("\r\n")
+        yield
+
+
+WRITERS = {"csv": _write_csv, "jsonl": _write_jsonl, "vcard": _write_vcard}
+
+
+def export_file(
+    book: AddressBook, path: str, file_format: str | None = None, compress: bool | None = None
+) -> ExportReport:
+    """Write every record to a CSV, JSONL or vCard file one record at a time.
+
+    Records are rendered as they are read from the book, so memory use does
+    not depend on the book size. Paths ending with '.gz' are gzipped unless
+    `compress` says otherwise.
+    """
+    write = WRITERS[detect_format(path, file_format)]
+    report = ExportReport(path)
+    start = time.perf_counter()
+
+    with open_text(path, "w", compress) as f:
+        for _ in write(f, book.iter_records()):
+            report.records += 1
+
+    report.seconds = time.perf_counter() - start
+    return report
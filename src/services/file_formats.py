@@ -0,0 +1,62 @@
+import gzip
+from pathlib import Path
+
+FORMATS = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".vcf": "vcard",
+    ".vcard": "vcard",
+}
+
+
+def detect_format(path: str, file_format: str | None = None) -> str:
+    """Pick the file format from an explicit name or the file extension."""
+    if file_format is not None:
+        file_format = file_format.lower()
+        if file_format not in FORMATS.values():
+            raise ValueError(f"Unknown format '{file_format}'. Use csv, jsonl or vcard")
+        return file_format
+
+    path = Path(path)
+    if path.suffix.lower() == ".gz":
+        path = path.with_suffix("")
+    suffix = path.suffix.lower()
+    if suffix not in FORMATS:
+        raise ValueError(f"Can't detect format of '{path}'. Use csv, jsonl or vcard")
+    return FORMATS[suffix]
+
+
+def open_text(path: str, mode: str = "r", compress: bool | None = None):
+    """Open a text file, using gzip for '.gz' paths or when `compress` is set.
+
+    Reading skips a UTF-8 byte order mark, as written by Excel.
+    """
+    if compress is None:
+        compress = str(path).lower().endswith(".gz")
+    encoding = "utf-8-sig" if "r" in mode else "utf-8"
+    if compress:
+        return gzip.open(path, mode + "t", encoding=encoding, newline="")
+    return open(path, mode, encoding=encoding, newline="")
+
+
+def vcard_escape(value: str) -> str:
+    """Escape a vCard text value."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace("\n", "\\n")
+        .replace(",", "\\,")
+        .replace(";", "\\;")
+    )
+
+
+def vcard_unescape(value: str) -> str:
+    """Undo `vcard_escape`."""
+    result = []
+    chars = iter(value)
+    for ch in chars:
+        if ch == "\\":
+            ch = next(chars, "")
+            result.append("\n" if ch in ("n", "N") else ch)
+        else:
+            result.append(ch)
+    return "".join(result)
@@ -0,0 +1,207 @@
+import csv
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from src.constants import IMPORT_CHUNK_SIZE
+from src.models import AddressBook, Record
+from src.models.birthday import Birthday
+from src.models.email import Email
+from src.models.phone import Phone
+from src.services.file_formats import detect_format, open_text, vcard_unescape
+
+
+class ImportReport:
+    """Summary of a bulk import."""
+
+    def __init__(self):
+        self.rows = 0
+        self.added = 0
+        self.updated = 0
+        self.errors = []  # (line number, message)
+        self.seconds = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+def _split_phones(value) -> list[str]:
+    if not value:
+        return []
+    return [phone for phone in (p.strip() for p in value.split(";")) if phone]
+
+
+def read_csv(path: str):
+    """Yield (line number, row) pairs from a CSV file with a header row.
+
+    Expected columns are name, phone (several numbers separated by ';'),
+    email and birthday (DD.MM.YYYY).
+    """
+    with open_text(path) as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            row = {(key or "").strip().lower(): value for key, value in row.items()}
+            yield reader.line_num, {
+                "name": row.get("name"),
+                "phones": _split_phones(row.get("phone") or row.get("phones")),
+                "email": row.get("email"),
+                "birthday": row.get("birthday"),
+            }
+
+
+def read_jsonl(path: str):
+    """Yield (line number, row) pairs from a file with one JSON object per line."""
+    with open_text(path) as f:
+        for line_num, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                yield line_num, None
+                continue
+            if isinstance(row, dict) and "phones" not in row:
+                phone = row.get("phone")
+                # Anything but a string is left for `_validate_row` to reject
+                row["phones"] = _split_phones(phone) if isinstance(phone, str) else phone
+            yield line_num, row
+
+
+def _vcard_date(value: str) -> str:
+    """Convert a vCard date (YYYY-MM-DD or YYYYMMDD) to DD.MM.YYYY."""
+    digits = value.replace("-", "")
+    if len(digits) == 8 and digits.isdigit():
+        return f"{digits[6:8]}.{digits[4:6]}.{digits[0:4]}"
+    return value
+
+
+def read_vcard(path: str):
+    """Yield (line number, row) pairs from a vCard file, one per card."""
+    with open_text(path) as f:
+        row, start = None, 0
+        for line_num, line in enumerate(f, 1):
+            line = line.strip()
+            upper = line.upper()
+            if upper == "BEGIN:VCARD":
+                row, start = {"name": None, "phones": [], "email": None, "birthday": None}, line_num
+            elif upper == "END:VCARD" and row is not None:
+                yield start, row
+                row = None
+            elif row is not None and ":" in line:
+                key, value = line.split(":", 1)
+                # Drop parameters (TEL;TYPE=cell) and groups (item1.EMAIL)
+                key = key.split(";")[0].split(".")[-1].upper()
+                if key == "FN":
+                    row["name"] = vcard_unescape(value)
+                elif key == "TEL":
+                    row["phones"].append(value)
+                elif key == "EMAIL" and not row["email"]:
+                    row["email"] = value
+                elif key == "BDAY":
+                    row["birthday"] = _vcard_date(value)
+
+
+READERS = {"csv": read_csv, "jsonl": read_jsonl, "vcard": read_vcard}
+
+
+def _validate_row(row) -> dict:
+    if not isinstance(row, dict):
+        raise ValueError("Malformed row")
+
+    name = (row.get("name") or "").strip()
+    if not name:
+        raise ValueError("Name is required")
+
+    phones = row.get("phones") or []
+    if not isinstance(phones, list) or not all(isinstance(phone, str) for phone in phones):
+        raise ValueError("Phones must be a list of strings")
+
+    return {
+        "name": name,
+        "phones": [Phone(phone).value for phone in phones],
+        "email": Email(row["email"]).value if row.get("email") else None,
+        "birthday": Birthday(row["birthday"]).value if row.get("birthday") else None,
+    }
+
+
+def validate_chunk(chunk: list) -> list:
+    """Validate (line number, row) pairs; runs in worker processes."""
+    results = []
+    for line_num, row in chunk:
+        try:
+            results.append((line_num, _validate_row(row), None))
+        except (ValueError, TypeError, AttributeError) as e:
+            results.append((line_num, None, str(e) or "Invalid value"))
+    return results
+
+
+def _validated_chunks(rows, workers: int):
+    chunks = iter(lambda: list(islice(rows, IMPORT_CHUNK_SIZE)), [])
+    first = next(chunks, None)
+    if first is None:
+        return
+
+    # Starting processes is not worth it for a single chunk
+    if workers <= 1 or len(first) < IMPORT_CHUNK_SIZE:
+        yield validate_chunk(first)
+        for chunk in chunks:
+            yield validate_chunk(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Keep a bounded number of chunks in flight so memory stays flat
+        pending = deque([executor.submit(validate_chunk, first)])
+        for chunk in chunks:
+            pending.append(executor.submit(validate_chunk, chunk))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _merge(book: AddressBook, data: dict) -> bool:
+    """Merge a validated row into the book like `add` does; True if the contact is new."""
+    record = book.find(data["name"])
+    added = record is None
+    if added:
+        record = Record(data["name"])
+        book.add_record(record)
+
+    for phone in data["phones"]:
+        record.add_phone(phone, trusted=True)
+    if data["email"]:
+        record.add_email(data["email"], trusted=True)
+    if data["birthday"]:
+        record.add_birthday(data["birthday"], trusted=True)
+    return added
+
+
+def import_file(
+    book: AddressBook, path: str, file_format: str | None = None, workers: int | None = None
+) -> ImportReport:
+    """Stream contacts from a CSV, JSONL or vCard file (optionally gzipped) into the book.
+
+    Rows are validated in chunks across `workers` processes (all cores by
+    default) and merged into the book in file order.
+    """
+    reader = READERS[detect_format(path, file_format)]
+    workers = workers or os.cpu_count() or 1
+    report = ImportReport()
+    start = time.perf_counter()
+
+    for results in _validated_chunks(reader(path), workers):
+        for line_num, data, message in results:
+            report.rows += 1
+            if data is None:
+                report.errors.append((line_num, message))
+            elif _merge(book, data):
+                report.added += 1
+            else:
+                report.updated += 1
+
+    report.seconds = time.perf_counter() - start
+    return report
@@ -0,0 +1,27 @@
+from .storage import Storage
+from .pickle_storage import PickleStorage
+from .file_lock import FileLock
+from .shared_pickle_storage import SharedPickleStorage
+from .background_saver import BackgroundSaver
+from .binary_storage import BinaryStorage
+from .journal_storage import JournalStorage
+from .delta_storage import DeltaStorage
+from .sqlite_storage import SqliteStorage
+from .lazy_record_map import LazyRecordMap
+from .lazy_storage import LazyStorage
+from .factory import create_storage
+
+__all__ = [
+    "Storage",
+    "PickleStorage",
+    "FileLock",
+    "SharedPickleStorage",
+    "BackgroundSaver",
+    "BinaryStorage",
+    "JournalStorage",
+    "DeltaStorage",
+    "SqliteStorage",
+    "LazyRecordMap",
+    "LazyStorage",
+    "create_storage",
+]
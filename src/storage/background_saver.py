@@ -0,0 +1,127 @@
+import threading
+import time
+
+from src.constants import SAVE_DELAY, SAVE_RETRY_DELAY
+from src.models import AddressBook
+from src.storage.pickle_storage import PickleStorage
+from src.storage.storage import Storage
+
+
+class BackgroundSaver(Storage):
+    """Writes the book on a worker thread once mutations settle down.
+
+    Every `save` call only (re)schedules a write `delay` seconds later, so a
+    burst of commands ends in a single write. The worker serializes the book
+    while holding `lock`, which the command loop holds while a command runs,
+    and then writes the bytes outside of it.
+
+    A failed write is stored in `last_error` and the book stays pending, so
+    it is tried again after `SAVE_RETRY_DELAY` and by `flush` and `close`,
+    which raise if it still fails.
+    """
+
+    def __init__(self, storage: PickleStorage, delay: float = SAVE_DELAY):
+        self.storage = storage
+        self.delay = delay
+        self.lock = threading.RLock()
+        self.last_error = None
+
+        self._cond = threading.Condition()
+        self._pending = None
+        self._due = 0.0
+        self._writing = False
+        self._closed = False
+
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def load(self) -> AddressBook:
+        """Load the address book from the wrapped storage."""
+        return self.storage.load()
+
+    @property
+    def load_warning(self) -> str | None:
+        return self.storage.load_warning
+
+    def save(self, book: AddressBook):
+        """Schedule a write of the book after the configured delay."""
+        with self._cond:
+            self._pending = book
+            self._due = time.monotonic() + self.delay
+            self._cond.notify_all()
+
+    def refresh(self, book: AddressBook) -> tuple[set, set]:
+        """Pick up changes saved by other sessions, see `Storage.refresh`."""
+        with self.lock:
+            return self.storage.refresh(book)
+
+    def compact(self, book: AddressBook) -> bool:
+        """Write pending changes, then compact the wrapped storage."""
+        self.flush()
+        with self.lock:
+            return self.storage.compact(book)
+
+    def flush(self):
+        """Wait for a write in progress, then write a pending book on the calling thread."""
+        with self._cond:
+            while self._writing:
+                self._cond.wait()
+            book, self._pending = self._pending, None
+        if book is not None:
+            try:
+                self._write(book)
+            except Exception:
+                self._keep_pending(book)
+                raise
+            self.last_error = None
+
+    def close(self):
+        """Stop the worker, waiting for its write, and write anything still pending."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._worker.join()
+        try:
+            self.flush()
+        finally:
+            self.storage.close()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                # After `close` the final write is left to its `flush`
+                if self._closed:
+                    return
+
+                remaining = self._due - time.monotonic()
+                if remaining > 0 and not self._closed:
+                    self._cond.wait(remaining)
+                    continue
+                book, self._pending = self._pending, None
+                self._writing = True
+
+            try:
+                self._write(book)
+            except Exception as e:
+                self.last_error = e
+                self._keep_pending(book)
+            else:
+                self.last_error = None
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()
+
+    def _write(self, book: AddressBook):
+        self.storage.save_consistent(book, self.lock)
+
+    def _keep_pending(self, book: AddressBook):
+        """Put back a book whose write failed, unless a newer save replaced it."""
+        with self._cond:
+            if self._pending is None:
+                self._pending = book
+                self._due = time.monotonic() + max(self.delay, SAVE_RETRY_DELAY)
@@ -0,0 +1,37 @@
+import os
+import time
+
+from src.models import AddressBook
+from src.storage.pickle_storage import PickleStorage
+
+
+class BinaryStorage(PickleStorage):
+    """Stores the whole address book in the compact binary format.
+
+    A file that can't be decoded is renamed to `<path>.damaged-<time>` and
+    reported through `load_warning`, so the next save can't overwrite it.
+    """
+
+    def __init__(self, path: str, legacy_path: str | None = None, fsync: bool = True):
+        super().__init__(path, fsync)
+        self.legacy_path = legacy_path
+
+    def load(self) -> AddressBook:
+        """Load address book from the binary file, importing the pickle cache once."""
+        try:
+            with open(self.path, "rb") as f:
+                return AddressBook.from_bytes(f.read())
+        except FileNotFoundError:
+            pass
+        except ValueError as e:
+            damaged_path = f"{self.path}.damaged-{time.strftime('%Y%m%d-%H%M%S')}"
+            os.replace(self.path, damaged_path)
+            self.load_warning = f"Can't read {self.path} ({e}), it was moved to {damaged_path}"
+            return AddressBook()
+
+        legacy = self._read_legacy()
+        return legacy if legacy is not None else AddressBook()
+
+    def dumps(self, book: AddressBook) -> bytes:
+        """Serialize the address book into the binary format."""
+        return book.to_bytes()
@@ -0,0 +1,243 @@
+import json
+import lzma
+import os
+import re
+import threading
+import time
+import zlib
+from pathlib import Path
+
+from src.constants import DELTA_COMPACT_COUNT, DELTA_FLUSH_INTERVAL
+from src.models import AddressBook
+from src.storage.mutations import apply_event, encode_event
+from src.storage.storage import Storage
+
+MANIFEST_VERSION = 1
+# Deltas smaller than this never trigger a compaction by size
+MIN_COMPACT_BYTES = 64 * 1024
+FILE_REGEX = re.compile(r"^(snapshot|delta)\.(\d+)\.")
+
+# File suffix -> (compress, decompress)
+CODECS = {
+    ".xz": (lzma.compress, lzma.decompress),
+    ".z": (zlib.compress, zlib.decompress),
+}
+
+
+class DeltaStorage(Storage):
+    """Stores a compressed full snapshot plus compressed per-session delta files.
+
+    The snapshot holds the book in the binary format. A session collects its
+    mutations and writes them into a new, immutable delta file on `close` and
+    `flush`, and from a timer `flush_interval` seconds after the previous
+    delta when a save left mutations unwritten. `manifest.json` lists the snapshot and the deltas to
+    apply on top of it and is replaced atomically, so files it does not
+    mention are leftovers of an interrupted save and are ignored. Because
+    files never change once written, a backup only has to copy the new ones.
+
+    `compact` starts a background thread that folds the deltas written so far
+    into a new snapshot, rebuilt from the files rather than the live book. It
+    also starts on save once there are more than `max_deltas` deltas or they
+    outgrow the snapshot.
+    """
+
+    def __init__(
+        self,
+        folder,
+        legacy_path: str | None = None,
+        snapshot_compression: str = ".xz",
+        delta_compression: str = ".z",
+        max_deltas: int = DELTA_COMPACT_COUNT,
+        flush_interval: float = DELTA_FLUSH_INTERVAL,
+    ):
+        for suffix in (snapshot_compression, delta_compression):
+            if suffix not in CODECS:
+                raise ValueError(f"Unknown compression '{suffix}'")
+
+        self.folder = Path(folder)
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.folder / "manifest.json"
+        self.legacy_path = legacy_path
+        self.snapshot_compression = snapshot_compression
+        self.delta_compression = delta_compression
+        self.max_deltas = max_deltas
+        self.flush_interval = flush_interval
+
+        # Held while a command runs, so the flush timer never sees half a command
+        self.lock = threading.RLock()
+        # Guards the manifest and the files it lists against the compaction thread
+        self._lock = threading.Lock()
+        self._manifest = None
+        self._pending = []
+        self._last_delta = time.monotonic()
+        self._timer = None
+        self._compaction = None
+
+    def load(self) -> AddressBook:
+        """Load the newest snapshot and apply the deltas listed in the manifest."""
+        self._manifest = self._read_manifest()
+        if self._manifest is None:
+            # First start in delta mode: import the plain pickle cache
+            book = self._read_legacy()
+            if book is None:
+                book = AddressBook()
+            self._manifest = {"version": MANIFEST_VERSION, "seq": 0, "snapshot": None, "deltas": []}
+            self._write_snapshot(book)
+        else:
+            book = AddressBook.from_bytes(self._read_file(self._manifest["snapshot"]))
+            for name in self._manifest["deltas"]:
+                for event in json.loads(self._read_file(name)):
+                    apply_event(book, event)
+
+        self._pending = []
+        self._last_delta = time.monotonic()
+        book.subscribe(self._record_event)
+        return book
+
+    def save(self, book: AddressBook):
+        """Write collected mutations as a delta, or schedule it for the end of the flush interval."""
+        remaining = self._last_delta + self.flush_interval - time.monotonic()
+        if remaining > 0:
+            if self._pending and (self._timer is None or not self._timer.is_alive()):
+                self._timer = threading.Timer(remaining, self._timed_flush)
+                self._timer.daemon = True
+                self._timer.start()
+            return
+        self.flush()
+
+        with self._lock:
+            delta_bytes = self._delta_bytes()
+            too_big = delta_bytes > MIN_COMPACT_BYTES and delta_bytes > self._snapshot_bytes()
+            too_many = len(self._manifest["deltas"]) > self.max_deltas
+        if too_many or too_big:
+            self.compact(book)
+
+    def flush(self):
+        """Write mutations collected since the last delta as a new delta file."""
+        with self.lock:
+            self._last_delta = time.monotonic()
+            if not self._pending:
+                return
+
+            events, self._pending = self._pending, []
+            try:
+                data = json.dumps(events, ensure_ascii=False).encode("utf-8")
+                with self._lock:
+                    name = self._write_file("delta", self.delta_compression, data)
+                    self._write_manifest(deltas=self._manifest["deltas"] + [name])
+            except BaseException:
+                self._pending = events + self._pending
+                raise
+
+    def compact(self, book: AddressBook | None = None) -> bool:
+        """Start folding the deltas written so far into a new snapshot in the background."""
+        self.flush()
+        if self._compaction is not None and self._compaction.is_alive():
+            return True
+
+        with self._lock:
+            snapshot, deltas = self._manifest["snapshot"], list(self._manifest["deltas"])
+        if not deltas:
+            return True
+
+        self._compaction = threading.Thread(target=self._compact, args=(snapshot, deltas), daemon=True)
+        self._compaction.start()
+        return True
+
+    def close(self):
+        """Write the session's delta and wait for the flush timer and a running compaction."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer.join()
+        try:
+            self.flush()
+        finally:
+            if self._compaction is not None:
+                self._compaction.join()
+
+    def _timed_flush(self):
+        try:
+            self.flush()
+        except Exception as e:
+            # The mutations stay pending for the next save, flush or close
+            self.last_error = e
+
+    def _compact(self, snapshot: str, deltas: list[str]):
+        try:
+            book = AddressBook.from_bytes(self._read_file(snapshot))
+            for name in deltas:
+                for event in json.loads(self._read_file(name)):
+                    apply_event(book, event)
+            data = book.to_bytes()
+
+            with self._lock:
+                seq = self._next_seq()
+            name = self._write_file("snapshot", self.snapshot_compression, data, seq)
+            with self._lock:
+                # Deltas written while the snapshot was built stay on top of it
+                remaining = [delta for delta in self._manifest["deltas"] if delta not in deltas]
+                self._write_manifest(snapshot=name, deltas=remaining)
+                self._remove_unlisted_files()
+        except Exception as e:
+            # The old snapshot and deltas are still listed, the next compaction tries again
+            self.last_error = e
+
+    def _record_event(self, op: str, name: str, args: tuple):
+        # Encode right away: later mutations change the objects in `args`
+        self._pending.append(encode_event(op, name, args))
+
+    def _write_snapshot(self, book: AddressBook):
+        name = self._write_file("snapshot", self.snapshot_compression, book.to_bytes())
+        self._write_manifest(snapshot=name, deltas=[])
+        self._remove_unlisted_files()
+
+    def _read_manifest(self) -> dict | None:
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return None
+        if manifest.get("version") != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported manifest version {manifest.get('version')}")
+        return manifest
+
+    def _write_manifest(self, **changes):
+        manifest = {**self._manifest, **changes}
+        self._replace(self.manifest_path, json.dumps(manifest, indent=2).encode("utf-8"))
+        self._manifest = manifest
+
+    def _read_file(self, name: str) -> bytes:
+        path = self.folder / name
+        _, decompress = CODECS[path.suffix]
+        return decompress(path.read_bytes())
+
+    def _next_seq(self) -> int:
+        self._manifest["seq"] += 1
+        return self._manifest["seq"]
+
+    def _write_file(self, kind: str, suffix: str, data: bytes, seq: int | None = None) -> str:
+        seq = seq or self._next_seq()
+        name = f"{kind}.{seq:06d}{suffix}"
+        compress, _ = CODECS[suffix]
+        self._replace(self.folder / name, compress(data))
+        return name
+
+    def _replace(self, path: Path, data: bytes):
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _remove_unlisted_files(self):
+        listed = {self._manifest["snapshot"], *self._manifest["deltas"]}
+        for path in self.folder.iterdir():
+            if FILE_REGEX.match(path.name) and path.name not in listed:
+                path.unlink()
+
+    def _delta_bytes(self) -> int:
+        return sum((self.folder / name).stat().st_size for name in self._manifest["deltas"])
+
+    def _snapshot_bytes(self) -> int:
+        return (self.folder / self._manifest["snapshot"]).stat().st_size
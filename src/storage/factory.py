@@ -0,0 +1,63 @@
+import os
+
+from src.constants import (
+    STORAGE_MODE_ENV,
+    DEFAULT_STORAGE_MODE,
+    SAVE_DELAY_ENV,
+    SAVE_DELAY,
+    FSYNC_ENV,
+    DEFAULT_FSYNC_POLICY,
+)
+from src.services import absolute_path_provider
+from src.storage.storage import Storage
+from src.storage.shared_pickle_storage import SharedPickleStorage
+from src.storage.background_saver import BackgroundSaver
+from src.storage.binary_storage import BinaryStorage
+from src.storage.journal_storage import JournalStorage
+from src.storage.delta_storage import DeltaStorage
+from src.storage.sqlite_storage import SqliteStorage
+from src.storage.lazy_storage import LazyStorage
+
+
+def create_storage(mode: str | None = None) -> Storage:
+    """Create the storage backend selected by `mode` or the JARVIS_STORAGE variable."""
+    mode = mode or os.environ.get(STORAGE_MODE_ENV, DEFAULT_STORAGE_MODE)
+
+    if mode in ("pickle", "binary"):
+        fsync_policy = os.environ.get(FSYNC_ENV, DEFAULT_FSYNC_POLICY)
+        if fsync_policy not in ("always", "never"):
+            raise ValueError(f"Unknown fsync policy '{fsync_policy}'")
+        fsync = fsync_policy == "always"
+        delay = float(os.environ.get(SAVE_DELAY_ENV, SAVE_DELAY))
+
+        if mode == "pickle":
+            storage = SharedPickleStorage(absolute_path_provider.get_absolute_path(), fsync=fsync)
+        else:
+            storage = BinaryStorage(
+                absolute_path_provider.get_absolute_path("address_book.bin"),
+                legacy_path=absolute_path_provider.get_absolute_path(),
+                fsync=fsync,
+            )
+        return BackgroundSaver(storage, delay=delay)
+    if mode == "journal":
+        return JournalStorage(
+            absolute_path_provider.get_cache_folder() / "journal",
+            legacy_path=absolute_path_provider.get_absolute_path(),
+        )
+    if mode == "delta":
+        return DeltaStorage(
+            absolute_path_provider.get_cache_folder() / "delta",
+            legacy_path=absolute_path_provider.get_absolute_path(),
+        )
+    if mode == "sqlite":
+        return SqliteStorage(
+            absolute_path_provider.get_absolute_path("address_book.sqlite3"),
+            legacy_path=absolute_path_provider.get_absolute_path(),
+        )
+    if mode == "lazy":
+        return LazyStorage(
+            absolute_path_provider.get_cache_folder() / "lazy",
+            legacy_path=absolute_path_provider.get_absolute_path(),
+        )
+
+    raise ValueError(f"Unknown storage mode '{mode}'")
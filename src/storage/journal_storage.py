@@ -0,0 +1,173 @@
+import json
+import os
+import pickle
+import re
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+from src.constants import JOURNAL_COMPACT_THRESHOLD
+from src.models import AddressBook
+from src.storage.mutations import apply_event, encode_event
+from src.storage.storage import Storage
+
+SEGMENT_REGEX = re.compile(r"^journal\.(\d+)\.log$")
+
+
+class JournalStorage(Storage):
+    """Stores a snapshot plus an append-only log of mutations.
+
+    Every mutation is appended to the active journal segment as one JSON line.
+    When the journal grows past `compact_threshold` bytes the active segment is
+    frozen and a background thread folds it into a new snapshot. The snapshot
+    remembers the last segment it contains, so a crash at any point never
+    replays a mutation twice.
+    """
+
+    def __init__(
+        self,
+        folder,
+        legacy_path: str | None = None,
+        compact_threshold: int = JOURNAL_COMPACT_THRESHOLD,
+    ):
+        self.folder = Path(folder)
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self.snapshot_path = self.folder / "snapshot.pkl"
+        self.legacy_path = legacy_path
+        self.compact_threshold = compact_threshold
+
+        self._lock = threading.Lock()
+        self._segment = None
+        self._seq = 0
+        self._journal_size = 0
+        self._unsynced = False
+        self._bulk = False
+        self._compaction = None
+
+    def load(self) -> AddressBook:
+        """Load the latest snapshot and replay the journal on top of it."""
+        snapshot_seq, book = self._read_snapshot()
+
+        self._journal_size = 0
+        last_seq = snapshot_seq
+        for seq, path in self._segments():
+            if seq <= snapshot_seq:
+                continue
+            self._replay(book, path)
+            self._journal_size += path.stat().st_size
+            last_seq = seq
+
+        self._open_segment(last_seq + 1)
+        book.subscribe(self._append)
+        return book
+
+    def save(self, book: AddressBook):
+        """Sync the journal to disk and compact it when it grew too large."""
+        with self._lock:
+            if self._segment is not None and self._unsynced:
+                os.fsync(self._segment.fileno())
+                self._unsynced = False
+
+        if self._journal_size >= self.compact_threshold:
+            self.compact()
+
+    def compact(self, book: AddressBook | None = None) -> bool:
+        """Start folding the journal into a new snapshot in the background."""
+        if self._compaction is not None and self._compaction.is_alive():
+            return True
+
+        with self._lock:
+            frozen_seq = self._seq
+            self._open_segment(frozen_seq + 1)
+            self._journal_size = 0
+
+        self._compaction = threading.Thread(
+            target=self._compact, args=(frozen_seq,), daemon=True
+        )
+        self._compaction.start()
+        return True
+
+    @contextmanager
+    def bulk(self):
+        """Buffer journal lines written inside the block and flush them once."""
+        self._bulk = True
+        try:
+            yield
+        finally:
+            self._bulk = False
+            with self._lock:
+                self._segment.flush()
+
+    def close(self):
+        """Wait for a running compaction and close the active segment."""
+        if self._compaction is not None:
+            self._compaction.join()
+        with self._lock:
+            if self._segment is not None:
+                self._segment.close()
+                self._segment = None
+
+    def _append(self, op: str, name: str, args: tuple):
+        line = json.dumps(encode_event(op, name, args), ensure_ascii=False) + "\n"
+        with self._lock:
+            self._segment.write(line)
+            if not self._bulk:
+                self._segment.flush()
+            self._journal_size += len(line.encode("utf-8"))
+            self._unsynced = True
+
+    def _open_segment(self, seq: int):
+        if self._segment is not None:
+            self._segment.close()
+        self._seq = seq
+        self._segment = open(self._segment_path(seq), "a", encoding="utf-8")
+
+    def _segment_path(self, seq: int) -> Path:
+        return self.folder / f"journal.{seq:06d}.log"
+
+    def _segments(self) -> list[tuple[int, Path]]:
+        segments = []
+        for path in self.folder.iterdir():
+            match = SEGMENT_REGEX.match(path.name)
+            if match:
+                segments.append((int(match.group(1)), path))
+        return sorted(segments)
+
+    def _read_snapshot(self) -> tuple[int, AddressBook]:
+        try:
+            with open(self.snapshot_path, "rb") as f:
+                snapshot = pickle.load(f)
+            return snapshot["seq"], snapshot["book"]
+        except (FileNotFoundError, pickle.UnpicklingError):
+            pass
+
+        # First start in journal mode: import the plain pickle cache
+        legacy = self._read_legacy()
+        return 0, legacy if legacy is not None else AddressBook()
+
+    def _replay(self, book: AddressBook, path: Path):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn write at the end of a segment after a crash
+                    break
+                apply_event(book, event)
+
+    def _compact(self, upto_seq: int):
+        snapshot_seq, book = self._read_snapshot()
+        for seq, path in self._segments():
+            if snapshot_seq < seq <= upto_seq:
+                self._replay(book, path)
+
+        tmp_path = self.snapshot_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"seq": upto_seq, "book": book}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+
+        for seq, path in self._segments():
+            if seq <= upto_seq:
+                path.unlink()
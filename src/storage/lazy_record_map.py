@@ -0,0 +1,102 @@
+from collections import OrderedDict
+from collections.abc import MutableMapping
+
+from src.constants import LAZY_CACHE_SIZE
+
+
+class LazyRecordMap(MutableMapping):
+    """Dict-like record container that reads records from disk on first access.
+
+    Only the name -> location index is kept in memory for every record. Loaded
+    records stay resident in an LRU of `capacity` entries; changed records are
+    pinned in memory until the storage writes them back.
+    """
+
+    def __init__(self, index: dict, loader, listener, capacity: int = LAZY_CACHE_SIZE):
+        self._index = index  # name -> location, None for records never written
+        self._loader = loader
+        self._listener = listener
+        self.capacity = capacity
+        self._resident = OrderedDict()
+        self._pinned = {}
+        self._deleted = {}  # name -> location of the deleted saved version
+
+    def __getitem__(self, name):
+        if name in self._pinned:
+            return self._pinned[name]
+
+        if name in self._resident:
+            self._resident.move_to_end(name)
+            return self._resident[name]
+
+        record = self._loader(self._index[name])
+        record._listener = self._on_change
+        self._resident[name] = record
+        if len(self._resident) > self.capacity:
+            self._resident.popitem(last=False)
+        return record
+
+    def __setitem__(self, name, record):
+        record._listener = self._on_change
+        self._index.setdefault(name, self._deleted.pop(name, None))
+        self._resident.pop(name, None)
+        self._pinned[name] = record
+
+    def __delitem__(self, name):
+        location = self._index.pop(name)
+        self._resident.pop(name, None)
+        self._pinned.pop(name, None)
+        if location is not None:
+            self._deleted[name] = location
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    @property
+    def resident_count(self) -> int:
+        """Number of records currently materialized in memory."""
+        return len(self._resident) + len(self._pinned)
+
+    def location(self, name: str):
+        """Where the saved version of a record lives, or None."""
+        return self._index.get(name)
+
+    def locations(self):
+        """Iterate over (name, location) pairs of all records."""
+        return self._index.items()
+
+    def changes(self) -> tuple[dict, dict]:
+        """Copies of the records changed and saved locations deleted since the last `clear_changes`."""
+        return dict(self._pinned), dict(self._deleted)
+
+    def clear_changes(self, changed: dict, deleted: dict):
+        """Forget changes returned by `changes` once they are written.
+
+        A record changed again in the meantime stays pinned.
+        """
+        for name, record in changed.items():
+            if self._pinned.get(name) is record:
+                del self._pinned[name]
+        for name in deleted:
+            self._deleted.pop(name, None)
+
+    def set_location(self, name: str, location, record=None):
+        """Remember where a record was written; the record becomes evictable."""
+        self._index[name] = location
+        if record is not None:
+            self._resident[name] = record
+            if len(self._resident) > self.capacity:
+                self._resident.popitem(last=False)
+
+    def _on_change(self, record, op: str, args: tuple):
+        name = record.name.value
+        if name in self._index:
+            self._resident.pop(name, None)
+            self._pinned[name] = record
+        self._listener(record, op, args)
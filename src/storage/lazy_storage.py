@@ -0,0 +1,183 @@
+import os
+import pickle
+from contextlib import suppress
+from pathlib import Path
+
+from src.constants import LAZY_CACHE_SIZE
+from src.models import AddressBook
+from src.storage.lazy_record_map import LazyRecordMap
+from src.storage.storage import Storage
+
+# Compact the data file once dead bytes exceed both limits
+COMPACT_MIN_DEAD_BYTES = 1024 * 1024
+COMPACT_DEAD_RATIO = 0.5
+# Fold index frames into one on startup once there are this many
+MAX_INDEX_FRAMES = 64
+
+
+class LazyStorage(Storage):
+    """Stores records as separate blobs so they can be loaded on demand.
+
+    `records.<n>.dat` holds pickled records appended one after another, and
+    `index.pkl` is a stream of pickled frames: the data file name followed by
+    dicts mapping names to (offset, length), or None for deleted records.
+    Startup reads only the index; records are unpickled when first accessed.
+    """
+
+    def __init__(self, folder, legacy_path: str | None = None, capacity: int = LAZY_CACHE_SIZE):
+        self.folder = Path(folder)
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.folder / "index.pkl"
+        self.legacy_path = legacy_path
+        self.capacity = capacity
+
+        self._data_name = None
+        self._data_file = None
+        self._index_file = None
+        self._dead_bytes = 0
+
+    def load(self) -> AddressBook:
+        """Read the name index and return a book that loads records lazily."""
+        imported = None
+        if self.index_path.exists():
+            index = self._read_index()
+        else:
+            index = {}
+            imported = self._read_legacy()
+            self._start_files("records.1.dat", index)
+
+        live_bytes = sum(length for _, length in index.values())
+        self._dead_bytes = os.path.getsize(self.folder / self._data_name) - live_bytes
+
+        book = AddressBook()
+        book.data = LazyRecordMap(index, self._read_record, book._on_record_change, self.capacity)
+
+        if imported is not None:
+            for record in imported.values():
+                book.data[record.name.value] = record
+            self.save(book)
+        return book
+
+    def save(self, book: AddressBook):
+        """Append changed records to the data file and their locations to the index."""
+        changed, deleted = book.data.changes()
+        if not changed and not deleted:
+            return
+
+        # Changes stay pending in the book until both files are synced
+        updates = {}
+        dead_bytes = 0
+        for name, (_, length) in deleted.items():
+            updates[name] = None
+            dead_bytes += length
+
+        self._data_file.seek(0, os.SEEK_END)
+        for name, record in changed.items():
+            old_location = book.data.location(name)
+            if old_location is not None:
+                dead_bytes += old_location[1]
+            blob = pickle.dumps(record, pickle.HIGHEST_PROTOCOL)
+            updates[name] = (self._data_file.tell(), len(blob))
+            self._data_file.write(blob)
+        self._sync(self._data_file)
+
+        try:
+            pickle.dump(updates, self._index_file, pickle.HIGHEST_PROTOCOL)
+            self._sync(self._index_file)
+        except BaseException:
+            # A torn frame would hide every frame appended after it
+            with suppress(OSError):
+                self._close_files()
+            saved = {name: location for name, location in book.data.locations() if location is not None}
+            self._start_files(self._data_name, saved)
+            raise
+
+        book.data.clear_changes(changed, deleted)
+        for name, record in changed.items():
+            book.data.set_location(name, updates[name], record)
+        self._dead_bytes += dead_bytes
+
+        data_size = self._data_file.tell()
+        if self._dead_bytes > COMPACT_MIN_DEAD_BYTES and self._dead_bytes > data_size * COMPACT_DEAD_RATIO:
+            self.compact(book)
+
+    def compact(self, book: AddressBook) -> bool:
+        """Rewrite the data file with live records only."""
+        number = int(self._data_name.split(".")[1]) + 1
+        new_name = f"records.{number}.dat"
+        index = {}
+        with open(self.folder / new_name, "wb") as new_file:
+            for name, (offset, length) in book.data.locations():
+                self._data_file.seek(offset)
+                index[name] = (new_file.tell(), length)
+                new_file.write(self._data_file.read(length))
+            self._sync(new_file)
+
+        old_name = self._data_name
+        self._close_files()
+        self._start_files(new_name, index)
+        for name, location in index.items():
+            book.data.set_location(name, location)
+        os.remove(self.folder / old_name)
+        self._dead_bytes = 0
+        return True
+
+    def close(self):
+        """Close the data and index files."""
+        self._close_files()
+
+    def _read_record(self, location):
+        offset, length = location
+        self._data_file.seek(offset)
+        return pickle.loads(self._data_file.read(length))
+
+    def _read_index(self) -> dict:
+        index = {}
+        frames = 0
+        with open(self.index_path, "rb") as f:
+            data_name = pickle.load(f)
+            while True:
+                try:
+                    updates = pickle.load(f)
+                except (EOFError, pickle.UnpicklingError):
+                    # End of file, or a frame torn by a crash
+                    break
+                frames += 1
+                for name, location in updates.items():
+                    if location is None:
+                        index.pop(name, None)
+                    else:
+                        index[name] = location
+            torn = f.tell() != os.fstat(f.fileno()).st_size
+
+        if frames > MAX_INDEX_FRAMES or torn:
+            # Rewrite the index as a single frame, dropping any torn tail
+            self._start_files(data_name, index)
+        else:
+            self._open_files(data_name)
+        return index
+
+    def _start_files(self, data_name: str, index: dict):
+        tmp_path = self.index_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(data_name, f, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(index, f, pickle.HIGHEST_PROTOCOL)
+            self._sync(f)
+        os.replace(tmp_path, self.index_path)
+        self._open_files(data_name)
+
+    def _open_files(self, data_name: str):
+        self._data_name = data_name
+        self._data_file = open(self.folder / data_name, "a+b")
+        self._index_file = open(self.index_path, "ab")
+
+    def _close_files(self):
+        for f in (self._data_file, self._index_file):
+            if f is not None:
+                f.close()
+        self._data_file = self._index_file = None
+
+    @staticmethod
+    def _sync(f):
+        f.flush()
+        os.fsync(f.fileno())
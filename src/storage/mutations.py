@@ -0,0 +1,40 @@
+from src.models import AddressBook, Record
+
+# Record methods that may be replayed from a stored mutation
+RECORD_OPERATIONS = {
+    "add_phone",
+    "remove_phone",
+    "edit_phone",
+    "add_birthday",
+    "add_email",
+    "edit_email",
+    "add_note",
+    "edit_note",
+    "remove_note",
+    "add_tags_to_note",
+    "remove_tag_from_note",
+}
+
+
+def encode_event(op: str, name: str, args: tuple) -> dict:
+    """Convert an address book mutation into JSON-friendly data."""
+    if op == "add_record":
+        args = (args[0].to_dict(),)
+    return {"op": op, "name": name, "args": list(args)}
+
+
+def apply_event(book: AddressBook, event: dict):
+    """Apply a mutation produced by `encode_event` to the address book."""
+    op, name, args = event["op"], event["name"], event["args"]
+
+    if op == "add_record":
+        book.add_record(Record.from_dict(args[0]))
+    elif op == "delete":
+        book.delete(name)
+    elif op in RECORD_OPERATIONS:
+        record = book.find(name)
+        if record is None:
+            raise KeyError(f"Record {name} not found")
+        getattr(record, op)(*args)
+    else:
+        raise ValueError(f"Unknown operation '{op}'")
@@ -0,0 +1,72 @@
+import os
+import pickle
+import threading
+from contextlib import nullcontext
+
+from src.models import AddressBook
+from src.storage.storage import Storage
+
+
+class PickleStorage(Storage):
+    """Stores the whole address book as a single pickle file."""
+
+    def __init__(self, path: str, fsync: bool = True):
+        self.path = path
+        self.fsync = fsync
+        self._write_lock = threading.Lock()
+
+    def load(self) -> AddressBook:
+        """Load address book from the pickle file."""
+        try:
+            with open(self.path, "rb") as f:
+                return pickle.load(f)
+        except (FileNotFoundError, pickle.UnpicklingError):
+            return AddressBook()
+
+    def save(self, book: AddressBook):
+        """Rewrite the pickle file with the whole address book."""
+        self.save_consistent(book, nullcontext())
+
+    def save_consistent(self, book: AddressBook, lock):
+        """Serialize the book while holding `lock`, then write it outside of it.
+
+        Writes are ordered by an internal lock taken together with `lock`,
+        so a later snapshot is never overwritten by an earlier one.
+        """
+        with lock:
+            self._acquire_write()
+            try:
+                payload = self._prepare(book)
+            except BaseException:
+                self._release_write()
+                raise
+        try:
+            self._commit(payload)
+        finally:
+            self._release_write()
+
+    def dumps(self, book: AddressBook) -> bytes:
+        """Serialize the address book."""
+        return pickle.dumps(book)
+
+    def write(self, data: bytes):
+        """Atomically replace the pickle file with serialized data."""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def _acquire_write(self):
+        self._write_lock.acquire()
+
+    def _release_write(self):
+        self._write_lock.release()
+
+    def _prepare(self, book: AddressBook):
+        return self.dumps(book)
+
+    def _commit(self, payload):
+        self.write(payload)
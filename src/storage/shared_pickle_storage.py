@@ -0,0 +1,271 @@
+import json
+import os
+import uuid
+
+from src.constants import SHARED_LOG_ROTATE_SIZE
+from src.models import AddressBook, Record
+from src.storage.file_lock import FileLock
+from src.storage.pickle_storage import PickleStorage
+
+
+class SharedPickleStorage(PickleStorage):
+    """Pickle storage that several sessions can use at the same time.
+
+    Every save takes an advisory lock, appends the contacts changed since
+    the previous save to a change log next to the pickle file and rewrites
+    the pickle. Each log entry carries a generation number, so a session
+    sees exactly which entries other sessions wrote since it last looked and
+    applies only those records instead of reloading the whole book.
+
+    Entries hold whole records, so replaying them is idempotent: loading
+    the pickle and replaying the log always gives the latest book, even if
+    a crash happened between appending to the log and writing the pickle.
+    When the same contact was changed in two sessions, the session saving
+    last keeps its version and the other one is told about the conflict.
+    """
+
+    def __init__(self, path: str, fsync: bool = True, log_rotate_size: int = SHARED_LOG_ROTATE_SIZE):
+        super().__init__(path, fsync=fsync)
+        self.log_path = f"{path}.log"
+        self.log_rotate_size = log_rotate_size
+        self.session_id = uuid.uuid4().hex
+        self.generation = 0
+
+        self._file_lock = FileLock(f"{path}.lock")
+        self._book = None
+        self._log_inode = None
+        self._log_base = None
+        self._log_offset = 0
+        self._changed = set()
+        # Results of syncs done while saving, reported by the next refresh
+        self._updated = set()
+        self._conflicts = set()
+        self._applying = False
+        # The pickle missed a write that failed after its log entry was appended
+        self._stale = False
+
+    def load(self) -> AddressBook:
+        """Load the pickle and replay the change log on top of it."""
+        with self._file_lock:
+            book = self._load_latest()
+        self._book = book
+        book.subscribe(self._on_change)
+        return book
+
+    def refresh(self, book: AddressBook) -> tuple[set, set]:
+        """Apply records other sessions saved since the last check.
+
+        When nothing was saved this costs a single `stat` call.
+        """
+        if self._log_unchanged() and not self._updated and not self._conflicts:
+            return set(), set()
+
+        was_dirty = book.is_dirty
+        self._acquire_write()
+        try:
+            updated, conflicts = self._sync(book)
+        finally:
+            self._release_write()
+        if not was_dirty:
+            book.mark_clean()
+
+        updated |= self._updated
+        conflicts |= self._conflicts
+        self._updated, self._conflicts = set(), set()
+        return updated, conflicts
+
+    def _acquire_write(self):
+        super()._acquire_write()
+        try:
+            self._file_lock.acquire()
+        except BaseException:
+            super()._release_write()
+            raise
+
+    def _release_write(self):
+        try:
+            self._file_lock.release()
+        finally:
+            super()._release_write()
+
+    def _prepare(self, book: AddressBook):
+        if book is not self._book:
+            # A book that was not loaded here: treat every record as changed
+            self._book = book
+            book.subscribe(self._on_change)
+            self._changed |= set(book.data)
+
+        was_dirty = book.is_dirty
+        updated, conflicts = self._sync(book)
+        self._updated |= updated
+        self._conflicts |= conflicts
+        if not was_dirty:
+            book.mark_clean()
+
+        names, self._changed = self._changed, set()
+        entry = None
+        if names:
+            self.generation += 1
+            entry = {
+                "gen": self.generation,
+                "session": self.session_id,
+                "upserts": [book.data[name].to_dict() for name in names if name in book.data],
+                "deletes": [name for name in names if name not in book.data],
+            }
+        data = self.dumps(book) if entry is not None or updated or self._stale else None
+        return entry, data, names
+
+    def _commit(self, payload):
+        entry, data, names = payload
+        if entry is not None:
+            try:
+                self._append(entry)
+            except BaseException:
+                # Nothing reached the log, the next save writes these contacts again
+                self._changed |= names
+                raise
+        if data is not None:
+            try:
+                self.write(data)
+            except BaseException:
+                self._stale = True
+                raise
+            self._stale = False
+            if self._log_offset >= self.log_rotate_size:
+                self._rotate_log()
+
+    def _on_change(self, op: str, name: str, args: tuple):
+        if not self._applying:
+            self._changed.add(name)
+
+    def _load_latest(self) -> AddressBook:
+        book = super().load()
+        self._log_inode, self._log_base, self._log_offset = None, None, 0
+        self.generation = 0
+
+        base, entries = self._read_new_entries()
+        if base is not None:
+            self.generation = base
+        for entry in entries:
+            self._apply(book, entry, protected=set())
+            self.generation = entry["gen"]
+        return book
+
+    def _sync(self, book: AddressBook) -> tuple[set, set]:
+        """Apply log entries of other sessions newer than our generation."""
+        base, entries = self._read_new_entries()
+        if base is not None and base > self.generation:
+            # The log was rotated past entries we have not seen yet
+            return self._reload(book)
+
+        updated, conflicts = set(), set()
+        for entry in entries:
+            if entry["gen"] <= self.generation:
+                continue
+            self.generation = entry["gen"]
+            if entry["session"] != self.session_id:
+                self._apply(book, entry, updated, conflicts)
+        return updated, conflicts
+
+    def _reload(self, book: AddressBook) -> tuple[set, set]:
+        latest = self._load_latest()
+        updated, conflicts = set(), set()
+        self._applying = True
+        try:
+            for name in set(book.data) | set(latest.data):
+                ours, theirs = book.data.get(name), latest.data.get(name)
+                if (ours.to_dict() if ours else None) == (theirs.to_dict() if theirs else None):
+                    continue
+                if name in self._changed:
+                    conflicts.add(name)
+                elif theirs is None:
+                    book.delete(name)
+                    updated.add(name)
+                else:
+                    book.add_record(theirs)
+                    updated.add(name)
+        finally:
+            self._applying = False
+        return updated, conflicts
+
+    def _apply(self, book: AddressBook, entry: dict, updated=None, conflicts=None, protected=None):
+        """Apply a log entry, skipping records with unsaved local changes."""
+        updated = set() if updated is None else updated
+        conflicts = set() if conflicts is None else conflicts
+        protected = self._changed if protected is None else protected
+
+        self._applying = True
+        try:
+            for data in entry["upserts"]:
+                if data["name"] in protected:
+                    conflicts.add(data["name"])
+                    continue
+                book.add_record(Record.from_dict(data))
+                updated.add(data["name"])
+            for name in entry["deletes"]:
+                if name in protected:
+                    conflicts.add(name)
+                    continue
+                book.delete(name)
+                updated.add(name)
+        finally:
+            self._applying = False
+
+    def _log_unchanged(self) -> bool:
+        try:
+            stat = os.stat(self.log_path)
+        except FileNotFoundError:
+            return self._log_inode is None
+        return stat.st_ino == self._log_inode and stat.st_size == self._log_offset
+
+    def _read_new_entries(self) -> tuple[int | None, list[dict]]:
+        """Read complete log lines written since the last read.
+
+        Returns the base generation of the log if it was rotated since the
+        last read (or is read for the first time) and the new entries.
+        """
+        try:
+            f = open(self.log_path, "rb")
+        except FileNotFoundError:
+            return None, []
+
+        with f:
+            log_base = json.loads(f.readline())["base"]
+            inode = os.fstat(f.fileno()).st_ino
+            rotated = (inode, log_base) != (self._log_inode, self._log_base)
+            if rotated:
+                self._log_inode, self._log_base, self._log_offset = inode, log_base, f.tell()
+            f.seek(self._log_offset)
+            data = f.read()
+
+        # A line without a newline is still being written by another session
+        end = data.rfind(b"\n") + 1
+        self._log_offset += end
+        entries = [json.loads(line) for line in data[:end].splitlines()]
+        return (log_base if rotated else None), entries
+
+    def _append(self, entry: dict):
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+        if self._log_inode is None:
+            self._write_log_header(self.generation - 1)
+        with open(self.log_path, "ab") as f:
+            f.write(line)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+            self._log_offset = f.tell()
+
+    def _rotate_log(self):
+        """Start an empty log once the pickle holds everything the old one did."""
+        self._write_log_header(self.generation)
+
+    def _write_log_header(self, base: int):
+        tmp_path = f"{self.log_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write((json.dumps({"base": base}) + "\n").encode("utf-8"))
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, self.log_path)
+        stat = os.stat(self.log_path)
+        self._log_inode, self._log_base, self._log_offset = stat.st_ino, base, stat.st_size
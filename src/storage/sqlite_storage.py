@@ -0,0 +1,274 @@
+import os
+import sqlite3
+from contextlib import contextmanager
+
+from src.models import AddressBook, Record
+from src.storage.storage import Storage
+
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    next_note_id INTEGER NOT NULL DEFAULT 1
+);
+CREATE TABLE IF NOT EXISTS phones (
+    record_id INTEGER NOT NULL REFERENCES records(id) ON DELETE CASCADE,
+    digits TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_phones_digits ON phones(digits);
+CREATE INDEX IF NOT EXISTS idx_phones_record ON phones(record_id);
+CREATE TABLE IF NOT EXISTS emails (
+    record_id INTEGER PRIMARY KEY REFERENCES records(id) ON DELETE CASCADE,
+    email TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS birthdays (
+    record_id INTEGER PRIMARY KEY REFERENCES records(id) ON DELETE CASCADE,
+    birthday TEXT NOT NULL,
+    month INTEGER NOT NULL,
+    day INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_birthdays_month_day ON birthdays(month, day);
+CREATE TABLE IF NOT EXISTS notes (
+    record_id INTEGER NOT NULL REFERENCES records(id) ON DELETE CASCADE,
+    note_id INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (record_id, note_id)
+);
+CREATE TABLE IF NOT EXISTS tags (
+    record_id INTEGER NOT NULL,
+    note_id INTEGER NOT NULL,
+    tag TEXT NOT NULL,
+    FOREIGN KEY (record_id, note_id) REFERENCES notes(record_id, note_id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_tags_note ON tags(record_id, note_id);
+"""
+
+
+class SqliteStorage(Storage):
+    """Stores the address book in an indexed SQLite database.
+
+    Every mutation of the loaded book is written right away as a small
+    transaction touching only the affected rows. A plain pickle cache found
+    at `legacy_path` is imported when the database is created.
+    """
+
+    def __init__(self, path: str, legacy_path: str | None = None):
+        self.path = path
+        self.legacy_path = legacy_path
+        self._conn = None
+        self._bulk = False
+
+    def load(self) -> AddressBook:
+        """Open the database and read all records into an address book."""
+        created = not os.path.exists(self.path)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        with self._conn:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            self._conn.executescript(SCHEMA)
+            if 0 < version < 2:
+                # Version 1 had no note ID counter, it starts after the highest note
+                self._conn.execute("ALTER TABLE records ADD COLUMN next_note_id INTEGER NOT NULL DEFAULT 1")
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+        if created:
+            self._import_legacy()
+
+        book = AddressBook()
+        for data in self._read_records():
+            book.add_record(Record.from_dict(data))
+        book.subscribe(self._apply)
+        return book
+
+    def save(self, book: AddressBook):
+        """Mutations are committed as they happen, so there is nothing left to write."""
+        self._conn.commit()
+
+    @contextmanager
+    def bulk(self):
+        """Write all mutations made inside the block in one transaction."""
+        self._bulk = True
+        try:
+            yield
+        finally:
+            self._bulk = False
+            self._conn.commit()
+
+    def close(self):
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _read_records(self) -> list[dict]:
+        records = {}
+        for record_id, name, next_note_id in self._conn.execute(
+            "SELECT id, name, next_note_id FROM records ORDER BY id"
+        ):
+            records[record_id] = {
+                "name": name,
+                "phones": [],
+                "email": None,
+                "birthday": None,
+                "notes": [],
+                "next_note_id": next_note_id,
+            }
+
+        for record_id, digits in self._conn.execute("SELECT record_id, digits FROM phones ORDER BY rowid"):
+            records[record_id]["phones"].append(digits)
+        for record_id, email in self._conn.execute("SELECT record_id, email FROM emails"):
+            records[record_id]["email"] = email
+        for record_id, birthday in self._conn.execute("SELECT record_id, birthday FROM birthdays"):
+            records[record_id]["birthday"] = birthday
+
+        notes = {}
+        for record_id, note_id, text in self._conn.execute(
+            "SELECT record_id, note_id, text FROM notes ORDER BY record_id, note_id"
+        ):
+            note = {"id": note_id, "text": text, "tags": []}
+            notes[(record_id, note_id)] = note
+            records[record_id]["notes"].append(note)
+        for record_id, note_id, tag in self._conn.execute(
+            "SELECT record_id, note_id, tag FROM tags ORDER BY rowid"
+        ):
+            notes[(record_id, note_id)]["tags"].append(tag)
+
+        return list(records.values())
+
+    def _import_legacy(self):
+        legacy_book = self._read_legacy()
+        if legacy_book is None:
+            return
+
+        with self._conn:
+            for record in legacy_book.values():
+                self._insert_record(record.to_dict())
+
+    def _record_id(self, name: str) -> int:
+        row = self._conn.execute("SELECT id FROM records WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            raise KeyError(f"Record {name} not found")
+        return row[0]
+
+    def _insert_record(self, data: dict):
+        self._conn.execute("DELETE FROM records WHERE name = ?", (data["name"],))
+        cursor = self._conn.execute(
+            "INSERT INTO records (name, next_note_id) VALUES (?, ?)",
+            (data["name"], data.get("next_note_id", 1)),
+        )
+        record_id = cursor.lastrowid
+
+        self._conn.executemany(
+            "INSERT INTO phones (record_id, digits) VALUES (?, ?)",
+            [(record_id, digits) for digits in data["phones"]],
+        )
+        if data["email"]:
+            self._set_email(record_id, data["email"])
+        if data["birthday"]:
+            self._set_birthday(record_id, data["birthday"])
+        for note in data["notes"]:
+            self._conn.execute(
+                "INSERT INTO notes (record_id, note_id, text) VALUES (?, ?, ?)",
+                (record_id, note["id"], note["text"]),
+            )
+            self._add_tags(record_id, note["id"], note["tags"])
+
+    def _set_email(self, record_id: int, email: str):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO emails (record_id, email) VALUES (?, ?)",
+            (record_id, email),
+        )
+
+    def _set_birthday(self, record_id: int, birthday: str):
+        day, month, _ = birthday.split(".")
+        self._conn.execute(
+            "INSERT OR REPLACE INTO birthdays (record_id, birthday, month, day) VALUES (?, ?, ?, ?)",
+            (record_id, birthday, int(month), int(day)),
+        )
+
+    def _add_tags(self, record_id: int, note_id: int, tags: list[str]):
+        # Events carry the tags as given, the note skips repeated and present ones
+        present = {
+            row[0]
+            for row in self._conn.execute(
+                "SELECT tag FROM tags WHERE record_id = ? AND note_id = ?", (record_id, note_id)
+            )
+        }
+        new_tags = [tag for tag in dict.fromkeys(tags) if tag not in present]
+        self._conn.executemany(
+            "INSERT INTO tags (record_id, note_id, tag) VALUES (?, ?, ?)",
+            [(record_id, note_id, tag) for tag in new_tags],
+        )
+
+    def _apply(self, op: str, name: str, args: tuple):
+        if self._bulk:
+            self._execute(op, name, args)
+        else:
+            with self._conn:
+                self._execute(op, name, args)
+
+    def _execute(self, op: str, name: str, args: tuple):
+        if op == "add_record":
+            self._insert_record(args[0].to_dict())
+        elif op == "delete":
+            self._conn.execute("DELETE FROM records WHERE name = ?", (name,))
+        else:
+            self._apply_to_record(self._record_id(name), op, args)
+
+    def _apply_to_record(self, record_id: int, op: str, args: tuple):
+        if op == "add_phone":
+            self._conn.execute(
+                "INSERT INTO phones (record_id, digits) VALUES (?, ?)", (record_id, args[0])
+            )
+        elif op == "remove_phone":
+            # One row, like the record: older databases may hold a number twice
+            self._conn.execute(
+                "DELETE FROM phones WHERE rowid = "
+                "(SELECT rowid FROM phones WHERE record_id = ? AND digits = ? ORDER BY rowid LIMIT 1)",
+                (record_id, args[0]),
+            )
+        elif op == "edit_phone":
+            self._conn.execute(
+                "UPDATE phones SET digits = ? WHERE rowid = "
+                "(SELECT rowid FROM phones WHERE record_id = ? AND digits = ? ORDER BY rowid LIMIT 1)",
+                (args[1], record_id, args[0]),
+            )
+        elif op in ("add_email", "edit_email"):
+            self._set_email(record_id, args[0])
+        elif op == "add_birthday":
+            self._set_birthday(record_id, args[0])
+        elif op == "add_note":
+            text, note_id = args
+            self._conn.execute(
+                "INSERT OR REPLACE INTO notes (record_id, note_id, text) VALUES (?, ?, ?)",
+                (record_id, note_id, text),
+            )
+            self._conn.execute(
+                "UPDATE records SET next_note_id = MAX(next_note_id, ?) WHERE id = ?",
+                (note_id + 1, record_id),
+            )
+        elif op == "edit_note":
+            # Editing replaces the whole note, tags included
+            note_id, text = args
+            self._conn.execute(
+                "DELETE FROM tags WHERE record_id = ? AND note_id = ?", (record_id, note_id)
+            )
+            self._conn.execute(
+                "UPDATE notes SET text = ? WHERE record_id = ? AND note_id = ?",
+                (text, record_id, note_id),
+            )
+        elif op == "remove_note":
+            self._conn.execute(
+                "DELETE FROM notes WHERE record_id = ? AND note_id = ?", (record_id, args[0])
+            )
+        elif op == "add_tags_to_note":
+            self._add_tags(record_id, args[0], args[1])
+        elif op == "remove_tag_from_note":
+            self._conn.execute(
+                "DELETE FROM tags WHERE record_id = ? AND note_id = ? AND tag = ?",
+                (record_id, args[0], args[1]),
+            )
+        else:
+            raise ValueError(f"Unknown operation '{op}'")
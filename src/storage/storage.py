@@ -0,0 +1,68 @@
+import pickle
+from contextlib import contextmanager, nullcontext
+
+from src.models import AddressBook
+
+
+class Storage:
+    """Base class for address book persistence backends."""
+
+    # Held while a command runs, so background writers see a consistent book
+    lock = nullcontext()
+    # Set when a background write fails, see `take_error`
+    last_error = None
+    # Set by `load` when saved data could not be read and was moved aside
+    load_warning = None
+    # Plain pickle cache of the default mode, imported on a backend's first start
+    legacy_path = None
+
+    def load(self) -> AddressBook:
+        """Load the address book, or return an empty one."""
+        raise NotImplementedError
+
+    def save(self, book: AddressBook):
+        """Persist the address book."""
+        raise NotImplementedError
+
+    def refresh(self, book: AddressBook) -> tuple[set, set]:
+        """Apply changes saved by other sessions since the last check.
+
+        Returns names of contacts updated from other sessions and names where
+        another session's change conflicted with an unsaved local one.
+        """
+        return set(), set()
+
+    def compact(self, book: AddressBook) -> bool:
+        """Fold incremental changes into a full snapshot.
+
+        Returns False for backends that always write the whole book.
+        """
+        return False
+
+    @contextmanager
+    def bulk(self):
+        """Group many mutations into as few writes as the backend allows."""
+        yield
+
+    def flush(self):
+        """Finish any pending write before returning."""
+        pass
+
+    def take_error(self) -> Exception | None:
+        """Return the error of a failed background write and forget it."""
+        error, self.last_error = self.last_error, None
+        return error
+
+    def close(self):
+        """Release files and background workers held by the backend."""
+        pass
+
+    def _read_legacy(self) -> AddressBook | None:
+        """The book in the pickle cache at `legacy_path`, or None if there is none."""
+        if self.legacy_path is None:
+            return None
+        try:
+            with open(self.legacy_path, "rb") as f:
+                return pickle.load(f)
+        except (FileNotFoundError, pickle.UnpicklingError):
+            return None
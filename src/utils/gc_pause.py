@@ -0,0 +1,18 @@
+import gc
+from contextlib import contextmanager
+
+
+@contextmanager
+def gc_paused():
+    """Turn off the cyclic garbage collector inside the block.
+
+    Loading data or building an index only creates new objects, so cyclic
+    GC passes triggered by all those allocations find nothing to free.
+    """
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if gc_enabled:
+            gc.enable()
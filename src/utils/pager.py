@@ -0,0 +1,70 @@
+from itertools import islice
+
+from src.constants import PAGE_SIZE
+
+PAGE_OPTIONS = ("--limit", "--offset")
+
+
+def parse_page_args(args: list[str]) -> tuple[list[str], int, int]:
+    """Split `--limit N` and `--offset N` (or `--limit=N`) off command arguments.
+
+    Returns the remaining arguments, the limit and the offset.
+    """
+    rest = []
+    options = {"--limit": PAGE_SIZE, "--offset": 0}
+    words = iter(args)
+    for word in words:
+        option, separator, value = word.partition("=")
+        if option not in PAGE_OPTIONS:
+            rest.append(word)
+            continue
+        if not separator:
+            value = next(words, "")
+        if not value.isdigit():
+            raise ValueError(f"{option} needs a number")
+        options[option] = int(value)
+
+    if options["--limit"] == 0:
+        raise ValueError("--limit must be greater than 0")
+    return rest, options["--limit"], options["--offset"]
+
+
+class Page:
+    """One page of a listing, rendered lazily item by item.
+
+    Only the items of the page are rendered, so the first lines can be
+    written out right away whatever the size of `items`. One extra item is
+    read to tell whether another page follows: once iterated, `next_offset`
+    is the offset of the next page, or None if this page was the last one.
+    """
+
+    def __init__(self, items, offset: int, limit: int, render=str, header: str = "", total: int | None = None):
+        self.items = items
+        self.offset = offset
+        self.limit = limit
+        self.render = render
+        self.header = header
+        self.total = total
+        self.shown = 0
+        self.next_offset = None
+
+    def __iter__(self):
+        if self.header:
+            yield self.header
+        for item in islice(self.items, self.offset, self.offset + self.limit + 1):
+            if self.shown == self.limit:
+                self.next_offset = self.offset + self.limit
+                return
+            self.shown += 1
+            yield self.render(item)
+
+    def summary(self) -> str:
+        """Which items were shown, e.g. "Shown 21-40 of 95"."""
+        if self.shown == 0:
+            return f"Nothing to show from offset {self.offset}"
+        summary = f"Shown {self.offset + 1}"
+        if self.shown > 1:
+            summary += f"-{self.offset + self.shown}"
+        if self.total is not None:
+            summary += f" of {self.total}"
+        return summary
@@ -1,9 +1,16 @@
+import copyreg
+import pickle
 import unittest
 from datetime import datetime, timedelta
 
 from src.constants import DATE_FORMAT
 from src.models import AddressBook
+from src.models.birthday import Birthday
+from src.models.name import Name
+from src.models.note import Note
+from src.models.phone import Phone
 from src.models.record import Record
+from src.models.tag import Tag
 
 
 class TestBirthday(unittest.TestCase):
@@ -92,6 +99,112 @@ class TestBirthday(unittest.TestCase):
         self.assertEqual(len(found_records), 0)
 
 
+class TestMutationTracking(unittest.TestCase):
+    def setUp(self):
+        self.address_book = AddressBook()
+        self.record = Record("Mike")
+        self.address_book.add_record(self.record)
+        self.address_book.mark_clean()
+
+    def test_queries_keep_book_clean(self):
+        self.address_book.search("Mike")
+        self.address_book.get_upcoming_birthdays()
+        self.address_book.get_records_by_note_keyword("milk")
+        str(self.address_book.find("Mike"))
+        self.assertFalse(self.address_book.is_dirty)
+
+    def test_record_mutations_mark_book_dirty(self):
+        self.record.add_phone("1234567890")
+        self.assertTrue(self.address_book.is_dirty)
+        self.assertEqual(self.address_book.dirty_names(), {"Mike"})
+        self.assertEqual(self.record.generation, 1)
+
+    def test_failed_mutation_keeps_book_clean(self):
+        self.record.remove_phone("5555555555")
+        with self.assertRaises(KeyError):
+            self.record.edit_note(1, "missing")
+        self.assertFalse(self.address_book.is_dirty)
+
+    def test_add_and_delete_mark_book_dirty(self):
+        self.address_book.add_record(Record("Kate"))
+        self.address_book.delete("Mike")
+        self.assertEqual(self.address_book.generation, 3)
+        self.assertEqual(self.address_book.dirty_names(), {"Kate", "Mike"})
+
+    def test_mark_clean_resets_tracking(self):
+        self.record.add_note("Buy milk")
+        self.address_book.mark_clean()
+        self.assertFalse(self.address_book.is_dirty)
+        self.assertEqual(self.address_book.dirty_names(), set())
+
+    def test_deleted_record_no_longer_reports(self):
+        self.address_book.delete("Mike")
+        self.address_book.mark_clean()
+        self.record.add_phone("1234567890")
+        self.assertFalse(self.address_book.is_dirty)
+
+
+class OldPickle:
+    """Pickles like an instance of `cls` that kept its attributes in `__dict__`."""
+
+    def __init__(self, cls, state):
+        self.cls = cls
+        self.state = state
+
+    def __reduce_ex__(self, protocol):
+        return copyreg._reconstructor, (self.cls, object, None), self.state
+
+
+class TestCompactRecords(unittest.TestCase):
+    def test_records_and_fields_have_no_dict(self):
+        record = Record("Mike")
+        record.add_phone("1234567890")
+        record.add_birthday("01.02.1990")
+        record.add_email("mike@example.com")
+        record.add_note("Call mom")
+        record.add_tags_to_note(1, ["home"])
+        fields = [record, record.name, record.phones[0], record.birthday, record.email, record.notes[1]]
+        fields.append(record.notes[1].get_tags()[0])
+        for field in fields:
+            with self.subTest(field=type(field).__name__):
+                self.assertFalse(hasattr(field, "__dict__"))
+
+    def test_pickle_round_trip(self):
+        book = AddressBook()
+        record = Record("Mike")
+        record.add_phone("1234567890")
+        record.add_note("Call mom")
+        record.add_tags_to_note(1, ["home"])
+        book.add_record(record)
+
+        loaded = pickle.loads(pickle.dumps(book))
+        self.assertEqual(loaded.find("Mike").to_dict(), record.to_dict())
+        self.assertEqual(loaded.find("Mike").generation, 3)
+        loaded.find("Mike").add_phone("5555555555")
+        self.assertEqual(loaded.dirty_names(), {"Mike"})
+
+    def test_loads_pickles_written_before_slots(self):
+        note = OldPickle(Note, {"_value": "Call mom", "_tags": [OldPickle(Tag, {"_value": "home"})]})
+        state = {
+            "name": OldPickle(Name, {"_value": "Mike"}),
+            "phones": [OldPickle(Phone, {"_value": "1234567890"})],
+            "birthday": OldPickle(Birthday, {"_value": datetime(1990, 2, 1)}),
+            "notes": {1: note},
+            "email": None,
+        }
+        record = pickle.loads(pickle.dumps(OldPickle(Record, state)))
+        self.assertEqual(record.to_dict(), {
+            "name": "Mike",
+            "phones": ["1234567890"],
+            "email": None,
+            "birthday": "01.02.1990",
+            "notes": [{"id": 1, "text": "Call mom", "tags": ["home"]}],
+            "next_note_id": 2,
+        })
+        self.assertEqual(record.generation, 0)
+        self.assertIsNone(record._listener)
+
+
 class TestSearchNotes(unittest.TestCase):
     def setUp(self):
         self.address_book = AddressBook()
@@ -116,16 +229,16 @@ class TestSearchNotes(unittest.TestCase):
         """Keyword matches a single note in a single record."""
         result = self.address_book.get_records_by_note_keyword("call")
         self.assertEqual(len(result), 1)
-        self.assertEqual(result[0].name.value, "John")
+        self.assertEqual(result[0].name, "John")
         self.assertEqual(len(result[0].notes), 1)  # filtered notes
-        self.assertIn("call", next(iter(result[0].notes.values())).value.lower())
+        self.assertIn("call", next(iter(result[0].notes.values())).lower())
 
     def test_find_multiple_matches_in_one_record(self):
         """Keyword matches multiple notes in one record."""
         result = self.address_book.get_records_by_note_keyword("milk")
         self.assertEqual(len(result), 2)
 
-        names = {r.name.value for r in result}
+        names = {r.name for r in result}
         self.assertIn("John", names)
         self.assertIn("Mike", names)
 
@@ -151,7 +264,7 @@ class TestSearchNotes(unittest.TestCase):
     def test_record_without_notes_is_skipped(self):
         """Sarah has no notes — should not appear in any result."""
         result = self.address_book.get_records_by_note_keyword("milk")
-        names = {r.name.value for r in result}
+        names = {r.name for r in result}
         self.assertNotIn("Sarah", names)
 
     def test_only_filtered_notes_returned(self):
@@ -160,9 +273,9 @@ class TestSearchNotes(unittest.TestCase):
         self.assertEqual(len(result), 1)
         john = result[0]
 
-        self.assertEqual(john.name.value, "John")
+        self.assertEqual(john.name, "John")
         self.assertEqual(len(john.notes), 1)
-        self.assertEqual(list(john.notes.values())[0].value, "Call mom")
+        self.assertEqual(list(john.notes.values())[0], "Call mom")
 
 
 if __name__ == "__main__":
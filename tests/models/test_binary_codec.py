@@ -0,0 +1,95 @@
+import struct
+import unittest
+
+from src.models import AddressBook, Record
+from src.models.binary_codec import FORMAT_VERSION, MAGIC, BinaryWriter
+
+
+class TestBinaryCodec(unittest.TestCase):
+    def setUp(self):
+        self.address_book = AddressBook()
+
+        record = Record("Mike")
+        record.add_phone("0987654321")
+        record.add_phone("+380501234567")
+        record.add_email("mike@example.com")
+        record.add_birthday("05.11.1997")
+        record.add_note("Buy milk")
+        record.add_note("Зустріч о 15:00")
+        record.add_tags_to_note(1, ["home", "urgent"])
+        record.add_tags_to_note(2, ["work", "urgent"])
+        record.remove_note(1)
+        record.add_note("Call mom")
+        self.address_book.add_record(record)
+
+        self.address_book.add_record(Record("Ганна"))
+
+    def test_round_trip(self):
+        book = AddressBook.from_bytes(self.address_book.to_bytes())
+
+        self.assertEqual(list(book.keys()), ["Mike", "Ганна"])
+        for name in book:
+            self.assertEqual(book[name].to_dict(), self.address_book[name].to_dict())
+            self.assertEqual(str(book[name]), str(self.address_book[name]))
+
+    def test_note_id_counter_is_kept(self):
+        record = self.address_book.find("Mike")
+        record.remove_note(3)
+        book = AddressBook.from_bytes(self.address_book.to_bytes())
+        self.assertEqual(book.find("Mike").notes.next_id, 4)
+
+    def test_reads_version_1(self):
+        writer = BinaryWriter()
+        writer.write_uint(1)  # records
+        writer.write_str("Mike")
+        writer.write_uint(0)  # phones
+        writer.write_str("")  # email
+        writer.write_uint(0)  # birthday
+        writer.write_uint(1)  # notes
+        writer.write_uint(7)
+        writer.write_str("Buy milk")
+        writer.write_uint(0)  # tags, version 1 ends the record here
+        data = writer.getvalue()
+        data = struct.pack("<4sH", MAGIC, 1) + data[6:]
+
+        record = AddressBook.from_bytes(data).find("Mike")
+        self.assertEqual(record.notes[7].value, "Buy milk")
+        self.assertEqual(record.notes.next_id, 8)
+
+    def test_leading_zeros_in_phone_are_kept(self):
+        book = AddressBook.from_bytes(self.address_book.to_bytes())
+        self.assertEqual(book.find("Mike").phones[0].value, "0987654321")
+
+    def test_tags_are_stored_once(self):
+        data = self.address_book.to_bytes()
+        self.assertEqual(data.count(b"urgent"), 1)
+
+    def test_decoded_book_tracks_mutations(self):
+        book = AddressBook.from_bytes(self.address_book.to_bytes())
+        book.find("Mike").add_phone("1111111111")
+        self.assertEqual(book.dirty_names(), {"Mike"})
+
+    def test_empty_book(self):
+        book = AddressBook.from_bytes(AddressBook().to_bytes())
+        self.assertEqual(len(book), 0)
+
+    def test_rejects_foreign_data(self):
+        with self.assertRaises(ValueError):
+            AddressBook.from_bytes(b"\x80\x04not a binary book")
+
+    def test_rejects_truncated_data(self):
+        data = self.address_book.to_bytes()
+        for size in (len(data) - 1, len(data) // 2, 7):
+            with self.subTest(size=size):
+                with self.assertRaises(ValueError):
+                    AddressBook.from_bytes(data[:size])
+
+    def test_rejects_unknown_version(self):
+        data = self.address_book.to_bytes()
+        data = struct.pack("<4sH", MAGIC, FORMAT_VERSION + 1) + data[6:]
+        with self.assertRaises(ValueError):
+            AddressBook.from_bytes(data)
+
+
+if __name__ == "__main__":
+    unittest.main()
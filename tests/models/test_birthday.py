@@ -1,5 +1,6 @@
+import pickle
 import unittest
-from datetime import datetime
+from datetime import date, datetime
 
 from src.constants.constants import DATE_FORMAT
 from src.models.birthday import Birthday
@@ -19,6 +20,27 @@ class TestBirthday(unittest.TestCase):
         birthday = Birthday(birthday_str)
         self.assertEqual(birthday_str, f"{birthday}")
 
+    def test_value_is_date(self):
+        birthday = Birthday("25.11.1990")
+        self.assertEqual(birthday.value, date(1990, 11, 25))
+        self.assertEqual(repr(birthday), "25.11.1990")
+
+    def test_short_day_and_month_are_padded(self):
+        self.assertEqual(str(Birthday("5.1.1990")), "05.01.1990")
+
+    def test_invalid_dates_keep_message(self):
+        for text in ("", "25.11", "25-11-1990", "25.11.90", "a5.11.1990", "0.11.1990", "29.02.2023", "25.11.1990."):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError) as ctx:
+                    Birthday(text)
+                self.assertEqual(str(ctx.exception), "Invalid date format. Use DD.MM.YYYY")
+
+    def test_trusted_and_unpickled_values_are_rendered(self):
+        self.assertEqual(str(Birthday.trusted(date(1990, 11, 25))), "25.11.1990")
+        old = Birthday.__new__(Birthday)
+        old.__setstate__({"_value": datetime(1990, 11, 25)})
+        self.assertEqual(str(pickle.loads(pickle.dumps(old))), "25.11.1990")
+
 
 if __name__ == "__main__":
     unittest.main()
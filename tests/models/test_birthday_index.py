@@ -0,0 +1,90 @@
+import unittest
+from datetime import date
+
+from src.models import AddressBook, Record
+from src.models.birthday_index import BirthdayIndex
+
+
+def make_record(name, birthday=None):
+    record = Record(name)
+    if birthday:
+        record.add_birthday(birthday)
+    return record
+
+
+class TestBirthdayIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = BirthdayIndex([
+            make_record("Mike", "02.01.1990"),
+            make_record("Kate", "29.02.1996"),
+            make_record("Anna", "31.12.1985"),
+            make_record("John"),
+        ])
+
+    def test_range_wraps_year(self):
+        matches = self.index.between(date(2026, 12, 29), date(2027, 1, 5))
+        self.assertEqual(matches, [(date(2026, 12, 31), "Anna"), (date(2027, 1, 2), "Mike")])
+
+    def test_feb_29_in_common_and_leap_years(self):
+        self.assertEqual(self.index.between(date(2027, 2, 28), date(2027, 2, 28)), [(date(2027, 2, 28), "Kate")])
+        self.assertEqual(self.index.between(date(2028, 2, 28), date(2028, 2, 28)), [])
+        self.assertEqual(self.index.between(date(2028, 2, 29), date(2028, 3, 1)), [(date(2028, 2, 29), "Kate")])
+
+    def test_set_and_remove(self):
+        self.index.set("Mike", date(1990, 3, 5))
+        self.index.remove("Anna")
+        self.assertEqual(self.index.between(date(2026, 1, 1), date(2026, 12, 31)), [
+            (date(2026, 2, 28), "Kate"),
+            (date(2026, 3, 5), "Mike"),
+        ])
+        self.assertEqual(len(self.index), 2)
+
+    def test_names_by_month_and_day(self):
+        self.index.set("John", date(2000, 12, 1))
+        self.assertEqual(self.index.names(12), {"Anna", "John"})
+        self.assertEqual(self.index.names(12, 31), {"Anna"})
+        self.assertEqual(self.index.names(2, 28), set())
+        self.assertEqual(self.index.count(12), 2)
+        self.assertEqual(self.index.count(6), 0)
+
+
+class TestUpcomingBirthdays(unittest.TestCase):
+    def setUp(self):
+        self.address_book = AddressBook()
+        for name, birthday in (("Mike", "02.01.1990"), ("Kate", "29.02.1996"), ("Anna", "17.10.1985")):
+            self.address_book.add_record(make_record(name, birthday))
+
+    def upcoming(self, days, today):
+        return [
+            (str(b["name"]), b["congratulation_date"])
+            for b in self.address_book.get_upcoming_birthdays(days, today=today)
+        ]
+
+    def test_weekend_birthday_moves_to_monday(self):
+        # 02.01.2027 is a Saturday
+        self.assertEqual(self.upcoming(7, date(2026, 12, 29)), [("Mike", "2027.01.04")])
+        # 17.10.2026 was a Saturday, it is congratulated on Monday 19.10
+        self.assertEqual(self.upcoming(0, date(2026, 10, 19)), [("Anna", "2026.10.19")])
+        self.assertEqual(self.upcoming(7, date(2026, 10, 20)), [])
+
+    def test_any_window(self):
+        self.assertEqual(self.upcoming(3, date(2026, 12, 29)), [])
+        self.assertEqual(
+            self.upcoming(365, date(2026, 10, 20)),
+            [("Mike", "2027.01.04"), ("Kate", "2027.03.01"), ("Anna", "2027.10.18")],
+        )
+
+    def test_index_follows_changes(self):
+        today = date(2026, 12, 29)
+        self.assertEqual(self.upcoming(7, today), [("Mike", "2027.01.04")])
+
+        self.address_book.find("Kate").add_birthday("30.12.1996")
+        self.address_book.add_record(make_record("Mike"))
+        self.assertEqual(self.upcoming(7, today), [("Kate", "2026.12.30")])
+
+        self.address_book.delete("Kate")
+        self.assertEqual(self.upcoming(7, today), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import pickle
+import unittest
+
+from src.models import AddressBook, Record
+from src.models.name_index import TrigramIndex, edit_distance
+
+
+class TestTrigramIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = TrigramIndex(["Mike Wazowski", "Dwight Schrute", "Michael Scott", "Al"])
+
+    def test_substring_search_ignores_case(self):
+        self.assertEqual(self.index.search("mi"), ["Mike Wazowski", "Michael Scott"])
+        self.assertEqual(self.index.search("SCHRUTE"), ["Dwight Schrute"])
+        self.assertEqual(self.index.search("wight sch"), ["Dwight Schrute"])
+        self.assertEqual(self.index.search("L"), ["Michael Scott", "Al"])
+
+    def test_trigrams_must_be_adjacent(self):
+        # Every trigram of "ikeott" is absent, "ike sco" has all but no substring
+        self.assertEqual(self.index.search("ikeott"), [])
+        self.assertEqual(self.index.search("mike scott"), [])
+
+    def test_remove_and_add_keep_insertion_order(self):
+        self.index.remove("Mike Wazowski")
+        self.assertEqual(self.index.search("mi"), ["Michael Scott"])
+        self.index.add("Mia Wallace")
+        self.index.add("Michael Scott")
+        self.assertEqual(self.index.search("mi"), ["Michael Scott", "Mia Wallace"])
+        self.assertEqual(len(self.index), 4)
+
+    def test_edit_distance_stops_at_limit(self):
+        self.assertEqual(edit_distance("kitten", "sitting", 5), 3)
+        self.assertEqual(edit_distance("kitten", "sitting", 2), 3)
+        self.assertEqual(edit_distance("mike", "mike", 0), 0)
+        self.assertEqual(edit_distance("al", "dwight", 1), 2)
+
+    def test_fuzzy_matches_any_word_closest_first(self):
+        self.index.add("Mikael Scot")
+        self.assertEqual(self.index.fuzzy("scot"), ["Mikael Scot", "Michael Scott"])
+        self.assertEqual(self.index.fuzzy("SHRUTE"), ["Dwight Schrute"])
+        self.assertEqual(self.index.fuzzy("wazowsky", max_distance=1), ["Mike Wazowski"])
+        self.assertEqual(self.index.fuzzy("scot", limit=1), ["Mikael Scot"])
+        self.assertEqual(self.index.fuzzy("xyz"), [])
+
+    def test_fuzzy_compares_whole_name_for_several_words(self):
+        self.assertEqual(self.index.fuzzy("micheal scot"), ["Michael Scott"])
+        self.assertEqual(self.index.fuzzy("michael dwight"), [])
+
+    def test_fuzzy_follows_remove(self):
+        self.index.add("Mike Scott")
+        self.index.remove("Michael Scott")
+        self.assertEqual(self.index.fuzzy("scot"), ["Mike Scott"])
+        self.index.remove("Mike Scott")
+        self.assertEqual(self.index.fuzzy("scot"), [])
+        self.assertEqual(self.index._word_postings.keys(), TrigramIndex(self.index._folded)._word_postings.keys())
+
+
+class TestAddressBookNameSearch(unittest.TestCase):
+    def setUp(self):
+        self.address_book = AddressBook()
+        for name in ("Mike", "Dwight", "M.ke"):
+            self.address_book.add_record(Record(name))
+
+    def names(self, keyword):
+        return [record.name.value for record in self.address_book.search(keyword)]
+
+    def test_keyword_is_literal(self):
+        self.assertEqual(self.names("m.ke"), ["M.ke"])
+        self.assertEqual(self.names("(mike"), [])
+
+    def test_index_follows_add_and_delete(self):
+        self.assertEqual(self.names("ike"), ["Mike"])
+        self.address_book.delete("Mike")
+        self.address_book.add_record(Record("Spike"))
+        self.assertEqual(self.names("ike"), ["Spike"])
+
+    def test_fuzzy_search(self):
+        self.assertEqual([r.name.value for r in self.address_book.search("mkie", fuzzy=True)], ["Mike", "M.ke"])
+        self.assertEqual(self.names("mkie"), [])
+
+    def test_index_is_not_pickled(self):
+        self.names("ike")
+        book = pickle.loads(pickle.dumps(self.address_book))
+        self.assertIsNone(book._name_index)
+        book.add_record(Record("Spike"))
+        self.assertEqual([r.name.value for r in book.search("ike")], ["Mike", "Spike"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,10 @@
+import pickle
+import threading
 import unittest
 
+from src.models.note import Note
 from src.models.record import Record
+from src.models.tag import Tag, TagTable
 
 
 class TestAddNote(unittest.TestCase):
@@ -108,3 +112,83 @@ class TestRemoveNote(unittest.TestCase):
         self.record.remove_note(2)
         self.record.remove_note(3)
         self.assertEqual(len(self.record.notes), 0)
+
+
+class TestNoteTags(unittest.TestCase):
+    def setUp(self):
+        self.record = Record("John")
+        self.record.add_note("first")
+        self.record.add_note("second")
+        self.record.add_tags_to_note(1, ["work", "urgent", "work"])
+        self.record.add_tags_to_note(2, ["urgent", "work"])
+
+    def test_duplicate_tags_are_skipped(self):
+        tags = self.record.notes[1].get_tags()
+        self.assertEqual([tag.value for tag in tags], ["urgent", "work"])
+        self.assertIsInstance(tags[0], Tag)
+
+    def test_notes_with_same_tags_share_one_set(self):
+        self.assertIs(self.record.notes[1]._tags, self.record.notes[2]._tags)
+
+        self.record.remove_tag_from_note(2, "work")
+        self.assertEqual(self.record.notes[2].tag_values(), ["urgent"])
+        self.assertEqual(self.record.notes[1].tag_values(), ["urgent", "work"])
+
+    def test_has_tag(self):
+        note = self.record.notes[1]
+        self.assertTrue(note.has_tag("urgent"))
+        self.assertFalse(note.has_tag("home"))
+        self.record.remove_tag_from_note(1, "urgent")
+        self.record.remove_tag_from_note(1, "never-used")
+        self.assertFalse(note.has_tag("urgent"))
+
+    def test_find_note_by_tag(self):
+        self.record.remove_tag_from_note(2, "urgent")
+        self.assertIn("first", self.record.find_note_by_tag("urgent"))
+        self.assertNotIn("second", self.record.find_note_by_tag("urgent"))
+
+    def test_pickle_keeps_tag_strings(self):
+        note = self.record.notes[1]
+        self.assertEqual(note.__getstate__(), {"_value": "first", "_tags": ["urgent", "work"]})
+        loaded = pickle.loads(pickle.dumps(note))
+        self.assertIsInstance(loaded, Note)
+        self.assertIs(loaded._tags, note._tags)
+
+
+class TestTagTable(unittest.TestCase):
+    def test_intern(self):
+        table = TagTable()
+        self.assertEqual([table.intern(tag) for tag in ("work", "home", "work")], [0, 1, 0])
+        self.assertEqual(table.tag(1), "home")
+        self.assertIsNone(table.id("later"))
+        self.assertEqual(len(table), 2)
+
+    def test_tag_sets_are_shared_and_ordered(self):
+        table = TagTable()
+        work, home = table.intern("work"), table.intern("home")
+        tag_set = table.tag_set([work, home])
+        self.assertIs(table.tag_set((home, work)), tag_set)
+        self.assertEqual(list(tag_set), [home, work])
+
+    def test_unused_tag_sets_are_dropped(self):
+        table = TagTable()
+        tag_ids = [table.intern(tag) for tag in ("work", "home")]
+        table.tag_set(tag_ids[:1])
+        kept = table.tag_set(tag_ids)
+        self.assertEqual(list(table._sets.values()), [kept])
+
+    def test_concurrent_interning_gives_unique_ids(self):
+        table = TagTable()
+        tags = [f"tag{i}" for i in range(2000)]
+        threads = [threading.Thread(target=lambda: [table.intern(tag) for tag in tags]) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(table), len(tags))
+        self.assertEqual([table.tag(table.id(tag)) for tag in tags], tags)
+
+
+if __name__ == "__main__":
+    unittest.main()
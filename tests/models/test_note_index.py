@@ -0,0 +1,90 @@
+import unittest
+
+from src.models import AddressBook, Record
+from src.models.note_index import NoteIndex, tokenize
+
+
+class TestNoteIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = NoteIndex()
+        self.index.add("John", 1, "Buy milk and bread")
+        self.index.add("John", 2, "Call mom about the meeting")
+        self.index.add("Mike", 1, "Meeting, meeting, meeting!")
+        self.index.add("Mike", 2, "Milk delivery tomorrow")
+
+    def docs(self, query):
+        return [(hit.name, hit.note_id) for hit in self.index.search(query)]
+
+    def test_tokenize(self):
+        self.assertEqual(tokenize("Call MOM, e-mail: 5pm"), ["call", "mom", "e", "mail", "5pm"])
+
+    def test_words_are_and_ed(self):
+        self.assertEqual(sorted(self.docs("milk")), [("John", 1), ("Mike", 2)])
+        self.assertEqual(self.docs("milk delivery"), [("Mike", 2)])
+        self.assertEqual(self.docs("milk mom"), [])
+        self.assertEqual(self.docs(""), [])
+
+    def test_or_groups(self):
+        self.assertEqual(sorted(self.docs("bread OR mom")), [("John", 1), ("John", 2)])
+        self.assertEqual(sorted(self.docs("unicorn OR delivery")), [("Mike", 2)])
+
+    def test_prefix(self):
+        self.assertEqual(sorted(self.docs("mee*")), [("John", 2), ("Mike", 1)])
+        self.assertEqual(self.docs("mee"), [])
+        self.assertEqual(self.docs("m* bread"), [("John", 1)])
+
+    def test_estimate_bounds_matches(self):
+        self.assertEqual(self.index.estimate("milk"), 2)
+        self.assertEqual(self.index.estimate("milk mom"), 1)
+        self.assertEqual(self.index.estimate("mee* OR bread"), 3)
+        self.assertEqual(self.index.estimate("unicorn"), 0)
+
+    def test_ranking_prefers_frequent_term(self):
+        hits = self.index.search("meeting")
+        self.assertEqual([(hit.name, hit.note_id) for hit in hits], [("Mike", 1), ("John", 2)])
+        self.assertGreater(hits[0].score, hits[1].score)
+        self.assertEqual(len(self.index.search("meeting", limit=1)), 1)
+
+    def test_edit_and_remove(self):
+        self.index.add("Mike", 2, "Pick up the parcel")
+        self.assertEqual(self.docs("milk"), [("John", 1)])
+        self.index.remove("John", 1)
+        self.assertEqual(self.docs("milk"), [])
+        self.assertEqual(self.docs("parc*"), [("Mike", 2)])
+        self.assertEqual(len(self.index), 3)
+
+
+class TestAddressBookNoteSearch(unittest.TestCase):
+    def setUp(self):
+        self.address_book = AddressBook()
+        self.john = Record("John")
+        self.john.add_note("Buy milk")
+        self.address_book.add_record(self.john)
+
+    def docs(self, query):
+        return [(hit.name, hit.note_id) for hit in self.address_book.search_notes(query)]
+
+    def test_index_follows_note_mutations(self):
+        self.assertEqual(self.docs("milk"), [("John", 1)])
+
+        self.john.add_note("Milk again")
+        self.john.edit_note(1, "Buy bread")
+        self.assertEqual(self.docs("milk"), [("John", 2)])
+
+        self.john.remove_note(2)
+        self.assertEqual(self.docs("milk"), [])
+
+    def test_index_follows_records(self):
+        self.docs("milk")
+        kate = Record("Kate")
+        kate.add_note("Milk for the cat")
+        self.address_book.add_record(kate)
+        self.address_book.add_record(Record("John"))
+        self.assertEqual(self.docs("milk"), [("Kate", 1)])
+
+        self.address_book.delete("Kate")
+        self.assertEqual(self.docs("milk"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
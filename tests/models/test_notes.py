@@ -0,0 +1,68 @@
+import pickle
+import unittest
+
+from src.models.notes import Notes
+from src.models.record import Record
+
+
+class TestNotes(unittest.TestCase):
+    def setUp(self):
+        self.notes = Notes()
+        for text in ("one", "two", "three", "four", "five"):
+            self.notes.add(text)
+
+    def test_ids_are_never_reused(self):
+        del self.notes[5]
+        self.assertEqual(self.notes.add("six"), 6)
+        self.assertEqual(list(self.notes), [1, 2, 3, 4, 6])
+
+    def test_explicit_ids_keep_id_order(self):
+        notes = Notes([(4, "four"), (2, "two")])
+        notes[9] = "nine"
+        notes[3] = "three"
+        self.assertEqual(list(notes), [2, 3, 4, 9])
+        self.assertEqual(notes.add("ten"), 10)
+
+    def test_range(self):
+        del self.notes[3]
+        self.assertEqual(self.notes.range(2, 5), {2: "two", 4: "four"})
+        self.assertEqual(self.notes.range(0, 100), {1: "one", 2: "two", 4: "four", 5: "five"})
+        self.assertEqual(self.notes.range(6, 8), {})
+
+    def test_latest(self):
+        self.assertEqual(self.notes.latest(2), {4: "four", 5: "five"})
+        self.assertEqual(list(self.notes.latest(2)), [4, 5])
+        self.assertEqual(len(self.notes.latest(10)), 5)
+        self.assertEqual(self.notes.latest(0), {})
+
+    def test_pickle_keeps_counter(self):
+        del self.notes[5]
+        loaded = pickle.loads(pickle.dumps(self.notes))
+        self.assertIsInstance(loaded, Notes)
+        self.assertEqual(loaded, self.notes)
+        self.assertEqual(loaded.next_id, 6)
+
+
+class TestRecordNoteIds(unittest.TestCase):
+    def test_removed_newest_id_is_not_reused(self):
+        record = Record("John")
+        record.add_note("first")
+        record.add_note("second")
+        record.remove_note(2)
+        record.add_note("third")
+        self.assertEqual(list(record.notes), [1, 3])
+
+    def test_counter_survives_round_trips(self):
+        record = Record("John")
+        record.add_note("first")
+        record.add_note("second")
+        record.remove_note(2)
+
+        for loaded in (Record.from_dict(record.to_dict()), pickle.loads(pickle.dumps(record))):
+            with self.subTest(loaded=loaded):
+                loaded.add_note("third")
+                self.assertEqual(list(loaded.notes), [1, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
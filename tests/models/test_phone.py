@@ -1,7 +1,7 @@
 import unittest
 
 from src.models.record import Record
-from src.models.phone import Phone
+from src.models.phone import Phone, is_valid_phone_regex, normalize_phone
 
 
 class TestPhone(unittest.TestCase):
@@ -28,6 +28,17 @@ class TestPhone(unittest.TestCase):
         phone = Phone("(095) 432.54.44")
         self.assertEqual(phone.value, "0954325444")
 
+    def test_valid_with_unicode_spaces(self):
+        phone = Phone("095\u00a0432\u200254\u300044")
+        self.assertEqual(phone.value, "0954325444")
+
+    def test_normalize_phone(self):
+        self.assertEqual(normalize_phone(" +38 (095) 432-54-44 "), "380954325444")
+        self.assertIsNone(normalize_phone("++380954325444"))
+        self.assertIsNone(normalize_phone("0954+325444"))
+        self.assertTrue(is_valid_phone_regex("(095) 432.54.44"))
+        self.assertFalse(is_valid_phone_regex(954325444))
+
     # INVALID CASES
 
     def test_phone_must_be_string(self):
@@ -60,6 +71,13 @@ class TestPhone(unittest.TestCase):
             Phone("+-()")
         self.assertEqual(str(ctx.exception), "Invalid phone number format")
 
+    def test_invalid_format_non_ascii_digits(self):
+        for phone in ("05012345\u00b27", "\uff10\uff15\uff10\uff11\uff12\uff13\uff14\uff15\uff16\uff17"):
+            with self.subTest(phone=phone):
+                with self.assertRaises(ValueError) as ctx:
+                    Phone(phone)
+                self.assertEqual(str(ctx.exception), "Invalid phone number format")
+
     def test_invalid_format_too_many_digits(self):
         with self.assertRaises(ValueError) as ctx:
             Phone("+1234567890123456")
@@ -134,6 +152,10 @@ class TestEditPhone(unittest.TestCase):
         self.record.edit_phone("5555555555", "1111111111")
         self.assertEqual(len(self.record.phones), original_count)
 
+    def test_edit_phone_to_number_already_in_record(self):
+        self.record.edit_phone("1234567890", "9876543210")
+        self.assertEqual([phone.value for phone in self.record.phones], ["9876543210"])
+
     def test_edit_phone_invalid_new_phone_raises(self):
         with self.assertRaises(ValueError):
             self.record.edit_phone("1234567890", "abc")
@@ -0,0 +1,103 @@
+import unittest
+
+from src.models import AddressBook, Record
+from src.models.phone_index import PhoneIndex
+
+
+def make_record(name, *phones):
+    record = Record(name)
+    for phone in phones:
+        record.add_phone(phone)
+    return record
+
+
+class TestPhoneIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = PhoneIndex([
+            make_record("Mike", "0501234567", "0671119999"),
+            make_record("Kate", "0501234567"),
+            make_record("Anna", "0939994567"),
+        ])
+
+    def test_lookups(self):
+        self.assertEqual(self.index.exact("0501234567"), ["Kate", "Mike"])
+        self.assertEqual(self.index.exact("050123456"), [])
+        self.assertEqual(self.index.prefix("050"), ["Kate", "Mike"])
+        self.assertEqual(self.index.suffix("4567"), ["Kate", "Mike", "Anna"])
+        self.assertEqual(self.index.substring("9999"), ["Mike"])
+        self.assertEqual(self.index.substring("99"), ["Mike", "Anna"])
+        self.assertEqual(self.index.substring("12345"), ["Kate", "Mike"])
+        self.assertEqual(self.index.substring("55555"), [])
+
+    def test_remove_keeps_other_owners(self):
+        self.index.remove("0501234567", "Mike")
+        self.assertEqual(self.index.exact("0501234567"), ["Kate"])
+        self.index.remove("0501234567", "Kate")
+        self.assertEqual(self.index.substring("1234"), [])
+        self.assertEqual(self.index.prefix("05"), [])
+        self.assertEqual(len(self.index), 2)
+
+    def test_rebuild_after_many_removals(self):
+        for phone in ("0671119999", "0939994567"):
+            self.index.remove(phone, "Mike" if phone.startswith("067") else "Anna")
+        self.index.add("0931114567", "Anna")
+        self.assertEqual(self.index.substring("4567"), ["Kate", "Mike", "Anna"])
+        self.assertEqual(self.index.substring("9999"), [])
+
+
+class TestAddressBookPhoneSearch(unittest.TestCase):
+    def setUp(self):
+        self.address_book = AddressBook()
+        self.mike = make_record("Mike", "0501234567", "0501234568")
+        self.address_book.add_record(self.mike)
+        self.address_book.add_record(make_record("Kate", "0671234567"))
+
+    def names(self, keyword):
+        return [record.name.value for record in self.address_book.search(keyword)]
+
+    def test_each_record_is_returned_once(self):
+        self.assertEqual(self.names("050123456"), ["Mike"])
+        self.assertEqual(self.names("1234"), ["Mike", "Kate"])
+
+    def test_index_follows_phone_mutations(self):
+        self.assertEqual(self.names("0501234567"), ["Mike"])
+
+        self.mike.edit_phone("0501234567", "0939990000")
+        self.assertEqual(self.names("0501234567"), [])
+        self.assertEqual(self.names("9990000"), ["Mike"])
+
+        self.mike.remove_phone("0501234568")
+        self.assertEqual(self.names("050"), [])
+
+        self.mike.add_phone("0670000000")
+        self.assertEqual(self.names("067"), ["Mike", "Kate"])
+
+    def test_index_follows_records(self):
+        self.names("067")
+        self.address_book.add_record(make_record("Kate", "0931112233"))
+        self.assertEqual(self.names("067"), [])
+        self.assertEqual(self.names("2233"), ["Kate"])
+
+        self.address_book.delete("Mike")
+        self.assertEqual(self.names("050"), [])
+
+    def test_edit_to_number_already_in_record(self):
+        self.mike.edit_phone("0501234568", "0501234567")
+        self.assertEqual(self.names("0501234568"), [])
+        self.assertEqual(self.names("0501234567"), ["Mike"])
+
+        self.mike.remove_phone("0501234567")
+        self.assertEqual(self.names("0501234567"), [])
+
+    def test_find_by_phone(self):
+        self.address_book.add_record(make_record("Anna", "0671234567"))
+        owners = self.address_book.find_by_phone("(067) 123-45-67")
+        self.assertEqual([record.name.value for record in owners], ["Anna", "Kate"])
+        self.assertEqual(self.address_book.find_by_phone("067123456"), [])
+
+        self.address_book.find("Kate").remove_phone("0671234567")
+        self.assertEqual(self.address_book.find_by_phone("0671234567"), [self.address_book.find("Anna")])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+
+from src.models import AddressBook, Record
+from src.models.query import BirthdayFilter, NameFilter, PhoneFilter, Query, is_query
+
+
+class TestQuery(unittest.TestCase):
+    def setUp(self):
+        self.address_book = AddressBook()
+        contacts = [
+            ("Anna", "1234567890", "25.11.1990", "anna@corp.com", "Quarterly report", ["work"]),
+            ("Joanna", "1234500000", "02.11.1985", "jo@home.org", "Call mom", ["family"]),
+            ("Hannah", "5550001111", "25.11.1990", None, "Report draft", ["work", "urgent"]),
+            ("Bob", "5551234567", "01.05.1970", "bob@corp.com", "Meeting notes", ["work"]),
+        ]
+        for name, phone, birthday, email, note, tags in contacts:
+            record = Record(name)
+            record.add_phone(phone)
+            record.add_birthday(birthday)
+            if email:
+                record.add_email(email)
+            record.add_note(note)
+            record.add_tags_to_note(1, tags)
+            self.address_book.add_record(record)
+
+    def names(self, text):
+        return [record.name.value for record in self.address_book.query(text)]
+
+    def test_filters_are_combined(self):
+        self.assertEqual(self.names("name:ann tag:work"), ["Anna", "Hannah"])
+        self.assertEqual(self.names("name:ann tag:work bday:11 email:@corp.com"), ["Anna"])
+        self.assertEqual(self.names("bday:25.11"), ["Anna", "Hannah"])
+        self.assertEqual(self.names("bday:02.11.1985"), ["Joanna"])
+        self.assertEqual(self.names("phone:555 note:report"), ["Hannah"])
+        self.assertEqual(self.names('note:"call mom"'), ["Joanna"])
+        self.assertEqual(self.names("note:meet* tag:work"), ["Bob"])
+        self.assertEqual(self.names("tag:urgent email:corp"), [])
+
+    def test_words_without_field_are_guessed(self):
+        self.assertIsInstance(Query.parse("anna").filters[0], NameFilter)
+        self.assertIsInstance(Query.parse("555").filters[0], PhoneFilter)
+        self.assertIsInstance(Query.parse("25.11").filters[0], BirthdayFilter)
+        self.assertEqual(self.names("ann 12345"), ["Anna", "Joanna"])
+
+    def test_invalid_queries(self):
+        for text in ("colour:red", "name:", "bday:31.02", "bday:13", 'note:"open', "phone:abc"):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    self.address_book.query(text)
+
+    def test_is_query(self):
+        self.assertTrue(is_query("ann tag:work"))
+        self.assertFalse(is_query("ann"))
+        self.assertFalse(is_query("10:30"))
+
+    def test_plan_starts_from_most_selective_index(self):
+        _, steps = self.address_book.explain("email:corp tag:work name:hann")
+        self.assertEqual([(step.filter, step.method) for step in steps], [
+            ("name:hann", "index"),
+            ("tag:work", "check"),
+            ("email:corp", "check"),
+        ])
+        self.assertEqual([step.rows for step in steps], [1, 1, 0])
+
+        _, steps = self.address_book.explain("email:corp")
+        self.assertEqual([step.method for step in steps], ["scan"])
+
+    def test_results_follow_mutations(self):
+        self.assertEqual(self.names("tag:urgent"), ["Hannah"])
+        self.address_book.find("Bob").add_tags_to_note(1, ["urgent"])
+        self.address_book.delete("Hannah")
+        self.assertEqual(self.names("tag:urgent"), ["Bob"])
+
+
+if __name__ == "__main__":
+    unittest.main()
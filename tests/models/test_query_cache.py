@@ -0,0 +1,92 @@
+import unittest
+from datetime import date
+
+from src.models import AddressBook, Record
+from src.models.query_cache import QueryCache
+
+
+class TestQueryCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = QueryCache(maxsize=2)
+        self.calls = 0
+
+    def compute(self):
+        self.calls += 1
+        return self.calls
+
+    def test_hits_until_a_dependent_field_changes(self):
+        self.assertEqual(self.cache.get("a", ("phone",), self.compute), 1)
+        self.assertEqual(self.cache.get("a", ("phone",), self.compute), 1)
+
+        self.cache.invalidate("add_note")
+        self.assertEqual(self.cache.get("a", ("phone",), self.compute), 1)
+        self.cache.invalidate("edit_phone")
+        self.assertEqual(self.cache.get("a", ("phone",), self.compute), 2)
+        # Unknown operations, like adding a record, make every entry stale
+        self.cache.invalidate("add_record")
+        self.assertEqual(self.cache.get("a", ("phone",), self.compute), 3)
+
+        self.assertEqual(self.cache.info(), (2, 3, 1, 2))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.cache.get("a", (), self.compute)
+        self.cache.get("b", (), self.compute)
+        self.cache.get("a", (), self.compute)
+        self.cache.get("c", (), self.compute)
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.get("a", (), self.compute), 1)
+        self.assertEqual(self.cache.get("b", (), self.compute), 4)
+
+    def test_zero_size_disables_caching(self):
+        cache = QueryCache(maxsize=0)
+        cache.get("a", (), self.compute)
+        self.assertEqual(cache.get("a", (), self.compute), 2)
+        self.assertEqual(len(cache), 0)
+
+
+class TestAddressBookCache(unittest.TestCase):
+    def setUp(self):
+        self.address_book = AddressBook()
+        self.anna = Record("Anna")
+        self.anna.add_phone("1234567890")
+        self.anna.add_birthday("20.10.1990")
+        self.anna.add_note("Call about the report")
+        self.address_book.add_record(self.anna)
+
+    def names(self, records):
+        return [record.name.value for record in records]
+
+    def test_repeated_searches_hit(self):
+        for _ in range(3):
+            self.address_book.search("ANN")
+            self.address_book.search("ann")
+            self.address_book.search_notes("report")
+            self.address_book.query("name:ann phone:123")
+            self.address_book.get_upcoming_birthdays(7, date(2026, 10, 18))
+        hits, misses, size, _ = self.address_book.cache_info()
+        self.assertEqual((hits, misses, size), (11, 4, 4))
+
+    def test_only_dependent_results_are_recomputed(self):
+        self.address_book.search("555")
+        self.address_book.search_notes("report")
+        self.anna.add_phone("5550000000")
+        self.assertEqual(self.names(self.address_book.search("555")), ["Anna"])
+        self.assertEqual(self.address_book.cache_info().misses, 3)
+        self.address_book.search_notes("report")
+        self.assertEqual(self.address_book.cache_info().hits, 1)
+
+        self.anna.edit_note(1, "Send the invoice")
+        self.assertEqual(self.address_book.search_notes("report"), [])
+
+    def test_records_added_and_deleted(self):
+        self.assertEqual(self.names(self.address_book.search("ann")), ["Anna"])
+        self.address_book.add_record(Record("Hannah"))
+        self.assertEqual(self.names(self.address_book.search("ann")), ["Anna", "Hannah"])
+        self.address_book.delete("Anna")
+        self.assertEqual(self.names(self.address_book.query("name:ann")), ["Hannah"])
+        self.anna.add_phone("5551111111")
+        self.assertEqual(self.address_book.search("555"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+
+from src.models import AddressBook, Record
+from src.models.record_view import RecordView
+
+
+class TestRecordView(unittest.TestCase):
+    def setUp(self):
+        self.record = Record("John")
+        self.record.add_phone("1234567890")
+        self.record.add_note("Buy milk")
+        self.record.add_note("Call mom")
+        self.record.add_note("Milk delivery")
+        self.view = self.record.view([3, 1])
+
+    def test_shows_only_selected_notes(self):
+        self.assertEqual(self.view.name, "John")
+        self.assertEqual(list(self.view.notes), [3, 1])
+        self.assertEqual(len(self.view.notes), 2)
+        self.assertEqual(self.view.notes[1], "Buy milk")
+        with self.assertRaises(KeyError):
+            self.view.notes[2]
+
+        text = str(self.view)
+        self.assertIn("Milk delivery", text)
+        self.assertNotIn("Call mom", text)
+        self.assertEqual(text, self.record.show_info({3: self.record.notes[3], 1: self.record.notes[1]}))
+
+    def test_is_read_only(self):
+        with self.assertRaises(AttributeError):
+            self.view.notes = {}
+        with self.assertRaises(TypeError):
+            self.view.notes[2] = self.record.notes[2]
+        with self.assertRaises(AttributeError):
+            self.view.phones.append("5555555555")
+        with self.assertRaises(AttributeError):
+            self.view.notes[1].value = "Changed"
+        self.assertEqual(self.view.phones, ("1234567890",))
+        self.assertIsNone(self.view.email)
+        self.assertIsNone(self.view.birthday)
+        self.assertEqual(self.record.notes[1].value, "Buy milk")
+        self.assertEqual(len(self.record.notes), 3)
+        self.assertEqual(len(self.record.phones), 1)
+
+    def test_follows_record_changes(self):
+        self.record.remove_note(1)
+        self.record.add_phone("5555555555")
+        self.assertEqual(list(self.view.notes), [3])
+        self.assertEqual(len(self.view.phones), 2)
+
+    def test_note_search_returns_views(self):
+        book = AddressBook()
+        book.add_record(self.record)
+        result = book.get_records_by_note_keyword("milk")
+        self.assertIsInstance(result[0], RecordView)
+        self.assertIs(result[0].record, self.record)
+        self.assertEqual(sorted(result[0].notes), [1, 3])
+
+    def test_find_note_by_tag(self):
+        self.record.add_tags_to_note(2, ["family"])
+        text = self.record.find_note_by_tag("family")
+        self.assertIn("Call mom", text)
+        self.assertNotIn("Buy milk", text)
+
+
+if __name__ == "__main__":
+    unittest.main()
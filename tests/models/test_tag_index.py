@@ -0,0 +1,56 @@
+import unittest
+
+from src.models import AddressBook, Record
+
+
+class TestTagIndex(unittest.TestCase):
+    def setUp(self):
+        self.address_book = AddressBook()
+        self.john = Record("John")
+        self.john.add_note("Call mom")
+        self.john.add_note("Buy milk")
+        self.john.add_tags_to_note(1, ["home", "urgent"])
+        self.john.add_tags_to_note(2, ["home"])
+        self.address_book.add_record(self.john)
+
+    def test_notes_by_tag_and_counts(self):
+        kate = Record("Kate")
+        kate.add_note("Report")
+        self.address_book.add_record(kate)
+        self.assertEqual(self.address_book.notes_by_tag("urgent"), [("John", 1)])
+
+        kate.add_tags_to_note(1, ["urgent", "work"])
+        self.assertEqual(self.address_book.notes_by_tag("urgent"), [("John", 1), ("Kate", 1)])
+        self.assertEqual(self.address_book.tag_counts(), [("home", 2), ("urgent", 2), ("work", 1)])
+        self.assertEqual(self.address_book.notes_by_tag("missing"), [])
+
+    def test_index_follows_note_mutations(self):
+        self.address_book.tag_counts()
+
+        self.john.remove_tag_from_note(1, "urgent")
+        self.assertEqual(self.address_book.notes_by_tag("urgent"), [])
+
+        # Editing replaces the note together with its tags
+        self.john.edit_note(2, "Buy bread")
+        self.assertEqual(self.address_book.notes_by_tag("home"), [("John", 1)])
+
+        self.john.remove_note(1)
+        self.assertEqual(self.address_book.tag_counts(), [])
+
+    def test_index_follows_records(self):
+        self.address_book.tag_counts()
+        self.address_book.add_record(Record("John"))
+        self.assertEqual(self.address_book.tag_counts(), [])
+
+        kate = Record("Kate")
+        kate.add_note("Report")
+        kate.add_tags_to_note(1, ["work"])
+        self.address_book.add_record(kate)
+        self.assertEqual(self.address_book.notes_by_tag("work"), [("Kate", 1)])
+
+        self.address_book.delete("Kate")
+        self.assertEqual(self.address_book.notes_by_tag("work"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import gzip
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.models import AddressBook, Record
+from src.services.exporter import export_file
+from src.services.importer import import_file
+from src.storage import LazyStorage
+
+
+class TestExportFile(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.address_book = AddressBook()
+
+        record = Record("Mike, Jr.")
+        record.add_phone("0987654321")
+        record.add_phone("1234567890")
+        record.add_email("mike@example.com")
+        record.add_birthday("05.11.1997")
+        record.add_note("Buy milk; then call")
+        record.add_tags_to_note(1, ["home"])
+        self.address_book.add_record(record)
+
+        self.address_book.add_record(Record("Kate"))
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def path(self, name):
+        return str(Path(self.tmp_dir.name) / name)
+
+    def assert_round_trip(self, path):
+        report = export_file(self.address_book, path)
+        self.assertEqual(report.records, 2)
+
+        book = AddressBook()
+        import_report = import_file(book, path)
+        self.assertEqual(import_report.errors, [])
+        self.assertEqual(list(book.keys()), ["Mike, Jr.", "Kate"])
+        mike = book.find("Mike, Jr.")
+        self.assertEqual([p.value for p in mike.phones], ["0987654321", "1234567890"])
+        self.assertEqual(mike.email.value, "mike@example.com")
+        self.assertEqual(str(mike.birthday), "05.11.1997")
+
+    def test_csv_round_trip(self):
+        self.assert_round_trip(self.path("contacts.csv"))
+
+    def test_jsonl_round_trip(self):
+        self.assert_round_trip(self.path("contacts.jsonl"))
+
+    def test_vcard_round_trip(self):
+        self.assert_round_trip(self.path("contacts.vcf"))
+
+    def test_gzip_round_trip(self):
+        path = self.path("contacts.jsonl.gz")
+        self.assert_round_trip(path)
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            first = json.loads(f.readline())
+        self.assertEqual(first, self.address_book.find("Mike, Jr.").to_dict())
+
+    def test_vcard_contains_notes(self):
+        path = self.path("contacts.vcf")
+        export_file(self.address_book, path)
+        text = Path(path).read_bytes().decode("utf-8")
+        self.assertIn("FN:Mike\\, Jr.\r\n", text)
+        self.assertIn("NOTE:Buy milk\\; then call\r\n", text)
+        self.assertIn("BDAY:1997-11-05\r\n", text)
+
+    def test_export_keeps_lazy_book_bounded(self):
+        storage = LazyStorage(Path(self.tmp_dir.name) / "lazy", capacity=3)
+        book = storage.load()
+        for i in range(30):
+            book.add_record(Record(f"Contact {i}"))
+        storage.save(book)
+        storage.close()
+
+        storage = LazyStorage(Path(self.tmp_dir.name) / "lazy", capacity=3)
+        book = storage.load()
+        report = export_file(book, self.path("contacts.csv"))
+        self.assertEqual(report.records, 30)
+        self.assertLessEqual(book.data.resident_count, 3)
+        storage.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.models import AddressBook, Record
+from src.services import importer
+from src.services.importer import import_file
+
+
+class TestImportFile(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.address_book = AddressBook()
+        record = Record("Mike")
+        record.add_phone("1234567890")
+        self.address_book.add_record(record)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write(self, name, text):
+        path = Path(self.tmp_dir.name) / name
+        path.write_text(text, encoding="utf-8")
+        return str(path)
+
+    def test_import_csv_merges_by_name(self):
+        path = self.write(
+            "contacts.csv",
+            "Name,Phone,Email,Birthday\n"
+            "Mike,0987654321,mike@example.com,05.11.1997\n"
+            "Kate,+1111111111;(111) 111-1112,,\n",
+        )
+        report = import_file(self.address_book, path)
+
+        self.assertEqual((report.rows, report.added, report.updated), (2, 1, 1))
+        mike = self.address_book.find("Mike")
+        self.assertEqual([p.value for p in mike.phones], ["1234567890", "0987654321"])
+        self.assertEqual(mike.email.value, "mike@example.com")
+        self.assertEqual(str(mike.birthday), "05.11.1997")
+        kate = self.address_book.find("Kate")
+        self.assertEqual([p.value for p in kate.phones], ["1111111111", "1111111112"])
+
+    def test_import_csv_with_byte_order_mark(self):
+        path = self.write("contacts.csv", "\ufeffName,Phone\nKate,1111111111\n")
+        report = import_file(self.address_book, path)
+
+        self.assertEqual((report.rows, report.added, report.errors), (1, 1, []))
+        self.assertEqual([p.value for p in self.address_book.find("Kate").phones], ["1111111111"])
+
+    def test_import_reports_row_errors(self):
+        path = self.write(
+            "contacts.jsonl",
+            json.dumps({"name": "Kate", "phone": "111"}) + "\n"
+            + "{broken\n"
+            + json.dumps({"name": "Ann", "email": "not-an-email"}) + "\n"
+            + json.dumps({"phones": ["1111111111"]}) + "\n"
+            + json.dumps({"name": "Paul", "birthday": "31.02.1990"}) + "\n"
+            + json.dumps({"name": "Olga", "phones": ["2222222222"]}) + "\n",
+        )
+        report = import_file(self.address_book, path)
+
+        self.assertEqual(report.rows, 6)
+        self.assertEqual(report.added, 1)
+        self.assertEqual(
+            report.errors,
+            [
+                (1, "Invalid phone number format"),
+                (2, "Malformed row"),
+                (3, "Email is not valid"),
+                (4, "Name is required"),
+                (5, "Invalid date format. Use DD.MM.YYYY"),
+            ],
+        )
+        self.assertIsNone(self.address_book.find("Kate"))
+        self.assertIsNotNone(self.address_book.find("Olga"))
+
+    def test_import_jsonl_rejects_phones_that_are_not_a_list(self):
+        path = self.write(
+            "contacts.jsonl",
+            json.dumps({"name": "Kate", "phones": "1111111111"}) + "\n"
+            + json.dumps({"name": "Ann", "phone": 2222222222}) + "\n"
+            + json.dumps({"name": "Olga", "phones": [3333333333]}) + "\n",
+        )
+        report = import_file(self.address_book, path)
+
+        self.assertEqual(report.added, 0)
+        self.assertEqual(report.errors, [(line, "Phones must be a list of strings") for line in (1, 2, 3)])
+
+    def test_import_vcard(self):
+        path = self.write(
+            "contacts.vcf",
+            "BEGIN:VCARD\nVERSION:3.0\nFN:Kate\nTEL;TYPE=cell:+1111111111\n"
+            "item1.EMAIL:kate@example.com\nBDAY:1991-11-04\nEND:VCARD\n"
+            "BEGIN:VCARD\nVERSION:3.0\nFN:Ann\nTEL:12\nEND:VCARD\n",
+        )
+        report = import_file(self.address_book, path)
+
+        self.assertEqual(report.errors, [(8, "Invalid phone number format")])
+        kate = self.address_book.find("Kate")
+        self.assertEqual(kate.email.value, "kate@example.com")
+        self.assertEqual(str(kate.birthday), "04.11.1991")
+
+    def test_import_in_worker_processes(self):
+        lines = [json.dumps({"name": f"Contact {i}", "phones": [f"{1000000000 + i}"]}) for i in range(25)]
+        lines[7] = json.dumps({"name": "Broken", "phones": ["1"]})
+        path = self.write("contacts.jsonl", "\n".join(lines) + "\n")
+
+        with mock.patch.object(importer, "IMPORT_CHUNK_SIZE", 4):
+            report = import_file(self.address_book, path, workers=2)
+
+        self.assertEqual(report.added, 24)
+        self.assertEqual(report.errors, [(8, "Invalid phone number format")])
+        self.assertEqual(list(self.address_book.keys())[1:4], ["Contact 0", "Contact 1", "Contact 2"])
+
+    def test_import_marks_book_dirty(self):
+        self.address_book.mark_clean()
+        path = self.write("contacts.csv", "name,phone\nKate,1111111111\n")
+        import_file(self.address_book, path)
+        self.assertEqual(self.address_book.dirty_names(), {"Kate"})
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            import_file(self.address_book, self.write("contacts.txt", ""))
+
+
+if __name__ == "__main__":
+    unittest.main()
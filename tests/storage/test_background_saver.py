@@ -0,0 +1,156 @@
+import os
+import pickle
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from src.models import Record
+from src.storage import BackgroundSaver, PickleStorage
+
+
+class CountingPickleStorage(PickleStorage):
+    def __init__(self, path):
+        super().__init__(path, fsync=False)
+        self.writes = 0
+        self.written = threading.Event()
+
+    def write(self, data):
+        super().write(data)
+        self.writes += 1
+        self.written.set()
+
+
+class FailingPickleStorage(CountingPickleStorage):
+    def __init__(self, path, error):
+        super().__init__(path)
+        self.error = error
+        self.failed = threading.Event()
+
+    def write(self, data):
+        if self.error is not None:
+            self.failed.set()
+            raise self.error
+        super().write(data)
+
+
+class SlowPickleStorage(CountingPickleStorage):
+    def __init__(self, path):
+        super().__init__(path)
+        self.started = threading.Event()
+
+    def write(self, data):
+        self.started.set()
+        time.sleep(0.3)
+        super().write(data)
+
+
+class TestBackgroundSaver(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = str(Path(self.tmp_dir.name) / "address_book.pkl")
+        self.storage = CountingPickleStorage(self.path)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def read_names(self):
+        with open(self.path, "rb") as f:
+            return list(pickle.load(f).keys())
+
+    def test_burst_of_saves_is_written_once(self):
+        saver = BackgroundSaver(self.storage, delay=0.05)
+        book = saver.load()
+        for name in ("Mike", "Kate", "Paolinka"):
+            book.add_record(Record(name))
+            saver.save(book)
+
+        self.assertTrue(self.storage.written.wait(timeout=5))
+        time.sleep(0.1)
+        self.assertEqual(self.storage.writes, 1)
+        self.assertEqual(self.read_names(), ["Mike", "Kate", "Paolinka"])
+        saver.close()
+
+    def test_close_flushes_synchronously(self):
+        saver = BackgroundSaver(self.storage, delay=60)
+        book = saver.load()
+        book.add_record(Record("Mike"))
+        saver.save(book)
+        self.assertFalse(os.path.exists(self.path))
+
+        saver.close()
+        self.assertEqual(self.storage.writes, 1)
+        self.assertEqual(self.read_names(), ["Mike"])
+
+    def test_worker_waits_for_running_command(self):
+        saver = BackgroundSaver(self.storage, delay=0)
+        book = saver.load()
+        with saver.lock:
+            book.add_record(Record("Mike"))
+            saver.save(book)
+            time.sleep(0.05)
+            self.assertEqual(self.storage.writes, 0)
+            book.add_record(Record("Kate"))
+
+        self.assertTrue(self.storage.written.wait(timeout=5))
+        self.assertEqual(self.read_names(), ["Mike", "Kate"])
+        saver.close()
+
+    def test_atomic_write_leaves_no_temp_file(self):
+        saver = BackgroundSaver(self.storage, delay=60)
+        book = saver.load()
+        book.add_record(Record("Mike"))
+        saver.save(book)
+        saver.close()
+        self.assertEqual(os.listdir(self.tmp_dir.name), ["address_book.pkl"])
+
+    def test_failed_write_is_reported_and_kept_pending(self):
+        for error in (OSError(21, "Is a directory"), ValueError("bad phone")):
+            with self.subTest(error=error):
+                storage = FailingPickleStorage(self.path, error)
+                saver = BackgroundSaver(storage, delay=0)
+                book = saver.load()
+                book.add_record(Record("Mike"))
+                saver.save(book)
+
+                self.assertTrue(storage.failed.wait(timeout=5))
+                time.sleep(0.05)
+                self.assertIs(saver.take_error(), error)
+                self.assertIsNone(saver.take_error())
+                self.assertTrue(saver._worker.is_alive())
+
+                storage.error = None
+                saver.flush()
+                self.assertEqual(self.read_names(), ["Mike"])
+                saver.close()
+                os.remove(self.path)
+
+    def test_close_waits_for_write_in_progress(self):
+        storage = SlowPickleStorage(self.path)
+        saver = BackgroundSaver(storage, delay=0)
+        book = saver.load()
+        book.add_record(Record("Mike"))
+        saver.save(book)
+
+        self.assertTrue(storage.started.wait(timeout=5))
+        saver.close()
+        self.assertEqual(storage.writes, 1)
+        self.assertEqual(self.read_names(), ["Mike"])
+
+    def test_close_raises_when_final_write_fails(self):
+        storage = FailingPickleStorage(self.path, OSError(28, "No space left on device"))
+        saver = BackgroundSaver(storage, delay=60)
+        book = saver.load()
+        book.add_record(Record("Mike"))
+        saver.save(book)
+
+        with self.assertRaises(OSError):
+            saver.flush()
+        with self.assertRaises(OSError):
+            saver.close()
+        self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
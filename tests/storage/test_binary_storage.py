@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.models import Record
+from src.storage import BinaryStorage
+
+
+class TestBinaryStorage(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = str(Path(self.tmp_dir.name) / "address_book.bin")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_round_trip(self):
+        storage = BinaryStorage(self.path, fsync=False)
+        book = storage.load()
+        book.add_record(Record("Mike"))
+        storage.save(book)
+
+        storage = BinaryStorage(self.path, fsync=False)
+        self.assertEqual(list(storage.load().keys()), ["Mike"])
+        self.assertIsNone(storage.load_warning)
+
+    def test_damaged_file_is_moved_aside(self):
+        storage = BinaryStorage(self.path, fsync=False)
+        book = storage.load()
+        book.add_record(Record("Mike"))
+        storage.save(book)
+        with open(self.path, "rb") as f:
+            data = f.read()
+
+        for damaged in (data[:-3], b"JRVB\xff\xff" + data[6:], b"not a book"):
+            with self.subTest(damaged=damaged[:6]):
+                with open(self.path, "wb") as f:
+                    f.write(damaged)
+
+                storage = BinaryStorage(self.path, fsync=False)
+                self.assertEqual(len(storage.load()), 0)
+                self.assertIn("moved to", storage.load_warning)
+                self.assertFalse(os.path.exists(self.path))
+
+                moved = [name for name in os.listdir(self.tmp_dir.name) if ".damaged-" in name]
+                self.assertEqual(len(moved), 1)
+                with open(Path(self.tmp_dir.name) / moved[0], "rb") as f:
+                    self.assertEqual(f.read(), damaged)
+                os.remove(Path(self.tmp_dir.name) / moved[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
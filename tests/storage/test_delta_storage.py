@@ -0,0 +1,151 @@
+import json
+import pickle
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from src.models import AddressBook, Record
+from src.storage import DeltaStorage
+
+
+class TestDeltaStorage(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp_dir.name) / "delta"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def manifest(self):
+        return json.loads((self.folder / "manifest.json").read_text())
+
+    def populate(self, storage):
+        book = storage.load()
+        record = Record("Mike")
+        record.add_phone("1234567890")
+        record.add_note("Buy milk")
+        record.add_tags_to_note(1, ["home"])
+        book.add_record(record)
+        storage.save(book)
+
+        book.add_record(Record("Kate"))
+        book.find("Mike").edit_phone("1234567890", "0987654321")
+        storage.save(book)
+        book.delete("Kate")
+        storage.save(book)
+        return book
+
+    def assert_populated(self, book):
+        self.assertEqual(list(book.keys()), ["Mike"])
+        mike = book.find("Mike")
+        self.assertEqual([p.value for p in mike.phones], ["0987654321"])
+        self.assertEqual(mike.to_dict()["notes"], [{"id": 1, "text": "Buy milk", "tags": ["home"]}])
+
+    def test_saves_write_deltas_and_replay(self):
+        self.populate(DeltaStorage(self.folder, flush_interval=0))
+
+        manifest = self.manifest()
+        self.assertEqual(len(manifest["deltas"]), 3)
+        self.assertTrue(manifest["snapshot"].endswith(".xz"))
+        self.assertTrue(all(name.endswith(".z") for name in manifest["deltas"]))
+        self.assert_populated(DeltaStorage(self.folder).load())
+
+    def test_session_writes_one_delta(self):
+        storage = DeltaStorage(self.folder)
+        self.populate(storage)
+        self.assertEqual(self.manifest()["deltas"], [])
+
+        storage.close()
+        self.assertEqual(len(self.manifest()["deltas"]), 1)
+        self.assert_populated(DeltaStorage(self.folder).load())
+
+    def test_timer_writes_delta_after_flush_interval(self):
+        storage = DeltaStorage(self.folder, flush_interval=0.1)
+        book = storage.load()
+        book.add_record(Record("Mike"))
+        storage.save(book)
+        self.assertEqual(self.manifest()["deltas"], [])
+
+        time.sleep(0.5)
+        self.assertEqual(len(self.manifest()["deltas"]), 1)
+        self.assertEqual(list(DeltaStorage(self.folder).load().keys()), ["Mike"])
+        storage.close()
+
+    def test_save_without_changes_writes_nothing(self):
+        storage = DeltaStorage(self.folder)
+        book = storage.load()
+        storage.save(book)
+        self.assertEqual(self.manifest()["deltas"], [])
+
+    def test_compact_folds_deltas_into_snapshot(self):
+        storage = DeltaStorage(self.folder, flush_interval=0)
+        book = self.populate(storage)
+        old_files = {self.manifest()["snapshot"], *self.manifest()["deltas"]}
+
+        self.assertTrue(storage.compact(book))
+        storage.close()
+        manifest = self.manifest()
+        self.assertEqual(manifest["deltas"], [])
+        self.assertNotIn(manifest["snapshot"], old_files)
+        self.assertEqual(
+            sorted(p.name for p in self.folder.iterdir()), sorted([manifest["snapshot"], "manifest.json"])
+        )
+        self.assert_populated(DeltaStorage(self.folder).load())
+
+    def test_compacts_after_too_many_deltas(self):
+        storage = DeltaStorage(self.folder, max_deltas=2, flush_interval=0)
+        book = storage.load()
+        for name in ("Mike", "Kate", "Anna"):
+            book.add_record(Record(name))
+            storage.save(book)
+        storage.close()
+
+        self.assertEqual(self.manifest()["deltas"], [])
+        self.assertEqual(list(DeltaStorage(self.folder).load().keys()), ["Mike", "Kate", "Anna"])
+
+    def test_deltas_written_during_compaction_are_kept(self):
+        storage = DeltaStorage(self.folder, flush_interval=0)
+        book = self.populate(storage)
+
+        storage.compact(book)
+        book.add_record(Record("Anna"))
+        storage.save(book)
+        storage.close()
+
+        self.assertEqual(list(DeltaStorage(self.folder).load().keys()), ["Mike", "Anna"])
+
+    def test_unlisted_delta_is_ignored(self):
+        storage = DeltaStorage(self.folder)
+        book = storage.load()
+        book.add_record(Record("Mike"))
+        storage.close()
+        # Leftover of a save interrupted before the manifest was replaced
+        (self.folder / "delta.000099.z").write_bytes(b"garbage")
+
+        self.assertEqual(list(DeltaStorage(self.folder).load().keys()), ["Mike"])
+
+    def test_zlib_snapshot(self):
+        storage = DeltaStorage(self.folder, snapshot_compression=".z")
+        self.populate(storage)
+        storage.close()
+        self.assertTrue(self.manifest()["snapshot"].endswith(".z"))
+        self.assert_populated(DeltaStorage(self.folder).load())
+
+    def test_unknown_compression(self):
+        with self.assertRaises(ValueError):
+            DeltaStorage(self.folder, delta_compression=".bz2")
+
+    def test_imports_legacy_pickle(self):
+        legacy_path = Path(self.tmp_dir.name) / "address_book.pkl"
+        legacy = AddressBook()
+        legacy.add_record(Record("Mike"))
+        legacy_path.write_bytes(pickle.dumps(legacy))
+
+        book = DeltaStorage(self.folder, legacy_path=str(legacy_path)).load()
+        self.assertEqual(list(book.keys()), ["Mike"])
+        self.assertEqual(list(DeltaStorage(self.folder).load().keys()), ["Mike"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.models import AddressBook, Record
+from src.storage import JournalStorage
+
+
+class TestJournalStorage(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp_dir.name) / "journal"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def fill_book(self, book):
+        record = Record("Mike")
+        record.add_phone("1234567890")
+        book.add_record(record)
+        record.add_birthday("05.11.1997")
+        record.add_email("mike@example.com")
+        record.add_note("Buy milk")
+        record.add_note("Call mom")
+        record.add_tags_to_note(1, ["home", "urgent"])
+        record.remove_tag_from_note(1, "home")
+        record.edit_phone("1234567890", "0987654321")
+        record.remove_note(2)
+
+        other = Record("Kate")
+        other.add_phone("1111111111")
+        book.add_record(other)
+        book.delete("Kate")
+
+    def assert_mike(self, book):
+        self.assertEqual(list(book.keys()), ["Mike"])
+        mike = book.find("Mike")
+        self.assertEqual([p.value for p in mike.phones], ["0987654321"])
+        self.assertEqual(str(mike.birthday), "05.11.1997")
+        self.assertEqual(mike.email.value, "mike@example.com")
+        self.assertEqual(list(mike.notes), [1])
+        self.assertEqual([t.value for t in mike.notes[1].get_tags()], ["urgent"])
+
+    def test_replays_journal_on_load(self):
+        storage = JournalStorage(self.folder)
+        book = storage.load()
+        self.fill_book(book)
+        storage.save(book)
+        storage.close()
+
+        self.assertFalse((self.folder / "snapshot.pkl").exists())
+
+        storage = JournalStorage(self.folder)
+        self.assert_mike(storage.load())
+        storage.close()
+
+    def test_mutations_after_reload_are_journaled(self):
+        storage = JournalStorage(self.folder)
+        self.fill_book(storage.load())
+        storage.close()
+
+        storage = JournalStorage(self.folder)
+        storage.load().find("Mike").add_phone("5555555555")
+        storage.close()
+
+        storage = JournalStorage(self.folder)
+        phones = [p.value for p in storage.load().find("Mike").phones]
+        storage.close()
+        self.assertEqual(phones, ["0987654321", "5555555555"])
+
+    def test_compaction_folds_journal_into_snapshot(self):
+        storage = JournalStorage(self.folder, compact_threshold=1)
+        book = storage.load()
+        self.fill_book(book)
+        storage.save(book)
+        book.find("Mike").add_phone("5555555555")
+        storage.close()
+
+        self.assertTrue((self.folder / "snapshot.pkl").exists())
+        segments = sorted(p.name for p in self.folder.glob("journal.*.log"))
+        self.assertEqual(segments, ["journal.000002.log"])
+
+        storage = JournalStorage(self.folder)
+        book = storage.load()
+        storage.close()
+        self.assertEqual(len(book.find("Mike").phones), 2)
+
+    def test_imports_legacy_pickle(self):
+        legacy_path = Path(self.tmp_dir.name) / "address_book.pkl"
+        book = AddressBook()
+        book.add_record(Record("Legacy"))
+        with open(legacy_path, "wb") as f:
+            pickle.dump(book, f)
+
+        storage = JournalStorage(self.folder, legacy_path=str(legacy_path))
+        self.assertIsNotNone(storage.load().find("Legacy"))
+        storage.close()
+
+    def test_torn_last_line_is_ignored(self):
+        storage = JournalStorage(self.folder)
+        self.fill_book(storage.load())
+        storage.close()
+
+        segment = next(self.folder.glob("journal.*.log"))
+        with open(segment, "a", encoding="utf-8") as f:
+            f.write('{"op": "add_phone", "na')
+
+        storage = JournalStorage(self.folder)
+        self.assert_mike(storage.load())
+        storage.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
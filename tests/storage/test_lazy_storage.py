@@ -0,0 +1,157 @@
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.models import AddressBook, Record
+from src.storage import LazyStorage
+from src.storage import lazy_storage
+
+
+class TestLazyStorage(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.folder = Path(self.tmp_dir.name) / "lazy"
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def create_book(self, count=20, capacity=5):
+        storage = LazyStorage(self.folder, capacity=capacity)
+        book = storage.load()
+        for i in range(count):
+            record = Record(f"Contact {i:02d}")
+            record.add_phone(f"{1000000000 + i}")
+            book.add_record(record)
+        storage.save(book)
+        storage.close()
+
+    def test_startup_loads_no_records(self):
+        self.create_book()
+        storage = LazyStorage(self.folder, capacity=5)
+        book = storage.load()
+        self.assertEqual(len(book), 20)
+        self.assertEqual(book.data.resident_count, 0)
+        self.assertIn("Contact 03", book)
+        self.assertEqual(book.data.resident_count, 0)
+        storage.close()
+
+    def test_records_load_on_demand_within_lru_bound(self):
+        self.create_book()
+        storage = LazyStorage(self.folder, capacity=5)
+        book = storage.load()
+
+        self.assertEqual(book.find("Contact 07").phones[0].value, "1000000007")
+        self.assertEqual(book.data.resident_count, 1)
+
+        self.assertEqual(len(book.search("1000")), 20)
+        self.assertEqual(book.data.resident_count, 5)
+        storage.close()
+
+    def test_name_search_loads_only_matches(self):
+        self.create_book()
+        storage = LazyStorage(self.folder, capacity=5)
+        book = storage.load()
+        self.assertEqual(len(book.search("Contact 1")), 10)
+        self.assertEqual(book.data.resident_count, 5)
+        self.assertEqual(len(book.search("contact 05")), 1)
+        storage.close()
+
+    def test_changed_records_survive_eviction(self):
+        self.create_book()
+        storage = LazyStorage(self.folder, capacity=2)
+        book = storage.load()
+        book.find("Contact 00").add_note("Keep me")
+        for record in book.values():
+            str(record)
+        book.delete("Contact 01")
+        book.add_record(Record("New"))
+        storage.save(book)
+        storage.close()
+
+        storage = LazyStorage(self.folder, capacity=2)
+        book = storage.load()
+        self.assertEqual(len(book), 20)
+        self.assertIsNone(book.find("Contact 01"))
+        self.assertIsNotNone(book.find("New"))
+        self.assertEqual(book.find("Contact 00").notes[1].value, "Keep me")
+        storage.close()
+
+    def test_failed_save_keeps_changes_for_the_next_one(self):
+        self.create_book(count=3)
+        storage = LazyStorage(self.folder, capacity=1)
+        book = storage.load()
+        book.find("Contact 00").add_phone("5555555555")
+        book.add_record(Record("Mike"))
+        book.delete("Contact 01")
+
+        for failing_call in (1, 2):
+            with self.subTest(failing_call=failing_call):
+                calls = []
+
+                def sync(f):
+                    calls.append(f)
+                    if len(calls) == failing_call:
+                        raise OSError(28, "No space left on device")
+                    LazyStorage._sync(f)
+
+                with mock.patch.object(storage, "_sync", sync):
+                    with self.assertRaises(OSError):
+                        storage.save(book)
+                self.assertEqual(book.data.resident_count, 2)
+
+        storage.save(book)
+        storage.close()
+
+        book = LazyStorage(self.folder).load()
+        self.assertEqual(sorted(book.keys()), ["Contact 00", "Contact 02", "Mike"])
+        self.assertEqual([p.value for p in book.find("Contact 00").phones], ["1000000000", "5555555555"])
+
+    def test_compaction_keeps_live_records(self):
+        self.create_book()
+        storage = LazyStorage(self.folder, capacity=5)
+        book = storage.load()
+        old_minimum = lazy_storage.COMPACT_MIN_DEAD_BYTES
+        lazy_storage.COMPACT_MIN_DEAD_BYTES = 0
+        try:
+            for i in range(15):
+                book.delete(f"Contact {i:02d}")
+            storage.save(book)
+        finally:
+            lazy_storage.COMPACT_MIN_DEAD_BYTES = old_minimum
+        storage.close()
+
+        self.assertEqual([p.name for p in self.folder.glob("records.*.dat")], ["records.2.dat"])
+        storage = LazyStorage(self.folder)
+        book = storage.load()
+        self.assertEqual(len(book), 5)
+        self.assertEqual(book.find("Contact 19").phones[0].value, "1000000019")
+        storage.close()
+
+    def test_compact_command_reports_success(self):
+        self.create_book()
+        storage = LazyStorage(self.folder)
+        book = storage.load()
+        self.assertTrue(storage.compact(book))
+        self.assertEqual([p.name for p in self.folder.glob("records.*.dat")], ["records.2.dat"])
+        storage.close()
+
+    def test_imports_legacy_pickle(self):
+        legacy_path = Path(self.tmp_dir.name) / "address_book.pkl"
+        legacy_book = AddressBook()
+        legacy_book.add_record(Record("Legacy"))
+        with open(legacy_path, "wb") as f:
+            pickle.dump(legacy_book, f)
+
+        storage = LazyStorage(self.folder, legacy_path=str(legacy_path))
+        storage.load()
+        storage.close()
+
+        storage = LazyStorage(self.folder)
+        self.assertIsNotNone(storage.load().find("Legacy"))
+        storage.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+import multiprocessing
+import os
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.models import Record
+from src.storage import SharedPickleStorage
+
+
+def add_contacts(path, prefix, count):
+    storage = SharedPickleStorage(path, fsync=False)
+    book = storage.load()
+    for i in range(count):
+        book.add_record(Record(f"{prefix} {i}"))
+        storage.save(book)
+
+
+class TestSharedPickleStorage(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = str(Path(self.tmp_dir.name) / "address_book.pkl")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def session(self, **kwargs):
+        storage = SharedPickleStorage(self.path, fsync=False, **kwargs)
+        return storage, storage.load()
+
+    def test_saves_of_two_sessions_are_merged(self):
+        first, first_book = self.session()
+        second, second_book = self.session()
+
+        first_book.add_record(Record("Mike"))
+        first.save(first_book)
+        second_book.add_record(Record("Kate"))
+        second.save(second_book)
+
+        _, book = self.session()
+        self.assertEqual(sorted(book.keys()), ["Kate", "Mike"])
+        self.assertEqual(sorted(second_book.keys()), ["Kate", "Mike"])
+
+    def test_failed_save_is_written_by_the_next_one(self):
+        storage, book = self.session()
+        book.add_record(Record("Mike"))
+        os.mkdir(f"{self.path}.tmp")
+        with self.assertRaises(OSError):
+            storage.save(book)
+        os.rmdir(f"{self.path}.tmp")
+
+        storage.save(book)
+        with open(self.path, "rb") as f:
+            self.assertEqual(list(pickle.load(f).keys()), ["Mike"])
+
+    def test_refresh_picks_up_other_session_changes(self):
+        first, first_book = self.session()
+        second, second_book = self.session()
+        self.assertEqual(second.refresh(second_book), (set(), set()))
+
+        record = Record("Mike")
+        record.add_phone("1234567890")
+        first_book.add_record(record)
+        first.save(first_book)
+
+        updated, conflicts = second.refresh(second_book)
+        self.assertEqual((updated, conflicts), ({"Mike"}, set()))
+        self.assertEqual(second_book.find("Mike").phones[0].value, "1234567890")
+        self.assertFalse(second_book.is_dirty)
+
+        first_book.delete("Mike")
+        first.save(first_book)
+        self.assertEqual(second.refresh(second_book), ({"Mike"}, set()))
+        self.assertIsNone(second_book.find("Mike"))
+
+    def test_conflicting_change_keeps_last_saved_version(self):
+        first, first_book = self.session()
+        first_book.add_record(Record("Mike"))
+        first.save(first_book)
+        second, second_book = self.session()
+
+        first_book.find("Mike").add_phone("1111111111")
+        first.save(first_book)
+        second_book.find("Mike").add_phone("2222222222")
+
+        self.assertEqual(second.refresh(second_book), (set(), {"Mike"}))
+        second.save(second_book)
+        first.refresh(first_book)
+
+        _, book = self.session()
+        for mike in (book.find("Mike"), first_book.find("Mike")):
+            self.assertEqual([p.value for p in mike.phones], ["2222222222"])
+
+    def test_stale_session_reloads_after_log_rotation(self):
+        first, first_book = self.session(log_rotate_size=1)
+        second, second_book = self.session()
+
+        for name in ("Mike", "Kate", "Anna"):
+            first_book.add_record(Record(name))
+            first.save(first_book)
+
+        updated, _ = second.refresh(second_book)
+        self.assertEqual(updated, {"Mike", "Kate", "Anna"})
+        self.assertEqual(second.generation, first.generation)
+
+    def test_log_replays_change_missing_from_pickle(self):
+        storage, book = self.session()
+        book.add_record(Record("Kate"))
+        storage.save(book)
+        stale = Path(self.path).read_bytes()
+
+        book.add_record(Record("Mike"))
+        storage.save(book)
+        # Crash after appending to the log but before the pickle was replaced
+        Path(self.path).write_bytes(stale)
+
+        _, book = self.session()
+        self.assertEqual(sorted(book.keys()), ["Kate", "Mike"])
+
+    def test_concurrent_processes_do_not_lose_contacts(self):
+        processes = [
+            multiprocessing.Process(target=add_contacts, args=(self.path, prefix, 20))
+            for prefix in ("First", "Second")
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            self.assertEqual(process.exitcode, 0)
+
+        _, book = self.session()
+        self.assertEqual(len(book), 40)
+
+
+if __name__ == "__main__":
+    unittest.main()
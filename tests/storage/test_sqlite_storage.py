@@ -0,0 +1,169 @@
+import pickle
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.models import AddressBook, Record
+from src.storage import SqliteStorage
+
+
+class TestSqliteStorage(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = str(Path(self.tmp_dir.name) / "address_book.sqlite3")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def reload(self, storage):
+        storage.close()
+        storage = SqliteStorage(self.path)
+        return storage, storage.load()
+
+    def test_mutations_are_written_row_by_row(self):
+        storage = SqliteStorage(self.path)
+        book = storage.load()
+        record = Record("Mike")
+        record.add_phone("1234567890")
+        book.add_record(record)
+        record.add_phone("5555555555")
+        record.edit_phone("1234567890", "0987654321")
+        record.add_birthday("05.11.1997")
+        record.add_email("mike@example.com")
+        record.add_note("Buy milk")
+        record.add_note("Call mom")
+        record.add_tags_to_note(1, ["home", "urgent"])
+        record.remove_tag_from_note(1, "home")
+        record.remove_note(2)
+        book.add_record(Record("Kate"))
+        book.delete("Kate")
+
+        storage, book = self.reload(storage)
+        self.assertEqual(list(book.keys()), ["Mike"])
+        mike = book.find("Mike")
+        self.assertEqual([p.value for p in mike.phones], ["0987654321", "5555555555"])
+        self.assertEqual(str(mike.birthday), "05.11.1997")
+        self.assertEqual(mike.email.value, "mike@example.com")
+        self.assertEqual(list(mike.notes), [1])
+        self.assertEqual([t.value for t in mike.notes[1].get_tags()], ["urgent"])
+        self.assertEqual(mike.notes.next_id, 3)
+        storage.close()
+
+    def test_upgrades_databases_without_note_counter(self):
+        conn = sqlite3.connect(self.path)
+        conn.executescript(
+            "CREATE TABLE records (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);"
+            "CREATE TABLE notes (record_id INTEGER NOT NULL, note_id INTEGER NOT NULL, text TEXT NOT NULL,"
+            " PRIMARY KEY (record_id, note_id));"
+            "INSERT INTO records (id, name) VALUES (1, 'Mike');"
+            "INSERT INTO notes VALUES (1, 4, 'Buy milk');"
+            "PRAGMA user_version = 1;"
+        )
+        conn.close()
+
+        storage = SqliteStorage(self.path)
+        book = storage.load()
+        mike = book.find("Mike")
+        self.assertEqual(mike.notes.next_id, 5)
+        mike.remove_note(4)
+        mike.add_note("Call mom")
+
+        storage, book = self.reload(storage)
+        self.assertEqual(list(book.find("Mike").notes), [5])
+        self.assertEqual(book.find("Mike").notes.next_id, 6)
+        storage.close()
+
+    def test_delete_cascades_to_child_tables(self):
+        storage = SqliteStorage(self.path)
+        book = storage.load()
+        record = Record("Mike")
+        book.add_record(record)
+        record.add_phone("1234567890")
+        record.add_note("Buy milk")
+        record.add_tags_to_note(1, ["home"])
+        book.delete("Mike")
+        storage.close()
+
+        conn = sqlite3.connect(self.path)
+        for table in ("records", "phones", "notes", "tags"):
+            count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            self.assertEqual(count, 0, table)
+        conn.close()
+
+    def test_edit_to_existing_phone_matches_after_reload(self):
+        storage = SqliteStorage(self.path)
+        book = storage.load()
+        record = Record("Mike")
+        book.add_record(record)
+        record.add_phone("1234567890")
+        record.add_phone("5555555555")
+        record.edit_phone("5555555555", "1234567890")
+
+        storage, book = self.reload(storage)
+        self.assertEqual([p.value for p in book.find("Mike").phones], ["1234567890"])
+        book.find("Mike").remove_phone("1234567890")
+
+        storage, book = self.reload(storage)
+        self.assertEqual(book.find("Mike").phones, [])
+        storage.close()
+
+    def test_repeated_tags_are_stored_once(self):
+        storage = SqliteStorage(self.path)
+        book = storage.load()
+        record = Record("Mike")
+        book.add_record(record)
+        record.add_note("Buy milk")
+        record.add_tags_to_note(1, ["home", "home", "urgent"])
+        record.add_tags_to_note(1, ["urgent", "shop"])
+        storage.close()
+
+        conn = sqlite3.connect(self.path)
+        tags = conn.execute("SELECT tag FROM tags ORDER BY rowid").fetchall()
+        self.assertEqual(tags, [("home",), ("urgent",), ("shop",)])
+        conn.close()
+
+        storage, book = self.reload(storage)
+        book.find("Mike").remove_tag_from_note(1, "home")
+        storage, book = self.reload(storage)
+        self.assertEqual(book.find("Mike").notes[1].tag_values(), ["shop", "urgent"])
+        storage.close()
+
+    def test_edit_note_drops_tags(self):
+        storage = SqliteStorage(self.path)
+        book = storage.load()
+        record = Record("Mike")
+        book.add_record(record)
+        record.add_note("Buy milk")
+        record.add_tags_to_note(1, ["home"])
+        record.edit_note(1, "Buy bread")
+
+        storage, book = self.reload(storage)
+        note = book.find("Mike").notes[1]
+        self.assertEqual(note.value, "Buy bread")
+        self.assertEqual(note.get_tags(), [])
+        storage.close()
+
+    def test_imports_legacy_pickle_once(self):
+        legacy_path = Path(self.tmp_dir.name) / "address_book.pkl"
+        legacy_book = AddressBook()
+        record = Record("Legacy")
+        record.add_phone("1234567890")
+        record.add_note("Old note")
+        legacy_book.add_record(record)
+        with open(legacy_path, "wb") as f:
+            pickle.dump(legacy_book, f)
+
+        storage = SqliteStorage(self.path, legacy_path=str(legacy_path))
+        book = storage.load()
+        self.assertEqual(book.find("Legacy").notes[1].value, "Old note")
+        book.delete("Legacy")
+        storage.close()
+
+        storage = SqliteStorage(self.path, legacy_path=str(legacy_path))
+        self.assertEqual(len(storage.load()), 0)
+        storage.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
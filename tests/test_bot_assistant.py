@@ -0,0 +1,143 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.constants import DUPLICATE_PHONE_ENV
+from src.models import AddressBook, Record
+from src.storage import LazyStorage
+
+# Importing the bot opens the storage in the home folder, point it at a temporary one
+_home = tempfile.TemporaryDirectory()
+with mock.patch.dict(os.environ, {"HOME": _home.name}):
+    from src.bot_assistant import add_contact, change_contact, explain_query, get_upcoming_birthdays, who_owns
+
+
+def make_book() -> AddressBook:
+    book = AddressBook()
+    for name, phone in (("Mike", "1234567890"), ("Kate", "5555555555")):
+        record = Record(name)
+        record.add_phone(phone)
+        book.add_record(record)
+    return book
+
+
+class TestDuplicatePhones(unittest.TestCase):
+    def policy(self, policy: str):
+        return mock.patch.dict(os.environ, {DUPLICATE_PHONE_ENV: policy})
+
+    def test_warn_adds_the_phone(self):
+        book = make_book()
+        with self.policy("warn"):
+            message = add_contact(["Anna", "123-456-7890"], book)
+
+        self.assertIn("Contact for Anna is added", message)
+        self.assertIn("WARNING", message)
+        self.assertIn("already belongs to Mike", message)
+        self.assertEqual([p.value for p in book.find("Anna").phones], ["1234567890"])
+
+    def test_reject_keeps_the_book_unchanged(self):
+        book = make_book()
+        with self.policy("reject"):
+            message = add_contact(["Anna", "1234567890"], book)
+            self.assertIn("already belongs to Mike", message)
+            self.assertIsNone(book.find("Anna"))
+
+            message = change_contact(["Kate", "5555555555", "1234567890"], book)
+            self.assertIn("already belongs to Mike", message)
+            self.assertEqual([p.value for p in book.find("Kate").phones], ["5555555555"])
+
+    def test_allow_and_own_phone_are_silent(self):
+        book = make_book()
+        with self.policy("allow"):
+            self.assertNotIn("WARNING", add_contact(["Anna", "1234567890"], book))
+        with self.policy("reject"):
+            self.assertNotIn("ERROR", add_contact(["Mike", "1234567890"], book))
+
+    def test_change_warns_about_new_owner(self):
+        book = make_book()
+        with self.policy("warn"):
+            message = change_contact(["Kate", "5555555555", "1234567890"], book)
+
+        self.assertIn("already belongs to Mike", message)
+        self.assertEqual([p.value for p in book.find("Kate").phones], ["1234567890"])
+
+    def test_change_of_missing_phone_is_not_checked(self):
+        book = make_book()
+        with self.policy("reject"):
+            message = change_contact(["Kate", "9999999999", "1234567890"], book)
+
+        self.assertNotIn("already belongs", message)
+        self.assertEqual([p.value for p in book.find("Kate").phones], ["5555555555"])
+
+    def test_invalid_phone_does_not_build_the_index(self):
+        book = make_book()
+        with self.policy("reject"):
+            message = add_contact(["Mike", "12345"], book)
+
+        self.assertNotIn("already belongs", message)
+        self.assertIsNone(book._phone_index)
+
+    def test_warn_does_not_load_a_lazy_book(self):
+        with tempfile.TemporaryDirectory() as folder:
+            storage = LazyStorage(folder)
+            book = storage.load()
+            for i in range(20):
+                record = Record(f"Contact {i}")
+                record.add_phone(f"10000000{i:02d}")
+                book.add_record(record)
+            storage.save(book)
+            storage.close()
+
+            storage = LazyStorage(folder)
+            book = storage.load()
+            with self.policy("warn"):
+                message = add_contact(["Anna", "1000000001"], book)
+            self.assertNotIn("WARNING", message)
+            self.assertEqual(book.data.resident_count, 1)
+
+            with self.policy("reject"):
+                message = add_contact(["Bob", "1000000002"], book)
+            self.assertIn("already belongs to Contact 2", message)
+            storage.close()
+
+
+class TestWhoOwns(unittest.TestCase):
+    def test_lists_owners(self):
+        book = make_book()
+        book.find("Kate").add_phone("1234567890")
+
+        message = who_owns(["(123) 456-7890"], book)
+        self.assertIn("Mike", message)
+        self.assertIn("Kate", message)
+
+    def test_unknown_phone(self):
+        self.assertIn("Nobody has phone number", who_owns(["0000000000"], make_book()))
+
+    def test_missing_argument(self):
+        self.assertIn("Please provide phone number", who_owns([], make_book()))
+
+
+class TestExplainQuery(unittest.TestCase):
+    def test_shows_plan(self):
+        message = explain_query(["name:mike"], make_book())
+        self.assertIn("1 contact(s) found", message)
+
+    def test_missing_query(self):
+        self.assertIn("Please provide query", explain_query([], make_book()))
+
+
+class TestUpcomingBirthdays(unittest.TestCase):
+    def test_accepts_up_to_a_year(self):
+        for days in ("0", "7", "366"):
+            with self.subTest(days=days):
+                self.assertIn(f"Next {days} days birthdays", get_upcoming_birthdays([days], make_book()))
+
+    def test_rejects_out_of_range_days(self):
+        for days in ("367", "99999999", "-1", "x", "\u0663"):
+            with self.subTest(days=days):
+                self.assertIn("from 0 to 366", get_upcoming_birthdays([days], make_book()))
+
+
+if __name__ == "__main__":
+    unittest.main()
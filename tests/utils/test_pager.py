@@ -0,0 +1,48 @@
+import unittest
+
+from src.utils.pager import Page, parse_page_args
+
+
+class TestParsePageArgs(unittest.TestCase):
+    def test_options_are_split_off(self):
+        self.assertEqual(parse_page_args(["ann", "--limit", "5", "--offset=10"]), (["ann"], 5, 10))
+        self.assertEqual(parse_page_args(["name:ann", "tag:work"]), (["name:ann", "tag:work"], 20, 0))
+
+    def test_invalid_values(self):
+        for args in (["--limit"], ["--limit", "x"], ["--offset=-1"], ["--limit", "0"]):
+            with self.subTest(args=args):
+                with self.assertRaises(ValueError):
+                    parse_page_args(args)
+
+
+class TestPage(unittest.TestCase):
+    def test_renders_only_the_page(self):
+        rendered = []
+
+        def render(item):
+            rendered.append(item)
+            return str(item)
+
+        page = Page(iter(range(1_000_000)), 10, 3, render, header="Numbers:")
+        self.assertEqual(list(page), ["Numbers:", "10", "11", "12"])
+        self.assertEqual(rendered, [10, 11, 12])
+        self.assertEqual(page.next_offset, 13)
+        self.assertEqual(page.summary(), "Shown 11-13")
+
+    def test_last_page(self):
+        page = Page(["a", "b", "c"], 2, 5, total=3)
+        self.assertEqual(list(page), ["c"])
+        self.assertIsNone(page.next_offset)
+        self.assertEqual(page.summary(), "Shown 3 of 3")
+
+        page = Page(["a", "b"], 0, 2, total=2)
+        self.assertEqual(list(page), ["a", "b"])
+        self.assertIsNone(page.next_offset)
+
+        page = Page(["a"], 5, 2)
+        self.assertEqual(list(page), [])
+        self.assertEqual(page.summary(), "Nothing to show from offset 5")
+
+
+if __name__ == "__main__":
+    unittest.main()